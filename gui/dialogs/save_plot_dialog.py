@@ -2,9 +2,10 @@
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox,
-    QComboBox, QPushButton, QMessageBox
+    QComboBox, QPushButton, QMessageBox, QCheckBox
 )
 from gui.dialogs.latex_compatibility_dialog import LaTeXCompatibilityDialog  # Ensure this import exists
+from plots.export import DEFAULT_RASTERIZE_THRESHOLD, DEFAULT_RASTER_DPI
 from PyQt5.QtCore import Qt
 
 class SavePlotDialog(QDialog):
@@ -42,6 +43,35 @@ class SavePlotDialog(QDialog):
         self.quality_combo.setCurrentText("Medium")
         quality_layout.addWidget(self.quality_combo)
         layout.addLayout(quality_layout)
+
+        # Vector formats (PDF/SVG/EPS): dense data is embedded as an image, the rest stays vector
+        self.rasterize_checkbox = QCheckBox("Rasterize dense data in PDF/SVG/EPS")
+        self.rasterize_checkbox.setChecked(True)
+        self.rasterize_checkbox.setToolTip("Lines and markers with many points are embedded as an image; axes, text and annotations stay vector.")
+        layout.addWidget(self.rasterize_checkbox)
+
+        rasterize_layout = QHBoxLayout()
+        rasterize_layout.addWidget(QLabel("Above (points):"))
+        self.rasterize_threshold_spin = QSpinBox()
+        self.rasterize_threshold_spin.setRange(100, 10000000)
+        self.rasterize_threshold_spin.setSingleStep(1000)
+        self.rasterize_threshold_spin.setValue(DEFAULT_RASTERIZE_THRESHOLD)
+        rasterize_layout.addWidget(self.rasterize_threshold_spin)
+
+        rasterize_layout.addWidget(QLabel("Raster DPI:"))
+        self.raster_dpi_spin = QSpinBox()
+        self.raster_dpi_spin.setRange(72, 1200)
+        self.raster_dpi_spin.setValue(DEFAULT_RASTER_DPI)
+        rasterize_layout.addWidget(self.raster_dpi_spin)
+        layout.addLayout(rasterize_layout)
+        self.rasterize_checkbox.toggled.connect(self.rasterize_threshold_spin.setEnabled)
+        self.rasterize_checkbox.toggled.connect(self.raster_dpi_spin.setEnabled)
+
+        # Large PNG/TIFF images: rendered in bands so memory stays bounded
+        self.tiled_checkbox = QCheckBox("Render large PNG/TIFF images in tiles")
+        self.tiled_checkbox.setChecked(True)
+        self.tiled_checkbox.setToolTip("Poster-size images are rendered band by band and streamed to the file instead of in one huge buffer.")
+        layout.addWidget(self.tiled_checkbox)
         
         # LaTeX Compatibility and Help Buttons
         latex_help_layout = QHBoxLayout()
@@ -100,6 +130,14 @@ class SavePlotDialog(QDialog):
         height = self.height_spin.value()
         quality = self.quality_combo.currentText()
         return width, height, quality, self.latex_options
+
+    def get_export_options(self):
+        return {
+            'rasterize': self.rasterize_checkbox.isChecked(),
+            'rasterize_threshold': self.rasterize_threshold_spin.value(),
+            'raster_dpi': self.raster_dpi_spin.value(),
+            'tiled': self.tiled_checkbox.isChecked(),
+        }
     
     def show_help(self):
         help_text = """
@@ -1,7 +1,11 @@
 import os
 import sys
-from PyQt5.QtWidgets import QMainWindow, QTabWidget
+from PyQt5.QtWidgets import QMainWindow, QTabWidget, QLabel
 from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import QSettings, QStandardPaths
+
+from utils import configure_sidecar_cache, set_dataset_cache_budget, DEFAULT_CACHE_BYTES
+from gui.plot.render_scheduler import get_render_scheduler
 
 # Import the tab classes
 from gui.tabs.general_tab import GeneralTab
@@ -9,6 +13,10 @@ from gui.tabs.normalization_tab import NormalizationTab
 from gui.tabs.data_fitting_tab import DataFittingTab  # Import the new DataHandlingTab
 
 
+# Source files smaller than this are parsed again rather than given a binary sidecar (1 MB)
+DEFAULT_SIDECAR_MIN_FILE_SIZE = 1024 * 1024
+
+
 def resource_path(relative_path):
     """Get the absolute path to a resource, works for development and PyInstaller."""
     try:
@@ -25,11 +33,39 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Data Wiz Pro by Hossein Ostovar ")
         self.setGeometry(100, 100, 1200, 800)                        
 
+        self.apply_cache_settings()
         self.init_ui()
 
         # Load the stylesheet
         self.apply_stylesheet()
 
+    def apply_cache_settings(self):
+        """
+        Configures the dataset cache from the application settings. Binary sidecars of parsed
+        files are opt-in; when enabled they are kept in the user's cache directory, not next to
+        the data.
+
+        Settings:
+            cache/memory_mb: Memory budget of the dataset cache.
+            cache/sidecars: Whether large files get a binary sidecar (default: False).
+            cache/sidecar_dtype: 'float64' or 'float32' storage of the sidecars.
+            cache/sidecar_min_file_size: Smallest file (in bytes) that gets a sidecar.
+        """
+        settings = QSettings("DataWizPro", "DataWizPro")
+        memory_mb = settings.value("cache/memory_mb", DEFAULT_CACHE_BYTES // (1024 * 1024), type=int)
+        set_dataset_cache_budget(memory_mb * 1024 * 1024)
+
+        directory = os.path.join(QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation), "DataWizPro", "sidecars")
+        try:
+            configure_sidecar_cache(
+                enabled=settings.value("cache/sidecars", False, type=bool),
+                directory=directory,
+                dtype=settings.value("cache/sidecar_dtype", "float64", type=str),
+                min_file_size=settings.value("cache/sidecar_min_file_size", DEFAULT_SIDECAR_MIN_FILE_SIZE, type=int),
+            )
+        except ValueError as e:
+            print(f"Invalid sidecar cache settings, sidecars stay disabled: {e}")
+
     def init_ui(self):
         # Create the tab widget
         self.tabs = QTabWidget()
@@ -55,6 +91,16 @@ class MainWindow(QMainWindow):
         # Optionally, set the default tab
         self.tabs.setCurrentWidget(self.general_tab)
 
+        # Counters of the shared render scheduler: how many redraw requests were coalesced
+        self.render_stats_label = QLabel()
+        self.statusBar().addPermanentWidget(self.render_stats_label)
+        get_render_scheduler().flushed.connect(self.show_render_stats)
+
+    def show_render_stats(self, stats):
+        self.render_stats_label.setText(
+            f"Renders: {stats['rendered']} drawn, {stats['skipped']} skipped of {stats['requested']} requested"
+        )
+
     def apply_stylesheet(self):
         """Load the global stylesheet."""
         stylesheet_path = resource_path('style.qss')
@@ -30,6 +30,14 @@ def resource_path(relative_path):
 
 
 class CorrectMissingDataPanel(QWidget):
+    # Gap filling options and their processing.missing_data method
+    FILL_METHODS = {
+        "Replace with Mean": 'mean',
+        "Replace with Median": 'median',
+        "Linear Interpolation": 'linear',
+        "Nearest Value": 'nearest',
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.method_name = "Correct Missing Data"
@@ -66,7 +74,7 @@ class CorrectMissingDataPanel(QWidget):
         self.layout.addWidget(QLabel("Choose how to handle missing data:"))
 
         self.method_combo = QComboBox()
-        self.method_combo.addItems(["Remove Rows with Missing Data", "Replace with Mean", "Replace with Median"])
+        self.method_combo.addItems(["Remove Rows with Missing Data"] + list(self.FILL_METHODS))
         self.layout.addWidget(self.method_combo)
 
         self.setLayout(self.layout)
@@ -76,8 +84,11 @@ class CorrectMissingDataPanel(QWidget):
             "This method allows you to handle missing data (NaN values) in your datasets.\n\n"
             "Options:\n"
             "- Remove Rows with Missing Data: Deletes any row that contains a missing value.\n"
-            "- Replace with Mean: Replaces missing values with the mean of the column.\n"
-            "- Replace with Median: Replaces missing values with the median of the column."
+            "- Replace with Mean: Replaces missing values with the mean of the nearest values before and after them.\n"
+            "- Replace with Median: Replaces missing values with the median of the nearest values before and after them.\n"
+            "- Linear Interpolation: Interpolates missing values linearly along X between their neighbours.\n"
+            "- Nearest Value: Replaces missing values with the neighbour closest along X.\n\n"
+            "Missing values before the first or after the last valid value take that value."
         )
         dialog = HelpDialog("Correct Missing Data Help", help_content, self)
         dialog.exec_()
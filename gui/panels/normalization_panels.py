@@ -3,9 +3,9 @@
 
 from PyQt5.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox, QLabel, 
-    QDoubleSpinBox, QLineEdit, QSpinBox, QFileDialog,QMessageBox,QListWidgetItem, QGroupBox,QWidget
+    QDoubleSpinBox, QLineEdit, QSpinBox, QFileDialog,QMessageBox,QListWidgetItem, QGroupBox,QWidget, QComboBox, QListWidget
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
 import os
 import sys
@@ -927,6 +927,18 @@ class ReferencePeakNormalizationPanel(BaseNormalizationMethodPanel):
             return None
         
 class BaselineCorrectionNormalizationPanel(BaseNormalizationMethodPanel):
+    # Algorithm options and their processing.baseline name
+    ALGORITHMS = {
+        "ALS": 'als',
+        "arPLS": 'arpls',
+        "airPLS": 'airpls',
+        "Rolling Ball": 'rolling_ball',
+        "SNIP": 'snip',
+    }
+
+    # Initial iteration count of each penalized algorithm
+    DEFAULT_ITERATIONS = {'als': 10, 'arpls': 50, 'airpls': 15}
+
     def __init__(self, parent=None):
         super().__init__("Baseline Correction Normalization", parent)
 
@@ -960,38 +972,82 @@ class BaselineCorrectionNormalizationPanel(BaseNormalizationMethodPanel):
         # Parameters for Baseline Correction
         self.layout.addWidget(QLabel("Baseline Correction Parameters:"))
 
+        # Algorithm
+        algorithm_layout = QHBoxLayout()
+        algorithm_layout.addWidget(QLabel("Algorithm:"))
+        self.algorithm_combo = QComboBox()
+        self.algorithm_combo.addItems(list(self.ALGORITHMS))
+        algorithm_layout.addWidget(self.algorithm_combo)
+        self.layout.addLayout(algorithm_layout)
+
         # Lambda Parameter
-        lambda_layout = QHBoxLayout()
-        lambda_layout.addWidget(QLabel("Lambda (λ):"))
         self.lambda_input = QLineEdit()
         self.lambda_input.setText("1e6")  # Default value
-        lambda_layout.addWidget(self.lambda_input)
-        self.layout.addLayout(lambda_layout)
+        self.lambda_row = self.add_parameter_row("Lambda (λ):", self.lambda_input)
 
         # Asymmetry Parameter
-        p_layout = QHBoxLayout()
-        p_layout.addWidget(QLabel("Asymmetry (p):"))
         self.p_input = QLineEdit()
         self.p_input.setText("0.01")  # Default value
-        p_layout.addWidget(self.p_input)
-        self.layout.addLayout(p_layout)
+        self.p_row = self.add_parameter_row("Asymmetry (p):", self.p_input)
 
         # Number of Iterations
-        niter_layout = QHBoxLayout()
-        niter_layout.addWidget(QLabel("Iterations (niter):"))
         self.niter_input = QLineEdit()
         self.niter_input.setText("10")  # Default value
-        niter_layout.addWidget(self.niter_input)
-        self.layout.addLayout(niter_layout)
+        self.iterations = {algorithm: str(count) for algorithm, count in self.DEFAULT_ITERATIONS.items()}
+        self.niter_algorithm = None  # The algorithm whose count the field shows
+        self.niter_row = self.add_parameter_row("Iterations (niter):", self.niter_input)
+
+        # Window of the rolling-ball and SNIP baselines
+        self.half_window_input = QLineEdit()
+        self.half_window_input.setText("50")  # Default value
+        self.half_window_row = self.add_parameter_row("Half window (points):", self.half_window_input)
+
+        self.smooth_half_window_input = QLineEdit()
+        self.smooth_half_window_input.setText("0")  # Default value
+        self.smooth_half_window_row = self.add_parameter_row("Smoothing half window (points):", self.smooth_half_window_input)
 
         # Connect input changes to validation
+        self.algorithm_combo.currentIndexChanged.connect(self.update_parameter_rows)
         self.lambda_input.textChanged.connect(self.validate_inputs)
         self.p_input.textChanged.connect(self.validate_inputs)
         self.niter_input.textChanged.connect(self.validate_inputs)
+        self.half_window_input.textChanged.connect(self.validate_inputs)
+        self.smooth_half_window_input.textChanged.connect(self.validate_inputs)
 
         self.setLayout(self.layout)
 
         # **Invoke validation upon initialization**
+        self.update_parameter_rows()
+
+    def add_parameter_row(self, label, input_widget):
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.addWidget(QLabel(label))
+        row_layout.addWidget(input_widget)
+        self.layout.addWidget(row)
+        return row
+
+    def algorithm(self):
+        return self.ALGORITHMS[self.algorithm_combo.currentText()]
+
+    def update_parameter_rows(self):
+        """Shows the parameters of the selected algorithm only."""
+        algorithm = self.algorithm()
+        penalized = algorithm in ('als', 'arpls', 'airpls')
+        self.lambda_row.setVisible(penalized)
+        self.p_row.setVisible(algorithm == 'als')
+        self.niter_row.setVisible(penalized)
+        self.half_window_row.setVisible(not penalized)
+        self.smooth_half_window_row.setVisible(not penalized)
+        # Every penalized algorithm keeps its own iteration count; the field shows the selected one
+        if self.niter_algorithm is not None:
+            self.iterations[self.niter_algorithm] = self.niter_input.text()
+        if penalized:
+            self.niter_input.setText(self.iterations[algorithm])
+            self.niter_algorithm = algorithm
+        else:
+            self.niter_algorithm = None
         self.validate_inputs()
 
     def show_help(self):
@@ -999,37 +1055,68 @@ class BaselineCorrectionNormalizationPanel(BaseNormalizationMethodPanel):
         dialog = HelpDialog("Baseline Correction Normalization Help", help_content, self)
         dialog.exec_()
 
+    def read_parameters(self):
+        """
+        Parameters of the selected algorithm.
+
+        Returns:
+            dict: The parameters, or None when a value is out of range.
+
+        Raises:
+            ValueError: When a value is not numeric.
+        """
+        algorithm = self.algorithm()
+        if algorithm in ('als', 'arpls', 'airpls'):
+            params = {
+                'algorithm': algorithm,
+                'lambda_': float(self.lambda_input.text()),
+                'niter': int(self.niter_input.text())
+            }
+            if algorithm == 'als':
+                params['p'] = float(self.p_input.text())
+                if not (0 < params['p'] < 1):
+                    return None
+            if params['lambda_'] <= 0 or params['niter'] <= 0:
+                return None
+        else:
+            params = {
+                'algorithm': algorithm,
+                'half_window': int(self.half_window_input.text()),
+                'smooth_half_window': int(self.smooth_half_window_input.text())
+            }
+            if params['half_window'] <= 0 or params['smooth_half_window'] < 0:
+                return None
+        return params
+
     def validate_inputs(self):
         try:
-            lambda_val = float(self.lambda_input.text())
-            p_val = float(self.p_input.text())
-            niter_val = int(self.niter_input.text())
-            if lambda_val <= 0 or not (0 < p_val < 1) or niter_val <= 0:
-                self.apply_button.setEnabled(False)
-            else:
-                self.apply_button.setEnabled(True)
+            self.apply_button.setEnabled(self.read_parameters() is not None)
         except ValueError:
             self.apply_button.setEnabled(False)
 
     def get_parameters(self):
         try:
-            lambda_val = float(self.lambda_input.text())
-            p_val = float(self.p_input.text())
-            niter_val = int(self.niter_input.text())
-            if lambda_val <= 0 or not (0 < p_val < 1) or niter_val <= 0:
+            params = self.read_parameters()
+            if params is None:
                 QMessageBox.warning(self, "Invalid Parameters", "Please enter valid parameter values.")
-                return None
-            return {
-                'lambda_': lambda_val,
-                'p': p_val,
-                'niter': niter_val
-            }
+            return params
         except ValueError:
             QMessageBox.warning(self, "Invalid Inputs", "Please enter numeric values for all parameters.")
             return None
         
 
 class BaselineCorrectionWithFileNormalizationPanel(BaseNormalizationMethodPanel):
+    # Emitted with the paths of newly added reference files, and with the path of a removed one
+    reference_files_added = pyqtSignal(list)
+    reference_file_removed = pyqtSignal(str)
+
+    # Common grid options and their processing.alignment mode
+    GRID_MODES = {
+        "Reference X values": 'reference',
+        "Union of X values": 'union',
+        "Uniform step": 'uniform',
+    }
+
     def __init__(self, parent=None):
         super().__init__("Baseline Correction with File", parent)
         
@@ -1072,21 +1159,47 @@ class BaselineCorrectionWithFileNormalizationPanel(BaseNormalizationMethodPanel)
         button_layout.addWidget(self.send_to_data_panel_button)
         self.layout.addLayout(button_layout)
 
-        # File Selection for Reference Data
-        self.layout.addWidget(QLabel("Select Reference File:"))
+        # Reference files (e.g. dark, blank, solvent); the selected one is subtracted. They stay
+        # loaded, so switching between them or applying again does not read them again.
+        self.layout.addWidget(QLabel("Reference Files (the selected one is subtracted):"))
+        self.reference_list = QListWidget()
+        self.reference_list.setSelectionMode(QListWidget.SingleSelection)
+        self.reference_list.setMaximumHeight(100)
+        self.layout.addWidget(self.reference_list)
+
         file_selection_layout = QHBoxLayout()
-        self.file_path_display = QLineEdit()
-        self.file_path_display.setReadOnly(True)
-        self.choose_file_button = QPushButton("Choose File")
+        self.choose_file_button = QPushButton("Add Files")
         self.choose_file_button.clicked.connect(self.choose_reference_file)
-        file_selection_layout.addWidget(self.file_path_display)
+        self.remove_file_button = QPushButton("Remove")
+        self.remove_file_button.clicked.connect(self.remove_reference_file)
         file_selection_layout.addWidget(self.choose_file_button)
+        file_selection_layout.addWidget(self.remove_file_button)
         self.layout.addLayout(file_selection_layout)
 
+        # Common x-grid of the data and the reference (their x-values may differ slightly)
+        grid_layout = QHBoxLayout()
+        grid_layout.addWidget(QLabel("Common X Grid:"))
+        self.grid_mode_combo = QComboBox()
+        self.grid_mode_combo.addItems(list(self.GRID_MODES))
+        self.grid_mode_combo.setToolTip(
+            "Values are interpolated onto the common grid, within the X range shared with the reference."
+        )
+        grid_layout.addWidget(self.grid_mode_combo)
+        self.layout.addLayout(grid_layout)
+
+        step_layout = QHBoxLayout()
+        step_layout.addWidget(QLabel("Grid Step:"))
+        self.grid_step_input = QLineEdit()
+        self.grid_step_input.setPlaceholderText("Auto (reference spacing)")
+        step_layout.addWidget(self.grid_step_input)
+        self.layout.addLayout(step_layout)
+
         self.setLayout(self.layout)
 
         # Connect signals
-        self.file_path_display.textChanged.connect(self.validate_inputs)
+        self.reference_list.currentItemChanged.connect(self.validate_inputs)
+        self.grid_mode_combo.currentIndexChanged.connect(self.update_grid_step)
+        self.update_grid_step()
 
     def show_help(self):
         help_content = SUBTRACTION_NORMALIZATION_HELP
@@ -1095,27 +1208,69 @@ class BaselineCorrectionWithFileNormalizationPanel(BaseNormalizationMethodPanel)
 
 
     def choose_reference_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
+        file_paths, _ = QFileDialog.getOpenFileNames(
             self,
-            "Select Reference File",
+            "Select Reference Files",
             "",
             "Data Files (*.csv *.txt);;All Files (*)"
         )
-        if file_path:
-            self.file_path_display.setText(file_path)
-            self.validate_inputs()
+        if file_paths:
+            self.add_reference_files(file_paths)
+
+    def add_reference_files(self, file_paths):
+        existing = set(self.get_reference_files())
+        added = []
+        for file_path in file_paths:
+            if file_path in existing:
+                continue
+            item = QListWidgetItem(os.path.basename(file_path))
+            item.setData(Qt.UserRole, file_path)
+            item.setToolTip(file_path)
+            self.reference_list.addItem(item)
+            added.append(file_path)
+        if added:
+            self.reference_list.setCurrentRow(self.reference_list.count() - 1)
+            self.reference_files_added.emit(added)
+        self.validate_inputs()
+
+    def remove_reference_file(self):
+        row = self.reference_list.currentRow()
+        if row >= 0:
+            item = self.reference_list.takeItem(row)
+            self.reference_file_removed.emit(item.data(Qt.UserRole))
+        self.validate_inputs()
+
+    def get_reference_files(self):
+        return [self.reference_list.item(i).data(Qt.UserRole) for i in range(self.reference_list.count())]
+
+    def selected_reference_file(self):
+        item = self.reference_list.currentItem()
+        return item.data(Qt.UserRole) if item is not None else None
+
+    def update_grid_step(self):
+        self.grid_step_input.setEnabled(self.GRID_MODES[self.grid_mode_combo.currentText()] == 'uniform')
 
     def validate_inputs(self):
-        if self.file_path_display.text():
+        if self.selected_reference_file():
             self.apply_button.setEnabled(True)
         else:
             self.apply_button.setEnabled(False)
 
     def get_parameters(self):
         params = {}
-        reference_file_path = self.file_path_display.text()
-        if not os.path.isfile(reference_file_path):
+        reference_file_path = self.selected_reference_file()
+        if not reference_file_path or not os.path.isfile(reference_file_path):
             QMessageBox.warning(self, "Invalid File", "Please select a valid reference file.")
             return None
         params['reference_file_path'] = reference_file_path
+        params['grid_mode'] = self.GRID_MODES[self.grid_mode_combo.currentText()]
+        params['grid_step'] = None
+        if params['grid_mode'] == 'uniform' and self.grid_step_input.text().strip():
+            try:
+                params['grid_step'] = float(self.grid_step_input.text())
+            except ValueError:
+                params['grid_step'] = -1
+            if params['grid_step'] <= 0:
+                QMessageBox.warning(self, "Invalid Grid Step", "Please enter a positive grid step, or leave it empty.")
+                return None
         return params
\ No newline at end of file
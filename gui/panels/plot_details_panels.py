@@ -13,6 +13,7 @@ from PyQt5.QtGui import QIcon
 import h5py
 import pandas as pd
 from gui.utils.widgets import DraggableListWidget  
+from plots.decimation import DEFAULT_POINT_BUDGET
 from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtGui import QIcon, QColor
 
@@ -249,7 +250,8 @@ class PlotVisualsPanel(QGroupBox):
 
         self.layout.addWidget(QLabel("Plot Type:"))
         self.plot_type_combo = QComboBox()
-        self.plot_type_combo.addItems(["Line", "Bar", "Scatter", "Histogram", "Pie"])
+        self.plot_type_combo.addItems(["Line", "Bar", "Scatter", "Histogram", "Pie", "Density"])
+        self.plot_type_combo.setItemData(5, "2D histogram of all points at screen resolution, for millions of points", Qt.ToolTipRole)
         self.layout.addWidget(self.plot_type_combo)
 
         self.add_grid_checkbox = QCheckBox("Add Grid")
@@ -269,8 +271,41 @@ class PlotVisualsPanel(QGroupBox):
         self.apply_legends_checkbox = QCheckBox("Apply Legends")
         self.layout.addWidget(self.apply_legends_checkbox)
 
+        # Decimation of large line/scatter traces
+        self.decimate_checkbox = QCheckBox("Decimate Large Datasets")
+        self.decimate_checkbox.setChecked(True)
+        self.decimate_checkbox.setToolTip("Draw only the points visible at screen resolution (peaks are kept). Applies to 2D Line and Scatter plots.")
+        self.layout.addWidget(self.decimate_checkbox)
+
+        self.layout.addWidget(QLabel("Point Budget per Trace:"))
+        self.decimation_points_spinbox = QSpinBox()
+        self.decimation_points_spinbox.setRange(500, 1000000)
+        self.decimation_points_spinbox.setSingleStep(1000)
+        self.decimation_points_spinbox.setValue(DEFAULT_POINT_BUDGET)
+        self.decimation_points_spinbox.setEnabled(self.decimate_checkbox.isChecked())
+        self.decimate_checkbox.toggled.connect(self.decimation_points_spinbox.setEnabled)
+        self.layout.addWidget(self.decimation_points_spinbox)
+
+        # Many-file overlays drawn as a single collection
+        self.bulk_overlay_checkbox = QCheckBox("Bulk Overlay (many files)")
+        self.bulk_overlay_checkbox.setToolTip("Draw all 2D line series as one collection colored by a colormap, with a colorbar instead of per-file legend entries.")
+        self.layout.addWidget(self.bulk_overlay_checkbox)
+
+        self.layout.addWidget(QLabel("Colormap (Bulk Overlay / Density):"))
+        self.overlay_colormap_combo = QComboBox()
+        self.overlay_colormap_combo.addItems(["viridis", "plasma", "inferno", "cividis", "coolwarm", "rainbow", "tab10", "tab20"])
+        self.bulk_overlay_checkbox.toggled.connect(self.update_colormap_enabled)
+        self.plot_type_combo.currentTextChanged.connect(self.update_colormap_enabled)
+        self.update_colormap_enabled()
+        self.layout.addWidget(self.overlay_colormap_combo)
+
         self.setLayout(self.layout)
 
+    def update_colormap_enabled(self, *args):
+        self.overlay_colormap_combo.setEnabled(
+            self.bulk_overlay_checkbox.isChecked() or self.plot_type_combo.currentText() == "Density"
+        )
+
     def get_plot_visuals(self):
         return {
             'plot_type': self.plot_type_combo.currentText(),
@@ -278,6 +313,10 @@ class PlotVisualsPanel(QGroupBox):
             'add_sub_grid': self.add_sub_grid_checkbox.isChecked(),
             'plot_style': self.plot_style_combo.currentText(),
             'apply_legends': self.apply_legends_checkbox.isChecked(),
+            'decimate': self.decimate_checkbox.isChecked(),
+            'decimation_points': self.decimation_points_spinbox.value(),
+            'bulk_overlay': self.bulk_overlay_checkbox.isChecked(),
+            'overlay_colormap': self.overlay_colormap_combo.currentText(),
         }
 
 
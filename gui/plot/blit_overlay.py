@@ -0,0 +1,83 @@
+# gui/plot/blit_overlay.py
+
+
+class BlitOverlay:
+    """
+    Preview artists (annotation preview line, crosshair) drawn over a cached copy of the
+    rendered plot. Moving them restores the cached background and draws only the preview
+    artists, so mouse tracking costs the same however much data is plotted.
+
+    The background is captured on every draw_event, i.e. after each full render.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.background = None
+        self.artists = {}  # name -> animated artist
+        canvas.mpl_connect('draw_event', self.on_draw)
+
+    def on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def show_vertical_line(self, ax, x, **line_kwargs):
+        """Shows the preview vertical line at x."""
+        self._hide('hline')
+        line = self._artist('vline', ax, lambda: ax.axvline(x=x, animated=True, **line_kwargs))
+        line.set_xdata([x, x])
+        self.update()
+
+    def show_horizontal_line(self, ax, y, **line_kwargs):
+        """Shows the preview horizontal line at y."""
+        self._hide('vline')
+        line = self._artist('hline', ax, lambda: ax.axhline(y=y, animated=True, **line_kwargs))
+        line.set_ydata([y, y])
+        self.update()
+
+    def show_crosshair(self, ax, x, y, **line_kwargs):
+        """Shows a crosshair through (x, y)."""
+        vline = self._artist('vline', ax, lambda: ax.axvline(x=x, animated=True, **line_kwargs))
+        hline = self._artist('hline', ax, lambda: ax.axhline(y=y, animated=True, **line_kwargs))
+        vline.set_xdata([x, x])
+        hline.set_ydata([y, y])
+        self.update()
+
+    def hide(self):
+        """Removes every preview artist from the screen."""
+        if not self.artists:
+            return
+        for name in list(self.artists):
+            self._hide(name)
+        self.update()
+
+    def update(self):
+        """Repaints the preview artists over the cached background."""
+        if self.background is None:
+            # Nothing rendered yet; the next full draw captures the background
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def _artist(self, name, ax, create):
+        """Returns the named preview artist on ax, creating it when missing or on another axes."""
+        artist = self.artists.get(name)
+        if artist is None or artist.axes is not ax or ax not in self.canvas.figure.axes:
+            self._hide(name)
+            artist = create()
+            self.artists[name] = artist
+        return artist
+
+    def _hide(self, name):
+        artist = self.artists.pop(name, None)
+        if artist is not None and artist.axes is not None and artist.axes in self.canvas.figure.axes:
+            artist.remove()
+
+    def _draw_artists(self):
+        figure = self.canvas.figure
+        for name, artist in list(self.artists.items()):
+            if artist.axes is None or artist.axes not in figure.axes:
+                del self.artists[name]  # Its axes was cleared by a full render
+                continue
+            figure.draw_artist(artist)
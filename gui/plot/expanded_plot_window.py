@@ -17,7 +17,8 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
 import matplotlib.text
 
-from plots.plotting import plot_data  # Ensure this import is correct
+from plots.plotting import render_datasets
+from gui.plot.render_scheduler import get_render_scheduler
 
 class ExpandedPlotWindow(QWidget):
     closed = pyqtSignal()  # Define the custom 'closed' signal
@@ -39,61 +40,105 @@ class ExpandedPlotWindow(QWidget):
         self.layout.addWidget(self.expanded_toolbar)
         self.layout.addWidget(self.expanded_canvas)
 
-        # Connect to parent's plot_updated signal
-        self.parent_tab.plot_updated.connect(self.update_expanded_plot)
+        self.annotation_copies = []  # Copies of the parent's (star, text) annotations
+        self.text_copies = []  # Copies of the parent's additional texts
+
+        # Connect to parent's plot_updated signal (redraws are coalesced by the render scheduler)
+        self.render_scheduler = get_render_scheduler()
+        self.parent_tab.plot_updated.connect(self.request_expanded_plot_update)
 
         # Initial plot
         self.update_expanded_plot()
 
+    def request_expanded_plot_update(self):
+        self.render_scheduler.request(self.expanded_canvas, self.update_expanded_plot)
+
     def update_expanded_plot(self, event=None):
-        print("ExpandedPlotWindow: update_expanded_plot called")  # Debugging statement
         try:
-            # Clear the expanded figure and redraw
-            self.expanded_figure.clear()
-            projection = '3d' if self.parent_tab.plot_type == "3D" else None
-            ax = self.expanded_figure.add_subplot(111, projection=projection)
-
-            # Re-plot using the same data and settings
-            data_files = self.parent_tab.selected_data_panel.get_selected_files()
-            plot_details = self.parent_tab.plot_details_panel.get_plot_details()
-            axis_details = self.parent_tab.axis_details_panel.get_axis_details()
-            plot_visuals = self.parent_tab.plot_visuals_panel.get_plot_visuals()
-            plot_type = self.parent_tab.plot_type
-
-            plot_data(
-                self.expanded_figure, data_files, plot_details,
-                axis_details, plot_visuals, is_3d=(plot_type == "3D")
+            # Render the parent's in-memory datasets with its settings; nothing is read from disk.
+            # Decimation works from this window's own axes size.
+            datasets = getattr(self.parent_tab, 'datasets', None)
+            if datasets is None:
+                return
+            config = self.parent_tab.plot_config
+            render_datasets(
+                self.expanded_figure, datasets, config.plot_details,
+                config.axis_details, config.plot_visuals, is_3d=config.is_3d
             )
+            ax = self.expanded_figure.axes[0]
 
-            # Re-add annotations
+            # Re-add annotations (the axes are reused, so the previous copies are removed first)
+            for artist in self.annotation_copies:
+                if artist.axes is not None:
+                    artist.remove()
+            self.annotation_copies = []
             for ann in self.parent_tab.annotations:
                 if isinstance(ann, tuple):
                     # It's a (star, text) tuple
                     star, text = ann
-                    ax.plot(star.get_xdata(), star.get_ydata(), marker='*', color='black', markersize=10)
-                    ax.text(
+                    self.annotation_copies.extend(ax.plot(
+                        star.get_xdata(), star.get_ydata(), marker='*', color='black', markersize=10
+                    ))
+                    self.annotation_copies.append(ax.text(
                         text.get_position()[0],
                         text.get_position()[1],
                         text.get_text(),
                         fontsize=10,
                         color='black',
                         ha='left'
-                    )
+                    ))
                 elif isinstance(ann, plt.Line2D):
-                    ax.add_line(ann)
+                    self.annotation_copies.append(ax.add_line(self.copy_line(ax, ann)))
                 elif isinstance(ann, matplotlib.text.Annotation):
-                    ax.add_artist(ann)
-
-            # Re-add additional texts
-            for text_item in self.parent_tab.text_items:
-                ax.add_artist(text_item)
+                    self.annotation_copies.append(ax.annotate(
+                        ann.get_text(), xy=ann.xy, xytext=ann.xyann,
+                        xycoords=ann.xycoords, textcoords=ann.anncoords, arrowprops=ann.arrowprops,
+                        ha=ann.get_ha(), va=ann.get_va(), rotation=ann.get_rotation(),
+                        fontsize=ann.get_fontsize(), color=ann.get_color()
+                    ))
+
+            # Re-add additional texts (copies, the originals stay on the parent's plot)
+            for text_copy in self.text_copies:
+                if text_copy.axes is not None:
+                    text_copy.remove()
+            self.text_copies = []
+            if not config.is_3d:
+                for text_item in self.parent_tab.text_items:
+                    x_pos, y_pos = text_item.get_position()
+                    self.text_copies.append(ax.text(
+                        x_pos, y_pos, text_item.get_text(),
+                        fontsize=text_item.get_fontsize(), color=text_item.get_color(), ha='left'
+                    ))
 
             self.expanded_canvas.draw_idle()
-            print("ExpandedPlotWindow: update_expanded_plot completed")  # Debugging statement
         except Exception as e:
             print(f"ExpandedPlotWindow: Error in update_expanded_plot: {e}")
 
+    @staticmethod
+    def copy_line(ax, line):
+        """
+        A copy of one of the parent's annotation lines for ax (an artist can only be on one axes).
+        Vertical and horizontal lines (axvline/axhline) keep spanning the whole axes.
+        """
+        source_ax = line.axes
+        transform = line.get_transform()
+        if source_ax is not None and transform == source_ax.get_xaxis_transform():
+            transform = ax.get_xaxis_transform()
+        elif source_ax is not None and transform == source_ax.get_yaxis_transform():
+            transform = ax.get_yaxis_transform()
+        else:
+            transform = ax.transData
+        return plt.Line2D(
+            line.get_xdata(), line.get_ydata(), color=line.get_color(), linestyle=line.get_linestyle(),
+            linewidth=line.get_linewidth(), marker=line.get_marker(), transform=transform
+        )
+
     def closeEvent(self, event):
         print("ExpandedPlotWindow: closeEvent called.")  # Debugging statement
+        self.render_scheduler.cancel(self.expanded_canvas)
+        try:
+            self.parent_tab.plot_updated.disconnect(self.request_expanded_plot_update)
+        except TypeError:
+            pass  # Already disconnected
         self.closed.emit()  # Emit the 'closed' signal
         super().closeEvent(event)
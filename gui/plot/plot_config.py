@@ -2,28 +2,147 @@
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
+# Kinds of change, from the most to the least expensive update they need
+DATA = 'data'              # Files or columns: reload the data
+STYLE = 'style'            # Colors, line styles, fonts, plot type: redraw the artists
+GEOMETRY = 'geometry'      # Scales and axis limits: change the view only
+DECORATION = 'decoration'  # Title, labels, legend: update the texts only
+
+CATEGORIES = [DATA, STYLE, GEOMETRY, DECORATION]
+
+# Category of every known setting, per section
+CHANGE_CATEGORIES = {
+    'plot_details': {
+        'x_axis_col': DATA,
+        'y_axis_col': DATA,
+        'line_style': STYLE,
+        'point_style': STYLE,
+        'line_thickness': STYLE,
+        'scale_type': GEOMETRY,
+    },
+    'axis_details': {
+        'title': DECORATION,
+        'x_label': DECORATION,
+        'y_label': DECORATION,
+        'x_min': GEOMETRY,
+        'x_max': GEOMETRY,
+        'y_min': GEOMETRY,
+        'y_max': GEOMETRY,
+        'axis_font_size': STYLE,
+        'title_font_size': STYLE,
+        'legend_font_size': STYLE,
+    },
+    'plot_visuals': {
+        'plot_type': STYLE,
+        'add_grid': STYLE,
+        'add_sub_grid': STYLE,
+        'plot_style': STYLE,
+        'apply_legends': DECORATION,
+        'decimate': STYLE,
+        'decimation_points': STYLE,
+        'bulk_overlay': STYLE,
+        'overlay_colormap': STYLE,
+    },
+}
+
+
+def classify_change(section, key):
+    """Category of a changed setting. Unknown settings are treated as data changes, the safe default."""
+    return CHANGE_CATEGORIES.get(section, {}).get(key, DATA)
+
+
+def diff_settings(section, old, new):
+    """
+    Compares two versions of a settings dict.
+
+    Returns:
+        dict: category -> {key: (old_value, new_value)} for every key that changed.
+    """
+    changes = {}
+    for key in set(old) | set(new):
+        if old.get(key) != new.get(key):
+            changes.setdefault(classify_change(section, key), {})[key] = (old.get(key), new.get(key))
+    return changes
+
+
 class PlotConfig(QObject):
     plot_details_changed = pyqtSignal(dict)
     axis_details_changed = pyqtSignal(dict)
     plot_visuals_changed = pyqtSignal(dict)
 
+    # One signal per category of change, with {key: (old_value, new_value)}
+    data_changed = pyqtSignal(dict)
+    style_changed = pyqtSignal(dict)
+    geometry_changed = pyqtSignal(dict)
+    decoration_changed = pyqtSignal(dict)
+
     def __init__(self):
         super().__init__()
         self.plot_details = {}
         self.axis_details = {}
         self.plot_visuals = {}
+        self.data_files = []
+        self.is_3d = False
 
     def update_plot_details(self, new_details):
-        self.plot_details = new_details
-        self.plot_details_changed.emit(new_details)
+        return self.update(plot_details=new_details)
 
     def update_axis_details(self, new_details):
-        self.axis_details = new_details
-        self.axis_details_changed.emit(new_details)
+        return self.update(axis_details=new_details)
 
     def update_plot_visuals(self, new_visuals):
-        self.plot_visuals = new_visuals
-        self.plot_visuals_changed.emit(new_visuals)
+        return self.update(plot_visuals=new_visuals)
+
+    def update(self, plot_details=None, axis_details=None, plot_visuals=None, data_files=None, is_3d=None):
+        """
+        Stores the new settings, sorts every difference into a category and emits one signal per
+        changed category, most expensive first. Arguments left as None are not changed.
+
+        Returns:
+            dict: category -> {key: (old_value, new_value)}; empty when nothing changed.
+        """
+        changes = {}
+
+        def merge(section_changes):
+            for category, keys in section_changes.items():
+                changes.setdefault(category, {}).update(keys)
+
+        if data_files is not None and list(data_files) != self.data_files:
+            merge({DATA: {'data_files': (self.data_files, list(data_files))}})
+            self.data_files = list(data_files)
+        if is_3d is not None and is_3d != self.is_3d:
+            merge({STYLE: {'is_3d': (self.is_3d, is_3d)}})
+            self.is_3d = is_3d
+
+        if plot_details is not None:
+            section_changes = diff_settings('plot_details', self.plot_details, plot_details)
+            self.plot_details = dict(plot_details)
+            merge(section_changes)
+            if section_changes:
+                self.plot_details_changed.emit(self.plot_details)
+        if axis_details is not None:
+            section_changes = diff_settings('axis_details', self.axis_details, axis_details)
+            self.axis_details = dict(axis_details)
+            merge(section_changes)
+            if section_changes:
+                self.axis_details_changed.emit(self.axis_details)
+        if plot_visuals is not None:
+            section_changes = diff_settings('plot_visuals', self.plot_visuals, plot_visuals)
+            self.plot_visuals = dict(plot_visuals)
+            merge(section_changes)
+            if section_changes:
+                self.plot_visuals_changed.emit(self.plot_visuals)
+
+        signals = {
+            DATA: self.data_changed,
+            STYLE: self.style_changed,
+            GEOMETRY: self.geometry_changed,
+            DECORATION: self.decoration_changed,
+        }
+        for category in CATEGORIES:
+            if category in changes:
+                signals[category].emit(changes[category])
+        return changes
 
     def get_current_config(self):
         return {
@@ -0,0 +1,167 @@
+# gui/plot/plot_tab_mixin.py
+
+import os
+
+from PyQt5.QtWidgets import QDialog, QFileDialog, QMessageBox
+
+from plots.plotting import load_plot_datasets, report_load_errors, render_datasets, apply_axis_geometry, apply_decorations
+from plots.export import export_geometry, snapshot_figure, export_figure
+from gui.plot.plot_config import STYLE, GEOMETRY, DECORATION
+from gui.dialogs.save_plot_dialog import SavePlotDialog
+
+
+class PlotTabMixin:
+    """
+    Drawing and saving of the plot of a tab (GeneralTab, NormalizationTab): reloading the files
+    on a worker thread, redrawing only what changed through the render scheduler, and exporting
+    a copy of the figure in the background.
+
+    The tab provides figure, canvas, plot_config, plot_type, datasets, text_items,
+    pending_plot_changes, render_scheduler, job_runner, export_queue, the plot_updated signal
+    and update_plot().
+    """
+
+    def on_plot_data_settings_changed(self, changes):
+        self.reload_plot_data()
+
+    def on_plot_style_changed(self, changes):
+        self.schedule_plot_update(STYLE)
+
+    def on_plot_geometry_changed(self, changes):
+        self.schedule_plot_update(GEOMETRY)
+
+    def on_plot_decoration_changed(self, changes):
+        self.schedule_plot_update(DECORATION)
+
+    def schedule_plot_update(self, category):
+        """Queues a redraw of the given kind; the render scheduler runs them together."""
+        self.pending_plot_changes.add(category)
+        self.render_scheduler.request(self.canvas, self.apply_pending_plot_changes)
+
+    def apply_pending_plot_changes(self):
+        if self.datasets is None or self.job_runner.is_running():
+            return  # Kept for the render after the reload (see on_plot_reload_finished)
+        pending = self.pending_plot_changes
+        self.pending_plot_changes = set()
+
+        ax = self.plot_axes()
+        if STYLE in pending or ax is None:
+            self.render_plot()
+        else:
+            config = self.plot_config
+            if GEOMETRY in pending:
+                apply_axis_geometry(ax, config.plot_details, config.axis_details, self.figure.artist_registry)
+            if DECORATION in pending:
+                apply_decorations(ax, config.axis_details, config.plot_visuals, config.is_3d)
+            self.canvas.draw_idle()
+        self.plot_updated.emit()  # The expanded window re-renders from the shared datasets
+
+    def plot_axes(self):
+        """The axes drawn by the last render, or None when the figure was redrawn by other code."""
+        registry = getattr(self.figure, 'artist_registry', None)
+        if registry is None or registry.ax not in self.figure.axes:
+            return None
+        return registry.ax
+
+    def reload_plot_data(self):
+        data_files = self.plot_config.data_files
+        plot_details = self.plot_config.plot_details
+
+        # Load the files on a worker thread; drawing happens on the GUI thread once they are in
+        def load(job):
+            return load_plot_datasets(
+                data_files, plot_details,
+                progress_callback=lambda done, total, file_path: job.report_progress(done, total, os.path.basename(file_path)),
+                is_cancelled=job.is_cancelled
+            )
+
+        job = self.job_runner.start(load, self.on_plot_data_loaded, message="Loading files...")
+        job.signals.finished.connect(self.on_plot_reload_finished)
+
+    def on_plot_reload_finished(self):
+        # A cancelled or failed reload still owes the changes made meanwhile a render
+        if self.pending_plot_changes and not self.job_runner.is_running():
+            self.render_scheduler.request(self.canvas, self.apply_pending_plot_changes)
+
+    def on_plot_data_loaded(self, result):
+        self.datasets, errors = result
+        report_load_errors(errors, self)  # Load failures are summarized in one message
+        self.schedule_plot_update(STYLE)
+
+    def render_plot(self):
+        config = self.plot_config
+        render_datasets(self.figure, self.datasets, config.plot_details, config.axis_details, config.plot_visuals, is_3d=config.is_3d)
+
+        # Re-add all existing text items
+        ax = self.figure.gca()
+        if not config.is_3d:
+            for text_item in self.text_items:
+                if text_item not in ax.texts:  # Still there when the lines were updated in place
+                    ax.add_artist(text_item)
+
+        # Initialize annotations list for the main axes
+        if not hasattr(ax, 'annotations'):
+            ax.annotations = []
+
+        self.canvas.draw_idle()
+
+    def plot_2d(self):
+        self.plot_type = "2D"
+        self.update_plot()
+
+    def plot_3d(self):
+        self.plot_type = "3D"
+        self.update_plot()
+
+    def save_plot_with_options(self):
+        dialog = SavePlotDialog(self)
+        if dialog.exec_() == QDialog.Accepted:
+            width_pixels, height_pixels, quality, latex_options = dialog.get_values()
+            self.save_plot(width_pixels, height_pixels, quality, latex_options, dialog.get_export_options())
+
+    def save_plot(self, width_pixels, height_pixels, quality, latex_options=None, export_options=None):
+        """
+        Exports the plot in the background. The current state of the figure is copied, so the
+        interactive plot is never resized and can keep changing while the export runs; several
+        exports are queued and saved one after the other. In vector formats, dense data
+        artists can be rasterized (see export_options).
+        """
+        width_in, height_in, dpi = export_geometry(
+            width_pixels, height_pixels, quality, latex_options, self.figure.get_size_inches()
+        )
+
+        # Define the file path
+        options = QFileDialog.Options()
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Plot",
+            "",
+            "PNG Files (*.png);;JPEG Files (*.jpg);;PDF Files (*.pdf);;SVG Files (*.svg);;EPS Files (*.eps);;TIFF Files (*.tif *.tiff);;All Files (*)",
+            options=options
+        )
+        if not file_path:
+            return
+
+        try:
+            snapshot = snapshot_figure(self.figure)
+        except Exception as e:
+            QMessageBox.warning(self, "Save Failed", f"Failed to copy the plot for saving:\n{e}")
+            return
+
+        def export(job):
+            return export_figure(snapshot, file_path, width_in, height_in, dpi, latex_options, export_options,
+                                 progress_callback=job.report_progress, is_cancelled=job.is_cancelled)
+
+        self.export_queue.submit(
+            export, self.on_plot_saved,
+            message=f"Saving {os.path.basename(file_path)}",
+            on_error=lambda error: self.on_plot_save_failed(file_path, error),
+        )
+
+    def on_plot_saved(self, file_path):
+        if file_path:
+            QMessageBox.information(self, "Save Successful", f"Plot saved successfully at:\n{file_path}")
+
+    def on_plot_save_failed(self, file_path, error):
+        message = error.strip().splitlines()[-1]
+        QMessageBox.warning(self, "Save Failed", f"Failed to save plot {os.path.basename(file_path)}:\n{message}")
@@ -13,6 +13,7 @@ from PyQt5.QtGui import QColor, QIcon, QKeySequence
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT as NavigationToolbar
 
 from plots.plotting import plot_data
+from gui.plot.blit_overlay import BlitOverlay
 
 class ExpandedPlotWindow(QWidget):
     def __init__(self, source_figure, plot_type="2D", text_items=None, annotations=None):
@@ -131,7 +132,6 @@ class PlotWidget(QWidget):
         self.plot_type = "2D"
         self.text_color = 'black'
         self.annotation_mode = None  # None, 'point', 'vline', 'hline'
-        self.temp_annotation = None
         self.selected_lines = []
         self.last_directory = os.path.expanduser("~")
 
@@ -174,6 +174,7 @@ class PlotWidget(QWidget):
         self.figure = plt.figure()
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = NavigationToolbar(self.canvas, self)
+        self.preview_overlay = BlitOverlay(self.canvas)  # Annotation preview, blitted over the plot
 
         # Create a QFrame with rounded corners for the plot
         self.plot_frame = QFrame()
@@ -242,7 +243,7 @@ class PlotWidget(QWidget):
         # Call the plot_data function
         plot_data(
             self.figure, data_files, plot_details,
-            axis_details, plot_visuals, is_3d=(self.plot_type == "3D")
+            axis_details, plot_visuals, is_3d=(self.plot_type == "3D"), parent=self
         )
 
         # Re-add all existing text items
@@ -323,19 +324,17 @@ class PlotWidget(QWidget):
             self.select_line(event)
 
     def on_mouse_move(self, event):
-        if self.plot_type != "2D" or not self.annotation_mode:
+        if self.plot_type != "2D" or not self.annotation_mode or event.inaxes is None:
+            self.preview_overlay.hide()
+            return
+        if event.xdata is None or event.ydata is None:
             return
 
-        if self.temp_annotation:
-            self.temp_annotation.remove()
-            self.temp_annotation = None
-
+        # Only the preview line is redrawn, over the cached plot
         if self.annotation_mode == 'vline':
-            self.temp_annotation = self.figure.gca().axvline(x=event.xdata, color='r', linestyle='--')
+            self.preview_overlay.show_vertical_line(event.inaxes, event.xdata, color='r', linestyle='--')
         elif self.annotation_mode == 'hline':
-            self.temp_annotation = self.figure.gca().axhline(y=event.ydata, color='b', linestyle='--')
-
-        self.canvas.draw_idle()
+            self.preview_overlay.show_horizontal_line(event.inaxes, event.ydata, color='b', linestyle='--')
 
     def add_annotation_point(self, event):
         if event.xdata is None or event.ydata is None:
@@ -366,7 +365,7 @@ class PlotWidget(QWidget):
 
     def apply_changes(self):
         self.annotation_mode = None
-        self.temp_annotation = None
+        self.preview_overlay.hide()
         self.custom_annotations_panel.annotation_type_combo.setCurrentText("None")
         self.canvas.draw_idle()
 
@@ -0,0 +1,86 @@
+# gui/plot/render_scheduler.py
+
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# Requests arriving within this window are rendered together
+DEFAULT_RENDER_DELAY_MS = 30
+
+
+class RenderScheduler(QObject):
+    """
+    Collects redraw requests for the plot canvases and renders each canvas at most once per
+    window. A canvas that is requested again before the window closes is only rendered once,
+    with the most recent render callback.
+
+    Counters:
+        requested: Number of render requests received.
+        rendered: Number of renders actually run.
+        skipped: Number of requests collapsed into another render of the same canvas.
+    """
+
+    flushed = pyqtSignal(dict)  # stats() after every batch of renders
+
+    def __init__(self, delay_ms=DEFAULT_RENDER_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.pending = OrderedDict()  # id(canvas) -> (canvas, render)
+        self.requested = 0
+        self.rendered = 0
+        self.skipped = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def request(self, canvas, render=None):
+        """
+        Asks for canvas to be rendered at the end of the current window.
+
+        Parameters:
+            canvas (FigureCanvas): The canvas to render.
+            render (callable): Callback doing the render (default: canvas.draw_idle).
+        """
+        self.requested += 1
+        key = id(canvas)
+        if key in self.pending:
+            self.skipped += 1
+        self.pending[key] = (canvas, render)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def cancel(self, canvas):
+        """Drops a pending request, e.g. when its window is closed."""
+        if self.pending.pop(id(canvas), None) is not None:
+            self.skipped += 1
+
+    def flush(self):
+        """Runs every pending render now."""
+        self.timer.stop()
+        pending = self.pending
+        self.pending = OrderedDict()
+        for canvas, render in pending.values():
+            try:
+                if render is None:
+                    canvas.draw_idle()
+                else:
+                    render()
+                self.rendered += 1
+            except Exception as e:
+                print(f"RenderScheduler: render failed: {e}")
+        self.flushed.emit(self.stats())
+
+    def stats(self):
+        return {'requested': self.requested, 'rendered': self.rendered, 'skipped': self.skipped}
+
+
+_render_scheduler = None
+
+
+def get_render_scheduler():
+    """Returns the render scheduler shared by all canvases of the application."""
+    global _render_scheduler
+    if _render_scheduler is None:
+        _render_scheduler = RenderScheduler()
+    return _render_scheduler
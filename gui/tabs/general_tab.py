@@ -15,7 +15,11 @@ from gui.panels.selected_data_panel import SelectedDataPanel
 from gui.panels.plot_details_panels import ( AxisDetailsPanel, AdditionalTextPanel,
     CustomAnnotationsPanel, PlotVisualsPanel, PlotDetailsPanel, )
 
-from plots.plotting import plot_data
+from gui.plot.plot_config import PlotConfig
+from gui.plot.plot_tab_mixin import PlotTabMixin
+from gui.plot.render_scheduler import get_render_scheduler
+from gui.plot.blit_overlay import BlitOverlay
+from gui.utils.jobs import JobRunner, JobQueue, JobProgressWidget
 from gui.dialogs.latex_compatibility_dialog import LaTeXCompatibilityDialog 
 from utils import read_numeric_data
 
@@ -27,7 +31,6 @@ import os
 import numpy as np
 import matplotlib.text
 from gui.plot.expanded_plot_window import ExpandedPlotWindow 
-from gui.dialogs.save_plot_dialog import SavePlotDialog
 import seaborn as sns
 from matplotlib import style
 from matplotlib import font_manager as fm
@@ -48,7 +51,7 @@ def resource_path(relative_path):
 
 ################################################################
 
-class GeneralTab(QWidget):
+class GeneralTab(QWidget, PlotTabMixin):
 
     plot_updated = pyqtSignal()  # Define the custom signal
 
@@ -164,6 +167,29 @@ class GeneralTab(QWidget):
 
         plot_layout.addLayout(self.plot_buttons_layout)
 
+        # Progress and Cancel button for files loaded in the background
+        self.job_progress = JobProgressWidget()
+        plot_layout.addWidget(self.job_progress)
+        self.job_runner = JobRunner(self, self.job_progress)
+
+        # Exports render an offscreen copy of the figure, queued on their own worker thread
+        self.export_progress = JobProgressWidget()
+        self.export_progress.cancel_button.setToolTip("Cancel the queued exports.")
+        plot_layout.addWidget(self.export_progress)
+        self.export_queue = JobQueue(self, self.export_progress)
+
+        # Settings of the last update; each kind of change gets the cheapest redraw
+        self.datasets = None  # Datasets currently plotted (PlotDataset list)
+        self.plot_config = PlotConfig()
+        self.plot_config.data_changed.connect(self.on_plot_data_settings_changed)
+        self.plot_config.style_changed.connect(self.on_plot_style_changed)
+        self.plot_config.geometry_changed.connect(self.on_plot_geometry_changed)
+        self.plot_config.decoration_changed.connect(self.on_plot_decoration_changed)
+
+        # Redraws requested within one scheduler window are done once
+        self.render_scheduler = get_render_scheduler()
+        self.pending_plot_changes = set()
+
         plot_widget = QWidget()
         plot_widget.setLayout(plot_layout)
 
@@ -178,7 +204,7 @@ class GeneralTab(QWidget):
         self.text_items = []
         self.annotations = []
         self.annotation_mode = None  # None, 'point', 'vline', 'hline'
-        self.temp_annotation = None
+        self.preview_overlay = BlitOverlay(self.canvas)  # Annotation preview, blitted over the plot
         self.selected_lines = []
 
         # Connect signals and slots from the panels
@@ -292,42 +318,17 @@ class GeneralTab(QWidget):
 
     def update_plot(self):
         # Gather all parameters from panels
-        print("GeneralTab: update_plot called")  # Debugging statement
-
-        data_files = self.selected_data_panel.get_selected_files()
-        plot_details = self.plot_details_panel.get_plot_details()
-        axis_details = self.axis_details_panel.get_axis_details()
-        plot_visuals = self.plot_visuals_panel.get_plot_visuals()
-        # Call the plot_data function
-        plot_data(self.figure, data_files, plot_details, axis_details, plot_visuals, is_3d=(self.plot_type == "3D"))
-
-        # Re-add all existing text items
-        ax = self.figure.gca()
-        if self.plot_type == "2D":
-            for text_item in self.text_items:
-                ax.add_artist(text_item)
-
-        # Initialize annotations list for the main axes
-        if not hasattr(ax, 'annotations'):
-            ax.annotations = []
-
-        # Call the plot_data function
-        plot_data(
-            self.figure, data_files, plot_details,
-            axis_details, plot_visuals, is_3d=(self.plot_type == "3D")
+        # Only what changed since the last update is redone (see the on_plot_*_changed slots)
+        changes = self.plot_config.update(
+            plot_details=self.plot_details_panel.get_plot_details(),
+            axis_details=self.axis_details_panel.get_axis_details(),
+            plot_visuals=self.plot_visuals_panel.get_plot_visuals(),
+            data_files=self.selected_data_panel.get_selected_files(),
+            is_3d=(self.plot_type == "3D"),
         )
-
-        self.canvas.draw_idle()
-        #print("GeneralTab: plot_updated signal emitted") 
-        #self.plot_updated.emit()
-
-    def plot_2d(self):
-        self.plot_type = "2D"
-        self.update_plot()
-
-    def plot_3d(self):
-        self.plot_type = "3D"
-        self.update_plot()
+        if not changes:
+            # Nothing changed: reload, the files may have changed on disk (unchanged files come from the cache)
+            self.reload_plot_data()
 
     def show_data_structure(self):
         # Get the selected file names
@@ -457,29 +458,24 @@ class GeneralTab(QWidget):
 
 
     def on_mouse_move(self, event):
-        if event.inaxes is None:
-            return
-
-        ax = event.inaxes
-
         # Get annotation type from the main CustomAnnotationsPanel
         annotation_type = self.custom_annotations_panel.get_annotation_type()
 
-        if annotation_type not in ['Vertical Line', 'Horizontal Line']:
+        if event.inaxes is None or annotation_type not in ['Vertical Line', 'Horizontal Line', 'Annotation Point']:
+            self.preview_overlay.hide()
             return
 
-        if self.temp_annotation:
-            self.temp_annotation.remove()
-            self.temp_annotation = None
+        ax = event.inaxes
+        if event.xdata is None or event.ydata is None or getattr(ax, 'name', None) == '3d':
+            return
 
+        # Only the preview is redrawn, over the cached plot
         if annotation_type == 'Vertical Line':
-            if event.xdata is not None:
-                self.temp_annotation = ax.axvline(x=event.xdata, color='r', linestyle='--')
+            self.preview_overlay.show_vertical_line(ax, event.xdata, color='r', linestyle='--')
         elif annotation_type == 'Horizontal Line':
-            if event.ydata is not None:
-                self.temp_annotation = ax.axhline(y=event.ydata, color='b', linestyle='--')
-
-        self.canvas.draw_idle()
+            self.preview_overlay.show_horizontal_line(ax, event.ydata, color='b', linestyle='--')
+        else:
+            self.preview_overlay.show_crosshair(ax, event.xdata, event.ydata, color='gray', linestyle=':', linewidth=0.8)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
@@ -535,7 +531,7 @@ class GeneralTab(QWidget):
 
     def apply_changes(self):
         self.annotation_mode = None
-        self.temp_annotation = None
+        self.preview_overlay.hide()
         # Reset annotation type in the main CustomAnnotationsPanel
         self.custom_annotations_panel.annotation_type_combo.setCurrentText("None")
         self.canvas.draw_idle()
@@ -655,145 +651,6 @@ class GeneralTab(QWidget):
             # Handle other style parameters as needed
 
 
-    def apply_font_settings(self, font_family, title_font_size, axis_font_size):
-        for ax in self.figure.axes:
-            # Update titles
-            ax.title.set_fontsize(title_font_size)
-            ax.title.set_fontfamily(font_family)
-
-            # Update axis labels
-            ax.xaxis.label.set_fontsize(axis_font_size)
-            ax.xaxis.label.set_fontfamily(font_family)
-            ax.yaxis.label.set_fontsize(axis_font_size)
-            ax.yaxis.label.set_fontfamily(font_family)
-
-            # Update tick labels
-            for label in ax.get_xticklabels() + ax.get_yticklabels():
-                label.set_fontsize(axis_font_size)
-                label.set_fontfamily(font_family)
-
-            # Update legend
-            legend = ax.get_legend()
-            if legend:
-                for text in legend.get_texts():
-                    text.set_fontsize(axis_font_size)
-                    text.set_fontfamily(font_family)
-
-            # Update annotations
-            for child in ax.get_children():
-                if isinstance(child, matplotlib.text.Annotation):
-                    child.set_fontsize(axis_font_size)
-                    child.set_fontfamily(font_family)
-
-    def save_plot_with_options(self):
-        print("Save Plot button clicked.")
-        dialog = SavePlotDialog(self)
-        if dialog.exec_() == QDialog.Accepted:
-            width_pixels, height_pixels, quality, latex_options = dialog.get_values()
-            print(f"Saving plot with width: {width_pixels}px, height: {height_pixels}px, quality: {quality}")
-            self.save_plot(width_pixels, height_pixels, quality, latex_options)
-
-    def save_plot(self, width_pixels, height_pixels, quality, latex_options):
-        # Map quality to dpi
-        quality_dpi_mapping = {
-            "Low": 72,
-            "Medium": 150,
-            "High": 300,
-            "Very High": 600
-        }
-        dpi = quality_dpi_mapping.get(quality, 150)  # Default to 150 DPI if not found
-
-        # Convert pixels to inches (assuming 100 pixels = 1 inch for simplicity)
-        width_in = width_pixels / 100
-        height_in = height_pixels / 100
-
-        # Store original figure size, DPI, and rcParams
-        original_size = self.figure.get_size_inches()
-        original_dpi = self.figure.get_dpi()
-        original_rcparams = plt.rcParams.copy()
-
-        try:
-            # Apply LaTeX settings if provided
-            if latex_options:
-                selected_font = latex_options['font_family']
-                print(f"Selected font: '{selected_font}'")
-
-                # Set figure size based on LaTeX settings
-                width_unit = latex_options['width_unit']
-                figure_width = latex_options['figure_width']
-                if width_unit == 'inches':
-                    width_in_inches = figure_width
-                elif width_unit == 'cm':
-                    width_in_inches = figure_width / 2.54
-                elif width_unit == 'mm':
-                    width_in_inches = figure_width / 25.4
-                elif width_unit == 'pt':
-                    width_in_inches = figure_width / 72.27
-                elif width_unit == 'textwidth fraction':
-                    # Assume standard LaTeX textwidth is 6.5 inches
-                    width_in_inches = figure_width * 6.5
-                else:
-                    width_in_inches = figure_width  # Default to inches
-
-                # Set figure size and DPI
-                self.figure.set_size_inches(width_in_inches, self.figure.get_size_inches()[1])
-                self.figure.set_dpi(latex_options['dpi'])
-
-                # Update rcParams for font settings
-                plt.rcParams.update({
-                    'font.size': latex_options['base_font_size'],
-                    'font.family': selected_font,
-                })
-
-                if latex_options['use_latex']:
-                    plt.rcParams.update({
-                        'text.usetex': True,
-                        'font.family': selected_font,
-                    })
-                else:
-                    plt.rcParams.update({'text.usetex': False})
-
-                # Apply font settings to plot titles and axis labels
-                self.apply_font_settings(
-                    selected_font,
-                    latex_options['title_font_size'],
-                    latex_options['axis_font_size']
-                )
-            else:
-                # If no LaTeX settings, apply the user-specified image size and quality
-                self.figure.set_size_inches(width_in, height_in)
-                self.figure.set_dpi(dpi)
-
-            # Define the file path
-            options = QFileDialog.Options()
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, 
-                "Save Plot", 
-                "", 
-                "PNG Files (*.png);;JPEG Files (*.jpg);;All Files (*)", 
-                options=options
-            )
-            if file_path:
-                try:
-                    # Save the figure with the specified DPI
-                    self.figure.savefig(file_path, dpi=dpi)
-                    QMessageBox.information(self, "Save Successful", f"Plot saved successfully at:\n{file_path}")
-                    print(f"Plot saved successfully at: {file_path}")
-                except Exception as e:
-                    QMessageBox.warning(self, "Save Failed", f"Failed to save plot:\n{e}")
-                    print(f"Failed to save plot: {e}")
-
-        finally:
-            # Restore original figure size, DPI, and rcParams to keep the interactive plot unaffected
-            self.figure.set_size_inches(original_size)
-            self.figure.set_dpi(original_dpi)
-            plt.rcParams.update(original_rcparams)
-
-            # Redraw the canvas to reflect original settings
-            self.canvas.draw_idle()
-            print("Figure size, DPI, and rcParams restored to original after saving.")
-
-        
     def open_subplots_config_dialog(self):
         self.dialog = SubplotsConfigDialog(self)
         # Connect the apply_clicked signal
@@ -27,7 +27,12 @@ from gui.panels.plot_details_panels import ( AxisDetailsPanel, AdditionalTextPan
     CustomAnnotationsPanel, PlotVisualsPanel, PlotDetailsPanel, )
 
 
-from plots.plotting import plot_data
+from plots.plotting import PlotDataset
+from gui.plot.plot_config import PlotConfig, STYLE
+from gui.plot.plot_tab_mixin import PlotTabMixin
+from gui.plot.render_scheduler import get_render_scheduler
+from gui.plot.blit_overlay import BlitOverlay
+from gui.utils.jobs import JobRunner, JobQueue, JobProgressWidget
 from gui.dialogs.latex_compatibility_dialog import LaTeXCompatibilityDialog 
 from gui.utils.collapsible_sections import * 
 
@@ -38,15 +43,18 @@ import os
 import numpy as np
 import matplotlib.text
 from gui.plot.expanded_plot_window import ExpandedPlotWindow 
-from gui.dialogs.save_plot_dialog import SavePlotDialog
 import seaborn as sns
 from matplotlib import style
 from matplotlib import font_manager as fm
 import sys
 from fontTools.ttLib import TTFont
-from utils import read_numeric_data
+from utils import read_numeric_data, load_numeric_data, get_selected_columns, DataReadError
+from processing.missing_data import fill_missing
+from processing.baseline import estimate_baseline
+from processing.reference_store import ReferenceStore
 from functools import partial 
 import math
+import threading
 from scipy.signal import savgol_filter  # For Savitzky-Golay Filter
 import pywt  # For Wavelet Denoising
 from functools import partial
@@ -64,7 +72,7 @@ def resource_path(relative_path):
 ################################################################
 
 
-class NormalizationTab(QWidget):
+class NormalizationTab(QWidget, PlotTabMixin):
 
     plot_updated = pyqtSignal()  # Define the custom signal
 
@@ -181,6 +189,9 @@ class NormalizationTab(QWidget):
             panel.apply_button.clicked.connect(lambda checked, p=panel: self.apply_normalization(p))
             panel.save_button.clicked.connect(lambda checked, p=panel: self.save_normalized_data(p))
             panel.send_to_data_panel_button.clicked.connect(lambda checked, p=panel: self.send_normalized_data_to_data_panel(p))
+            if isinstance(panel, BaselineCorrectionWithFileNormalizationPanel):
+                panel.reference_files_added.connect(self.preload_reference_files)
+                panel.reference_file_removed.connect(self.on_reference_file_removed)
 
         # QGroupBox for Normalization Methods
         self.normalization_methods_groupbox = QGroupBox("Normalization Methods")
@@ -306,6 +317,33 @@ class NormalizationTab(QWidget):
 
         plot_layout.addLayout(self.plot_buttons_layout)
 
+        # Progress and Cancel button for files loaded and processed in the background
+        self.job_progress = JobProgressWidget()
+        plot_layout.addWidget(self.job_progress)
+        self.job_runner = JobRunner(self, self.job_progress)
+
+        # Exports render an offscreen copy of the figure, queued on their own worker thread
+        self.export_progress = JobProgressWidget()
+        self.export_progress.cancel_button.setToolTip("Cancel the queued exports.")
+        plot_layout.addWidget(self.export_progress)
+        self.export_queue = JobQueue(self, self.export_progress)
+        self._warning_sink = threading.local()  # Warnings raised on a worker thread, per job
+        self.reference_store = ReferenceStore()  # Reference files and their x-grids, kept across applies
+        self.reference_queue = JobQueue(self)  # Preloads reference files as they are added
+
+        # Settings of the last update; each kind of change gets the cheapest redraw
+        self.datasets = None  # Datasets currently plotted (PlotDataset list)
+        self.showing_processed_data = False  # Whether self.datasets holds normalized/corrected data
+        self.plot_config = PlotConfig()
+        self.plot_config.data_changed.connect(self.on_plot_data_settings_changed)
+        self.plot_config.style_changed.connect(self.on_plot_style_changed)
+        self.plot_config.geometry_changed.connect(self.on_plot_geometry_changed)
+        self.plot_config.decoration_changed.connect(self.on_plot_decoration_changed)
+
+        # Redraws requested within one scheduler window are done once
+        self.render_scheduler = get_render_scheduler()
+        self.pending_plot_changes = set()
+
         plot_widget = QWidget()
         plot_widget.setLayout(plot_layout)
         self.layout.addWidget(plot_widget, 0, 2)
@@ -319,7 +357,7 @@ class NormalizationTab(QWidget):
         self.text_items = []
         self.annotations = []
         self.annotation_mode = None  # None, 'point', 'vline', 'hline'
-        self.temp_annotation = None
+        self.preview_overlay = BlitOverlay(self.canvas)  # Annotation preview, blitted over the plot
         self.selected_lines = []
         self.normalized_data = {}  # To store normalized data
 
@@ -359,53 +397,62 @@ class NormalizationTab(QWidget):
 
         method = params['method']
 
-        # Process each data file
-        for file_path in data_files:
+        # Only the X/Y columns selected in the plot details are parsed
+        columns = self.get_selected_columns()
+        if columns is None:
+            return
+
+        # Number of values filled per file by the gap filling methods
+        filled_counts = {}
+
+        def summarize_filled():
+            if method not in CorrectMissingDataPanel.FILL_METHODS:
+                return None
+            total = sum(filled_counts.values())
+            if total == 0:
+                return None  # Nothing needed filling; no summary box
+            return f"Filled {total} missing value(s) in {sum(1 for count in filled_counts.values() if count)} file(s)."
+
+        # Process the files on a worker thread, one file at a time
+        def process_file(file_path):
             try:
-                # Use read_numeric_data to read the file
-                df, _, _ = self.read_numeric_data(file_path)
+                # Read the selected columns of the file
+                df = self.load_selected_columns(file_path, columns)
                 if df is None:
                     print(f"Skipping file {file_path} due to insufficient data.")
-                    continue
-
-                plot_details = self.plot_details_panel.get_plot_details()
-                x_col = int(plot_details['x_axis_col']) - 1
-                y_col = int(plot_details['y_axis_col']) - 1
-
-                # Validate column indices
-                if x_col >= df.shape[1] or y_col >= df.shape[1]:
-                    print(f"Selected columns do not exist in {file_path}.")
-                    QMessageBox.warning(self, "Invalid Columns", f"Selected columns do not exist in {file_path}.")
-                    continue
+                    return None
 
                 # Extract selected columns
-                x_series = df.iloc[:, x_col]
-                y_series = df.iloc[:, y_col]
+                x_series = df.iloc[:, 0]
+                y_series = df.iloc[:, 1]
 
                 # Handle missing data
                 if method == "Remove Rows with Missing Data":
-                    df_cleaned = df.dropna(subset=[df.columns[x_col], df.columns[y_col]])
-                elif method in ["Replace with Mean", "Replace with Median"]:
-                    # Use the helper function for localized replacement
-                    y_series = self.interpolate_missing_values(y_series, method=method.split()[-1].lower())
-                    df_cleaned = pd.DataFrame({df.columns[x_col]: x_series, df.columns[y_col]: y_series})
+                    df_cleaned = df.dropna()
+                elif method in CorrectMissingDataPanel.FILL_METHODS:
+                    # Fill the gaps from their neighbours (on a copy, the parsed data is cached)
+                    y_series, filled = self.interpolate_missing_values(
+                        y_series, method=CorrectMissingDataPanel.FILL_METHODS[method], x=x_series
+                    )
+                    filled_counts[file_path] = filled
+                    df_cleaned = pd.DataFrame({df.columns[0]: x_series, df.columns[1]: y_series})
                 
                 elif method == "Moving Average Smoothing":
                     window_size = params['window_size']
                     y_series = y_series.rolling(window=window_size, center=True).mean()
-                    df_cleaned = pd.DataFrame({df.columns[x_col]: x_series, df.columns[y_col]: y_series})
+                    df_cleaned = pd.DataFrame({df.columns[0]: x_series, df.columns[1]: y_series})
                 elif method == "Savitzky-Golay Filter":
                     window_size = params['window_size']
                     poly_order = params['poly_order']
                     y_filtered = self.savitzky_golay_filter(y_series.values, window_size, poly_order)
                     y_series = pd.Series(y_filtered)
-                    df_cleaned = pd.DataFrame({df.columns[x_col]: x_series, df.columns[y_col]: y_series})
+                    df_cleaned = pd.DataFrame({df.columns[0]: x_series, df.columns[1]: y_series})
                 elif method == "Wavelet Denoising":
                     wavelet = params['wavelet']
                     level = params['level']
                     y_filtered = self.wavelet_denoising(y_series.values, wavelet, level)
                     y_series = pd.Series(y_filtered[:len(y_series)])  # Ensure length matches
-                    df_cleaned = pd.DataFrame({df.columns[x_col]: x_series, df.columns[y_col]: y_series})
+                    df_cleaned = pd.DataFrame({df.columns[0]: x_series, df.columns[1]: y_series})
             
                 elif method == "Unit Converter":
                     x_formula = params['x_formula']
@@ -415,12 +462,12 @@ class NormalizationTab(QWidget):
                     x_series, y_series, x_formula, y_formula)
 
                     if x_series_converted is None or y_series_converted is None:
-                        # Error already shown
-                        continue
+                        # Error already reported
+                        return None
 
                     df_cleaned = pd.DataFrame({
-                        df.columns[x_col]: x_series_converted,
-                        df.columns[y_col]: y_series_converted
+                        df.columns[0]: x_series_converted,
+                        df.columns[1]: y_series_converted
                     })
                 
                 elif method == "Shift Baseline":
@@ -429,8 +476,8 @@ class NormalizationTab(QWidget):
                     shift_value = desired_baseline - y_min
                     y_series_shifted = y_series + shift_value
                     df_cleaned = pd.DataFrame({
-                        df.columns[x_col]: x_series,
-                        df.columns[y_col]: y_series_shifted
+                        df.columns[0]: x_series,
+                        df.columns[1]: y_series_shifted
                     })
 
                 elif method == "Data Cutting":
@@ -441,8 +488,8 @@ class NormalizationTab(QWidget):
                     df_cleaned = df[mask]
                     
                 else:
-                    QMessageBox.warning(self, "Unknown Method", f"Unknown method: {method}")
-                    continue
+                    self.warn("Unknown Method", f"Unknown method: {method}")
+                    return None
 
                 # Convert to numeric and drop NaNs resulting from conversion
                 x_series = pd.to_numeric(df_cleaned.iloc[:, 0], errors='coerce')
@@ -452,20 +499,18 @@ class NormalizationTab(QWidget):
                 y = y_series[valid_mask].values
 
                 if len(x) == 0 or len(y) == 0:
-                    QMessageBox.warning(self, "No Valid Data", f"No valid numeric data found after correction in {file_path}.")
-                    continue
+                    self.warn("No Valid Data", f"No valid numeric data found after correction in {file_path}.")
+                    return None
 
-                # Store corrected data
-                self.normalized_data[file_path] = (x, y)
+                # Corrected data
+                return x, y
 
             except Exception as e:
-                QMessageBox.warning(self, "Error", f"Error processing file {file_path}: {e}")
+                self.warn("Error", f"Error processing file {file_path}: {e}")
                 print(f"Error processing file {file_path}: {e}")
+                return None
 
-        # Update the plot with corrected data
-        self.update_normalized_plot()
-        panel.save_button.setEnabled(True)
-        panel.send_to_data_panel_button.setEnabled(True)
+        self.start_processing_job(data_files, process_file, panel, "Correcting files...", summarize=summarize_filled)
 
     
     def moving_average_smoothing(self, y, window_size):
@@ -513,7 +558,7 @@ class NormalizationTab(QWidget):
                 y_new = eval(y_formula, namespace, {'y': y})
                 y_new = pd.Series(y_new)
         except Exception as e:
-            QMessageBox.warning(self, "Formula Error", f"Error in applying formula:\n{e}")
+            self.warn("Formula Error", f"Error in applying formula:\n{e}")
             return None, None
 
         return x_new, y_new
@@ -530,7 +575,7 @@ class NormalizationTab(QWidget):
                 y_min = np.min(y)
                 y_max = np.max(y)
             if y_max - y_min == 0:
-                QMessageBox.warning(None, "Invalid Range", "Max and Min values are the same. Cannot normalize.")
+                self.warn("Invalid Range", "Max and Min values are the same. Cannot normalize.")
                 return np.zeros_like(y)
             return (y - y_min) / (y_max - y_min)
 
@@ -540,7 +585,7 @@ class NormalizationTab(QWidget):
             if std is None:
                 std = np.std(y)
             if std == 0:
-                QMessageBox.warning(None, "Invalid Standard Deviation", "Standard deviation is zero. Cannot normalize.")
+                self.warn("Invalid Standard Deviation", "Standard deviation is zero. Cannot normalize.")
                 return np.zeros_like(y)
             return (y - mean) / std
 
@@ -551,7 +596,7 @@ class NormalizationTab(QWidget):
             q_max = np.percentile(y, quantile_max)
             iqr = q_max - q_min
             if iqr == 0:
-                QMessageBox.warning(None, "Invalid IQR", "Interquartile range is zero. Cannot normalize.")
+                self.warn("Invalid IQR", "Interquartile range is zero. Cannot normalize.")
                 return np.zeros_like(y)
             return (y - median) / iqr
 
@@ -567,7 +612,7 @@ class NormalizationTab(QWidget):
             # Calculate AUC using the Trapezoidal Rule
             auc = np.trapz(y_sorted, dx=1)  # Assuming uniform spacing; adjust 'dx' as needed
             if auc == 0:
-                QMessageBox.warning(None, "Invalid AUC", "Area Under Curve is zero. Cannot normalize.")
+                self.warn("Invalid AUC", "Area Under Curve is zero. Cannot normalize.")
                 return np.zeros_like(y)
 
             # Normalize y
@@ -584,7 +629,7 @@ class NormalizationTab(QWidget):
             # Find indices within the interval
             interval_mask = (x_sorted >= interval_start) & (x_sorted <= interval_end)
             if not np.any(interval_mask):
-                QMessageBox.warning(None, "Invalid Interval", "No data points found within the specified interval.")
+                self.warn("Invalid Interval", "No data points found within the specified interval.")
                 return None
 
             x_interval = x_sorted[interval_mask]
@@ -593,7 +638,7 @@ class NormalizationTab(QWidget):
             # Calculate current AUC within the interval
             current_auc = np.trapz(y_interval, x_interval)
             if current_auc == 0:
-                QMessageBox.warning(None, "Invalid AUC", "Current AUC within the interval is zero. Cannot normalize.")
+                self.warn("Invalid AUC", "Current AUC within the interval is zero. Cannot normalize.")
                 return None
 
             # Calculate scaling factor
@@ -605,7 +650,7 @@ class NormalizationTab(QWidget):
         def total_intensity_normalization(y, desired_total_intensity=1.0):
             current_total = np.sum(y)
             if current_total == 0:
-                QMessageBox.warning(None, "Invalid Total Intensity", "Sum of Y-values is zero. Cannot normalize.")
+                self.warn("Invalid Total Intensity", "Sum of Y-values is zero. Cannot normalize.")
                 return np.zeros_like(y)
             scaling_factor = desired_total_intensity / current_total
             y_normalized = y * scaling_factor
@@ -623,7 +668,7 @@ class NormalizationTab(QWidget):
             - y_corrected: baseline-corrected Y-values
             """
             if len(y) != len(reference_y):
-                QMessageBox.warning(None, "Data Mismatch", "The length of data Y-values and reference Y-values do not match.")
+                self.warn("Data Mismatch", "The length of data Y-values and reference Y-values do not match.")
                 return None
             y_corrected = y - reference_y
             return y_corrected
@@ -633,44 +678,33 @@ class NormalizationTab(QWidget):
             ref_index = np.argmin(np.abs(x - reference_peak_x))
             y_ref = y[ref_index]
             if y_ref == 0:
-                QMessageBox.warning(None, "Invalid Reference Peak", "Reference Peak intensity is zero. Cannot normalize.")
+                self.warn("Invalid Reference Peak", "Reference Peak intensity is zero. Cannot normalize.")
                 return None
             scaling_factor = desired_reference_intensity / y_ref
             y_normalized = y * scaling_factor
             return y_normalized
         
-        def baseline_correction(y, x, lambda_=1e6, p=0.01, niter=10):
+        def baseline_correction(y, x, algorithm='als', **options):
             """
-            Performs baseline correction using Asymmetric Least Squares (ALS) method.
+            Performs baseline correction with one of the automatic baseline algorithms.
             
             Parameters:
             - y: numpy array of Y-values (1D)
             - x: numpy array of X-values
-            - lambda_: smoothing parameter (default: 1e6)
-            - p: asymmetry parameter (default: 0.01)
-            - niter: number of iterations (default: 10)
+            - algorithm: 'als', 'arpls', 'airpls', 'rolling_ball' or 'snip' (default: 'als')
+            - options: parameters of the algorithm (lambda_, p, niter, half_window, smooth_half_window;
+              see processing.baseline.estimate_baseline)
             
             Returns:
             - y_corrected: baseline-corrected Y-values
             - baseline: estimated baseline
             """
-            from scipy import sparse
-            from scipy.sparse.linalg import spsolve
-            
-            L = len(y)
-            D = sparse.diags([1, -2, 1], [0, -1, -2], shape=(L, L-2))
-            D = lambda_ * D.dot(D.transpose())  # Precompute D^T * D
-            w = np.ones(L)
-            
-            for i in range(niter):
-                W = sparse.diags(w, 0)
-                Z = W + D
-                try:
-                    z = spsolve(Z, w * y)
-                except Exception as e:
-                    QMessageBox.warning(None, "Baseline Correction Error", f"Error during baseline correction: {e}")
-                    return None, None
-                w = p * (y > z) + (1 - p) * (y < z)
+            try:
+                # The penalized algorithms share the banded penalty and its factorization across files
+                z = estimate_baseline(y, algorithm, **options)
+            except (ValueError, np.linalg.LinAlgError) as e:
+                self.warn("Baseline Correction Error", f"Error during baseline correction: {e}")
+                return None, None
             
             y_corrected = y - z
             return y_corrected, z
@@ -738,28 +772,39 @@ class NormalizationTab(QWidget):
             "Baseline Correction with File"
         ]
 
-        # Process each data file
-        for file_path in data_files:
+        # Only the X/Y columns selected in the plot details are parsed
+        columns = self.get_selected_columns()
+        if columns is None:
+            return
+
+        # The reference of Baseline Correction with File is loaded and validated once per apply,
+        # from the reference store, before the data files are processed
+        reference = {}
+
+        def prepare_reference():
+            try:
+                data = self.reference_store.get(params['reference_file_path'], columns)
+                reference['grid'] = self.reference_store.grid(data, params['grid_mode'], params['grid_step'])
+            except DataReadError as e:
+                self.warn("Reference Data Error", f"{os.path.basename(params['reference_file_path'])}: {e}")
+                return False
+            except ValueError as e:
+                self.warn("Alignment Error", f"Could not build the common grid of the reference file: {e}")
+                return False
+            return True
+
+        # Process the files on a worker thread, one file at a time
+        def process_file(file_path):
             try:
-                # Use read_numeric_data to read the file
-                df, _, _ = self.read_numeric_data(file_path)
+                # Read the selected columns of the file
+                df = self.load_selected_columns(file_path, columns)
                 if df is None:
                     print(f"Skipping file {file_path} due to insufficient data.")
-                    continue
-
-                plot_details = self.plot_details_panel.get_plot_details()
-                x_col = int(plot_details['x_axis_col']) - 1
-                y_col = int(plot_details['y_axis_col']) - 1
-
-                # Validate column indices
-                if x_col >= df.shape[1] or y_col >= df.shape[1]:
-                    print(f"Selected columns do not exist in {file_path}.")
-                    QMessageBox.warning(self, "Invalid Columns", f"Selected columns do not exist in {file_path}.")
-                    continue
+                    return None
 
                 # Extract selected columns and convert to numeric
-                x_series = pd.to_numeric(df.iloc[:, x_col], errors='coerce')
-                y_series = pd.to_numeric(df.iloc[:, y_col], errors='coerce')
+                x_series = pd.to_numeric(df.iloc[:, 0], errors='coerce')
+                y_series = pd.to_numeric(df.iloc[:, 1], errors='coerce')
 
                 # Drop rows where x or y is NaN
                 valid_mask = x_series.notna() & y_series.notna()
@@ -767,64 +812,35 @@ class NormalizationTab(QWidget):
                 y = y_series[valid_mask].values
 
                 if len(x) == 0 or len(y) == 0:
-                    QMessageBox.warning(self, "No Valid Data", f"No valid numeric data found in selected columns of {file_path}.")
-                    continue
+                    self.warn("No Valid Data", f"No valid numeric data found in selected columns of {file_path}.")
+                    return None
 
                 # Apply the appropriate normalization method
                 if panel.method_name == "Baseline Correction with File":
-                    # Handle Baseline Correction with File normalization
-                    reference_file_path = params.get('reference_file_path')
-                    if not reference_file_path or not os.path.isfile(reference_file_path):
-                        QMessageBox.warning(self, "Invalid Reference File", "Please select a valid reference file for baseline correction.")
-                        continue
-
-                    # Read reference data
-                    ref_df, _, _ = self.read_numeric_data(reference_file_path)
-                    if ref_df is None:
-                        QMessageBox.warning(self, "Reference Data Error", "Failed to read the reference data file or insufficient data.")
-                        continue
-
-                    # Extract selected columns from reference data
-                    ref_x_series = pd.to_numeric(ref_df.iloc[:, x_col], errors='coerce')
-                    ref_y_series = pd.to_numeric(ref_df.iloc[:, y_col], errors='coerce')
-
-                    # Drop rows where x or y is NaN in reference data
-                    ref_valid_mask = ref_x_series.notna() & ref_y_series.notna()
-                    ref_x = ref_x_series[ref_valid_mask].values
-                    ref_y = ref_y_series[ref_valid_mask].values
-
-                    if len(ref_x) == 0 or len(ref_y) == 0:
-                        QMessageBox.warning(self, "No Valid Reference Data", f"No valid numeric data found in selected columns of the reference file.")
-                        continue
-
-                    # Ensure that the x-values match
-                    if not np.array_equal(x, ref_x):
-                        QMessageBox.warning(self, "Data Mismatch", f"X-values in {file_path} do not match the reference file.")
-                        continue
+                    # Resample the data and the reference (loaded once by prepare_reference) onto
+                    # their common x-grid
+                    grid, y_aligned, ref_aligned = reference['grid'].align(x, y)
+                    if len(grid) == 0:
+                        self.warn("Data Mismatch", f"X-values in {file_path} do not overlap with the reference file.")
+                        return None
 
                     # Apply the baseline correction with file
-                    y_normalized = method_func(y, reference_y=ref_y)
+                    y_normalized = method_func(y_aligned, reference_y=ref_aligned)
                     if y_normalized is None:
-                        QMessageBox.warning(self, "Normalization Failed", f"Baseline Correction with File failed for file {file_path}.")
-                        continue
+                        self.warn("Normalization Failed", f"Baseline Correction with File failed for file {file_path}.")
+                        return None
 
-                    # Store normalized data
-                    self.normalized_data[file_path] = (x, y_normalized)
+                    # Normalized data
+                    return grid, y_normalized
 
                 elif panel.method_name == "Baseline Correction Normalization":
                     # Apply Baseline Correction Normalization
-                    y_corrected, baseline = method_func(
-                        y=y,
-                        x=x,
-                        lambda_=params.get('lambda_', 1e6),
-                        p=params.get('p', 0.01),
-                        niter=params.get('niter', 10)
-                    )
+                    y_corrected, baseline = method_func(y=y, x=x, **params)
                     if y_corrected is None:
-                        QMessageBox.warning(self, "Normalization Failed", f"Baseline Correction failed for file {file_path}.")
-                        continue
-                    # Store normalized data
-                    self.normalized_data[file_path] = (x, y_corrected)
+                        self.warn("Normalization Failed", f"Baseline Correction failed for file {file_path}.")
+                        return None
+                    # Normalized data
+                    return x, y_corrected
 
                 elif panel.method_name in methods_accepting_x:
                     # Methods that require 'x'
@@ -849,32 +865,103 @@ class NormalizationTab(QWidget):
                         y_normalized = method_func(y, x=x, **params)
 
                     if y_normalized is None:
-                        QMessageBox.warning(self, "Normalization Failed", f"Normalization failed for file {file_path}.")
-                        continue
-                    # Store normalized data
-                    self.normalized_data[file_path] = (x, y_normalized)
+                        self.warn("Normalization Failed", f"Normalization failed for file {file_path}.")
+                        return None
+                    # Normalized data
+                    return x, y_normalized
 
                 else:
                     # Methods that do not require 'x'
                     y_normalized = method_func(y, **params)
                     if y_normalized is None:
-                        QMessageBox.warning(self, "Normalization Failed", f"Normalization failed for file {file_path}.")
-                        continue
-                    # Store normalized data
-                    self.normalized_data[file_path] = (x, y_normalized)
+                        self.warn("Normalization Failed", f"Normalization failed for file {file_path}.")
+                        return None
+                    # Normalized data
+                    return x, y_normalized
 
             except TypeError as te:
-                QMessageBox.warning(self, "Type Error", f"Type error in file {file_path}: {te}")
+                self.warn("Type Error", f"Type error in file {file_path}: {te}")
                 print(f"Type error in file {file_path}: {te}")
+                return None
             except Exception as e:
-                QMessageBox.warning(self, "Error", f"Error normalizing file {file_path}: {e}")
+                self.warn("Error", f"Error normalizing file {file_path}: {e}")
                 print(f"Error normalizing file {file_path}: {e}")
+                return None
+
+        prepare = prepare_reference if panel.method_name in methods_requiring_reference_file else None
+        self.start_processing_job(data_files, process_file, panel, "Normalizing files...", prepare=prepare)
 
-        # Update the plot with normalized data
+    def start_processing_job(self, data_files, process_file, panel, message, summarize=None, prepare=None):
+        """
+        Runs process_file on every selected file on a worker thread. process_file returns (x, y)
+        or None for a file that was skipped. Warnings raised while processing are collected and
+        shown as one summary when the job ends, followed by the message of summarize() (optional).
+        prepare() runs once on the worker thread before the files (optional); when it returns
+        False no file is processed.
+        """
+        def run(job):
+            warnings = []
+            self._warning_sink.messages = warnings
+            try:
+                if prepare is not None and not prepare():
+                    return {}, warnings
+                results = job.map(data_files, process_file, describe=os.path.basename)
+            finally:
+                self._warning_sink.messages = None
+            processed = {file_path: result for file_path, result in zip(data_files, results) if result is not None}
+            return processed, warnings
+
+        self.job_runner.start(run, lambda result: self.on_processing_finished(result, panel, summarize), message=message)
+
+    def on_processing_finished(self, result, panel, summarize=None):
+        self.normalized_data, warnings = result
+        self.show_processing_warnings(warnings)
+        summary = summarize() if summarize else None
+        if summary:
+            QMessageBox.information(self, "Processing Complete", summary)
+
+        # Update the plot with the processed data
         self.update_normalized_plot()
         panel.save_button.setEnabled(True)
         panel.send_to_data_panel_button.setEnabled(True)
 
+    def warn(self, title, message):
+        """Shows a warning, or collects it for the summary when called from a processing job."""
+        messages = getattr(self._warning_sink, 'messages', None)
+        if messages is None:
+            QMessageBox.warning(self, title, message)
+        else:
+            messages.append((title, message))
+
+    def preload_reference_files(self, file_paths):
+        """Loads newly added reference files in the background, so the first apply finds them ready."""
+        try:
+            columns = get_selected_columns(self.plot_details_panel.get_plot_details())
+        except ValueError:
+            return  # Loaded on apply, once the columns are valid
+
+        def preload(job):
+            return self.reference_store.preload(file_paths, columns)
+
+        self.reference_queue.submit(preload, self.on_reference_files_preloaded, message="Loading reference files...")
+
+    def on_reference_files_preloaded(self, errors):
+        if errors:
+            summary = "\n".join(f"{os.path.basename(file_path)}: {message}" for file_path, message in errors)
+            QMessageBox.warning(self, "Reference Data Error", f"{len(errors)} reference file(s) could not be loaded:\n\n{summary}")
+
+    def on_reference_file_removed(self, file_path):
+        self.reference_store.invalidate(file_path)
+
+    def show_processing_warnings(self, warnings):
+        if not warnings:
+            return
+        if len(warnings) == 1:
+            QMessageBox.warning(self, *warnings[0])
+            return
+        summary = "\n".join(f"{title}: {message}" for title, message in warnings)
+        QMessageBox.warning(self, "Processing Warnings", f"{len(warnings)} warning(s) while processing:\n\n{summary}")
+
 
 
 
@@ -942,110 +1029,26 @@ class NormalizationTab(QWidget):
             QMessageBox.warning(self, "No Data Selected", "Please select data files to plot.")
             return
             
-        # Gather plot settings
-        plot_details = self.plot_details_panel.get_plot_details()
-        axis_details = self.axis_details_panel.get_axis_details()
-        plot_visuals = self.plot_visuals_panel.get_plot_visuals()
-
-        # Clear the figure
-        self.figure.clear()
-
-        # Prepare the axis
-        ax = self.figure.add_subplot(111, projection='3d' if self.plot_type == "3D" else None)
-
-        # Plot each normalized data
-        for i, (file_path, (x, y_normalized)) in enumerate(self.normalized_data.items()):
-            label = os.path.splitext(os.path.basename(file_path))[0] + "_normalized"
-            line_style = {'Solid': '-', 'Dashed': '--', 'Dash-Dot': '-.'}.get(plot_details['line_style'], '-')
-            point_style = {
-                "None": "",
-                "Circle": "o",
-                "Square": "s",
-                "Triangle Up": "^",
-                "Triangle Down": "v",
-                "Star": "*",
-                "Plus": "+",
-                "Cross": "x"
-            }.get(plot_details['point_style'], "")
-            line_thickness = int(plot_details['line_thickness'])
-
-            plot_type = plot_visuals['plot_type'].lower()
-
-            if plot_type == "line":
-                if self.plot_type == "3D":
-                    ax.plot(x, [i]*len(x), y_normalized, label=label, linestyle=line_style, marker=point_style, linewidth=line_thickness)
-                else:
-                    ax.plot(x, y_normalized, label=label, linestyle=line_style, marker=point_style, linewidth=line_thickness)
-            elif plot_type == "bar":
-                if self.plot_type == "3D":
-                    ax.bar(x, y_normalized, zs=i, zdir='y', label=label)
-                else:
-                    ax.bar(x, y_normalized, label=label)
-            elif plot_type == "scatter":
-                if self.plot_type == "3D":
-                    ax.scatter(x, [i]*len(x), y_normalized, label=label)
-                else:
-                    ax.scatter(x, y_normalized, label=label)
-            elif plot_type == "histogram":
-                if self.plot_type == "3D":
-                    ax.hist(y_normalized, zs=i, zdir='y', label=label)
-                else:
-                    ax.hist(y_normalized, label=label)
-            elif plot_type == "pie":
-                if self.plot_type == "3D":
-                    pass  # Pie chart in 3D doesn't make sense
-                else:
-                    ax.pie(y_normalized, labels=x)
-
-        # Set axis labels and title with adjusted padding
-        ax.set_title(axis_details['title'], fontsize=axis_details['title_font_size'], pad=20)
-        ax.set_xlabel(axis_details['x_label'], fontsize=axis_details['axis_font_size'])
-        if self.plot_type == "3D":
-            ax.set_ylabel('Offset', fontsize=axis_details['axis_font_size'])
-            ax.set_zlabel(axis_details['y_label'], fontsize=axis_details['axis_font_size'])
-        else:
-            ax.set_ylabel(axis_details['y_label'], fontsize=axis_details['axis_font_size'])
+        # The normalized data becomes the plotted model (shared with the expanded window)
+        self.datasets = [
+            PlotDataset(file_path, os.path.splitext(os.path.basename(file_path))[0] + "_normalized", x, y_normalized)
+            for file_path, (x, y_normalized) in self.normalized_data.items()
+        ]
+        self.showing_processed_data = True
 
-        # Apply axis ranges
+        # Gather plot settings without dispatching them: a column change must not reload the raw files here
+        self.plot_config.blockSignals(True)
         try:
-            x_min = float(axis_details['x_min']) if axis_details['x_min'] else None
-            x_max = float(axis_details['x_max']) if axis_details['x_max'] else None
-            y_min = float(axis_details['y_min']) if axis_details['y_min'] else None
-            y_max = float(axis_details['y_max']) if axis_details['y_max'] else None
-
-            if x_min is not None and x_max is not None:
-                ax.set_xlim(x_min, x_max)
-            if y_min is not None and y_max is not None:
-                ax.set_ylim(y_min, y_max)
-        except ValueError:
-            QMessageBox.warning(self, "Invalid Axis Range", "Please enter valid axis range values.")
-
-        # Apply scales
-        scale_type = plot_details['scale_type'].lower()
-        x_scale = 'linear'
-        y_scale = 'linear'
-        if 'logarithmic x-axis' in scale_type:
-            x_scale = 'log'
-        if 'logarithmic y-axis' in scale_type:
-            y_scale = 'log'
-        if 'logarithmic both axes' in scale_type:
-            x_scale = y_scale = 'log'
-        ax.set_xscale(x_scale)
-        ax.set_yscale(y_scale)
-
-        # Apply grid settings
-        if plot_visuals['add_grid']:
-            ax.grid(True)
-        if plot_visuals['add_sub_grid']:
-            ax.minorticks_on()
-            ax.grid(which='minor', linestyle=':', linewidth='0.5')
-
-        # Add legend if required
-        if plot_visuals['apply_legends']:
-            ax.legend(fontsize=axis_details['legend_font_size'])
-
-        # Redraw the figure
-        self.canvas.draw_idle()
+            self.plot_config.update(
+                plot_details=self.plot_details_panel.get_plot_details(),
+                axis_details=self.axis_details_panel.get_axis_details(),
+                plot_visuals=self.plot_visuals_panel.get_plot_visuals(),
+                is_3d=(self.plot_type == "3D"),
+            )
+        finally:
+            self.plot_config.blockSignals(False)
+        self.schedule_plot_update(STYLE)
+
     def send_normalized_data_to_data_panel(self, panel):
         if not self.normalized_data:
             QMessageBox.warning(self, "No Normalized Data", "Please apply normalization first.")
@@ -1148,47 +1151,21 @@ class NormalizationTab(QWidget):
                 section.toggle_button.setChecked(False)
         self.is_collapsing = False
 
-    def interpolate_missing_values(self, series, method='mean'):
+    def interpolate_missing_values(self, series, method='mean', x=None):
         """
-        Replace NaN values in a pandas Series with the mean or median of the nearest non-NaN values above and below.
+        Replace NaN values in a pandas Series from the nearest non-NaN values above and below.
 
         Parameters:
         - series (pd.Series): The data series with potential NaN values.
-        - method (str): 'mean' or 'median' specifying the replacement method.
+        - method (str): 'mean', 'median', 'linear' or 'nearest' (see processing.missing_data.fill_missing).
+        - x (pd.Series): X values used by 'linear' and 'nearest' (optional).
 
         Returns:
-        - pd.Series: The series with NaNs replaced.
+        - tuple: (pd.Series with NaNs replaced, number of values filled)
         """
-        for idx in series[series.isna()].index:
-            # Find the nearest non-NaN above
-            prev_idx = series[:idx].last_valid_index()
-            # Find the nearest non-NaN below
-            next_idx = series[idx + 1:].first_valid_index()
-
-            # Initialize replacement value
-            replacement = None
-
-            # Retrieve the values
-            if prev_idx is not None and next_idx is not None:
-                val_prev = series.loc[prev_idx]
-                val_next = series.loc[next_idx]
-                if method == 'mean':
-                    replacement = (val_prev + val_next) / 2
-                elif method == 'median':
-                    replacement = np.median([val_prev, val_next])
-            elif prev_idx is not None:
-                replacement = series.loc[prev_idx]
-            elif next_idx is not None:
-                replacement = series.loc[next_idx]
-
-            # Replace the NaN with the calculated replacement value
-            if replacement is not None:
-                series.at[idx] = replacement
-            else:
-                # If no non-NaN values are found, leave it as NaN or decide on a default value
-                pass  # You can choose to fill with 0 or another default value if desired
-
-        return series
+        x_values = pd.to_numeric(x, errors='coerce').to_numpy(dtype='float64') if x is not None else None
+        values, filled = fill_missing(pd.to_numeric(series, errors='coerce').to_numpy(), method, x_values)
+        return pd.Series(values, index=series.index, name=series.name), filled
 
                 
     def choose_files(self):
@@ -1291,32 +1268,22 @@ class NormalizationTab(QWidget):
 
     def update_plot(self):
         # Gather all parameters from panels
-        print("Parent tab: update_plot called")
-
-        data_files = self.selected_data_panel.get_selected_files()
-        plot_details = self.plot_details_panel.get_plot_details()
-        axis_details = self.axis_details_panel.get_axis_details()
-        plot_visuals = self.plot_visuals_panel.get_plot_visuals()
-        # Call the plot_data function
-        plot_data(self.figure, data_files, plot_details, axis_details, plot_visuals, is_3d=(self.plot_type == "3D"))
-
-        # Re-add all existing text items
-        ax = self.figure.gca()
-        if self.plot_type == "2D":
-            for text_item in self.text_items:
-                ax.add_artist(text_item)
-
-        self.canvas.draw_idle()
-        print("NormalizationTab: plot_updated signal emitted")  # Debugging statement
-        self.plot_updated.emit()
-
-    def plot_2d(self):
-        self.plot_type = "2D"
-        self.update_plot()
+        # Only what changed since the last update is redone (see the on_plot_*_changed slots)
+        changes = self.plot_config.update(
+            plot_details=self.plot_details_panel.get_plot_details(),
+            axis_details=self.axis_details_panel.get_axis_details(),
+            plot_visuals=self.plot_visuals_panel.get_plot_visuals(),
+            data_files=self.selected_data_panel.get_selected_files(),
+            is_3d=(self.plot_type == "3D"),
+        )
+        if not changes or (self.showing_processed_data and 'data' not in changes):
+            # Nothing changed (the files may have changed on disk, unchanged files come from the cache),
+            # or the plot shows processed data: reload the files
+            self.reload_plot_data()
 
-    def plot_3d(self):
-        self.plot_type = "3D"
-        self.update_plot()
+    def on_plot_data_loaded(self, result):
+        self.showing_processed_data = False
+        super().on_plot_data_loaded(result)
 
     def show_data_structure(self):
         # Get the selected file names
@@ -1434,19 +1401,17 @@ class NormalizationTab(QWidget):
             self.select_line(event)
 
     def on_mouse_move(self, event):
-        if self.plot_type != "2D" or not self.annotation_mode:
+        if self.plot_type != "2D" or not self.annotation_mode or event.inaxes is None:
+            self.preview_overlay.hide()
+            return
+        if event.xdata is None or event.ydata is None:
             return
 
-        if self.temp_annotation:
-            self.temp_annotation.remove()
-            self.temp_annotation = None
-
+        # Only the preview line is redrawn, over the cached plot
         if self.annotation_mode == 'vline':
-            self.temp_annotation = self.figure.gca().axvline(x=event.xdata, color='r', linestyle='--')
+            self.preview_overlay.show_vertical_line(event.inaxes, event.xdata, color='r', linestyle='--')
         elif self.annotation_mode == 'hline':
-            self.temp_annotation = self.figure.gca().axhline(y=event.ydata, color='b', linestyle='--')
-
-        self.canvas.draw_idle()
+            self.preview_overlay.show_horizontal_line(event.inaxes, event.ydata, color='b', linestyle='--')
 
     def add_annotation_point(self, event):
         if event.xdata is None or event.ydata is None:
@@ -1472,7 +1437,7 @@ class NormalizationTab(QWidget):
 
     def apply_changes(self):
         self.annotation_mode = None
-        self.temp_annotation = None
+        self.preview_overlay.hide()
         self.custom_annotations_panel.annotation_type_combo.setCurrentText("None")
         self.canvas.draw_idle()
 
@@ -1533,61 +1498,20 @@ class NormalizationTab(QWidget):
         self.selected_lines.clear()
         self.canvas.draw_idle()
 
-    def read_numeric_data(self, file_path):
-        return read_numeric_data(file_path, parent=self)
-    
-    def save_plot_with_options(self):
-        print("Save Plot button clicked.")
-        dialog = SavePlotDialog(self)
-        if dialog.exec_() == QDialog.Accepted:
-            width_pixels, height_pixels, quality = dialog.get_values()
-            print(f"Saving plot with width: {width_pixels}px, height: {height_pixels}px, quality: {quality}")
-            self.save_plot(width_pixels, height_pixels, quality)
-
-    def save_plot(self, width_pixels, height_pixels, quality):
-        # Map quality to dpi
-        quality_dpi_mapping = {
-            "Low": 72,
-            "Medium": 150,
-            "High": 300,
-            "Very High": 600
-        }
-        dpi = quality_dpi_mapping.get(quality, 150)  # Default to 150 DPI if not found
-        
-        # Keep the figure size in inches based on width and height
-        width_in = width_pixels / 100  # Convert pixels to "figure inches" (for matplotlib size control)
-        height_in = height_pixels / 100  # Same conversion
-        
-        # Store original figure size and DPI
-        original_size = self.figure.get_size_inches()
-        original_dpi = self.figure.get_dpi()
+    def read_numeric_data(self, file_path, columns=None):
+        return read_numeric_data(file_path, parent=self, columns=columns)
 
-        # Set the figure size to the new dimensions in inches
-        self.figure.set_size_inches(width_in, height_in)
-        
-        # Define the file path
-        options = QFileDialog.Options()
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, 
-            "Save Plot", 
-            "", 
-            "PNG Files (*.png);;JPEG Files (*.jpg);;All Files (*)", 
-            options=options
-        )
-        if file_path:
-            try:
-                # Save the figure with the specified DPI, affecting only the quality (sharpness) not the size
-                self.figure.savefig(file_path, dpi=dpi)
-                QMessageBox.information(self, "Save Successful", f"Plot saved successfully at:\n{file_path}")
-                print(f"Plot saved successfully at: {file_path}")
-            except Exception as e:
-                QMessageBox.warning(self, "Save Failed", f"Failed to save plot:\n{e}")
-                print(f"Failed to save plot: {e}")
-        
-        # Restore original figure size and DPI after saving to avoid affecting the interactive plot
-        self.figure.set_size_inches(original_size)
-        self.figure.set_dpi(original_dpi)
-        
-        # Redraw the canvas to make sure the interactive plot looks normal after saving
-        self.canvas.draw_idle()
-        print("Figure size and DPI restored to original after saving.")
+    def load_selected_columns(self, file_path, columns):
+        """Reads the selected columns of a file; safe to call from a processing job."""
+        try:
+            return load_numeric_data(file_path, columns=columns)
+        except DataReadError as e:
+            self.warn("Data Read Error", str(e))
+            return None
+
+    def get_selected_columns(self):
+        try:
+            return get_selected_columns(self.plot_details_panel.get_plot_details())
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Columns", "Please enter valid column numbers for the X and Y axes.")
+            return None
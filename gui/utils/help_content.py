@@ -669,6 +669,18 @@ BASELINE_CORRECTION_NORMALIZATION_HELP = f"""
             <li><strong>More Iterations (e.g., 15 to 30):</strong> Slower computation but can achieve a more refined and accurate baseline estimation. Useful for high-noise datasets or those with intricate baseline structures.</li>
             <li><strong>Default Value:</strong> Setting iterations to 10 is a standard choice that offers a reasonable trade-off between performance and accuracy.</li>
         </ul>
+
+        <h3>4. Algorithm</h3>
+        <p>
+            <strong>Description:</strong> The algorithm used to estimate the baseline. The iterations of the penalized algorithms stop early once the baseline has converged.
+        </p>
+        <ul>
+            <li><strong>ALS:</strong> Asymmetric Least Squares, using Lambda, Asymmetry and Iterations.</li>
+            <li><strong>arPLS:</strong> Asymmetrically reweighted Penalized Least Squares. Weights the points from the spread of the noise below the baseline, so it needs no asymmetry parameter and handles noisy data well. Uses Lambda and Iterations.</li>
+            <li><strong>airPLS:</strong> adaptive iteratively reweighted Penalized Least Squares. Points above the baseline are ignored and points below it weighted by their distance. Uses Lambda and Iterations.</li>
+            <li><strong>Rolling Ball:</strong> A morphological baseline: the lower envelope traced by a flat window of 2 &times; Half window + 1 points, optionally smoothed. Its cost does not depend on the window, so it suits very long traces. Choose a half window wider than the peaks.</li>
+            <li><strong>SNIP:</strong> Statistics-sensitive Non-linear Iterative Peak-clipping. Repeatedly clips the peaks with windows up to the half window; smoothing the data first reduces the bias towards the lowest noise. Choose a half window about the width of the widest peak.</li>
+        </ul>
     </div>
 </body>
 </html>
@@ -747,6 +759,15 @@ SUBTRACTION_NORMALIZATION_HELP = """
         <li>When you need to eliminate background or systematic errors that are common between the experiment and reference measurement.</li>
         <li>When the primary focus is on analyzing deviations or changes relative to a baseline condition.</li>
     </ul>
+    <h2>Reference Files:</h2>
+    <p>Several reference files (e.g. dark, blank, solvent) can be added to the list; the selected one is subtracted. Each reference is loaded once and kept, so switching between references or applying again does not read the files again. A reference that changes on disk is reloaded automatically.</p>
+    <h2>Common X Grid:</h2>
+    <p>The data and the reference do not need identical X values. Both are linearly interpolated onto a common grid, limited to the X range they share:</p>
+    <ul>
+        <li><strong>Reference X values:</strong> The X values of the reference file.</li>
+        <li><strong>Union of X values:</strong> Every X value of the data file and of the reference file.</li>
+        <li><strong>Uniform step:</strong> Evenly spaced X values over the reference range; the step defaults to the typical spacing of the reference.</li>
+    </ul>
 </body>
 </html>
 """
@@ -0,0 +1,297 @@
+# gui/utils/jobs.py
+
+import threading
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar, QPushButton, QMessageBox
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function to stop it at the next file boundary."""
+
+
+class JobSignals(QObject):
+    """
+    Signals of a Job. The object lives on the GUI thread, so slots connected to these
+    signals are always called on the GUI thread (queued connection).
+    """
+    progress = pyqtSignal(int, int, str)  # done, total, message
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    finished = pyqtSignal()
+
+
+class Job(QRunnable):
+    """
+    Runs fn(job) on a QThreadPool worker thread.
+
+    fn reports progress with job.report_progress(done, total, message) and should call
+    job.check_cancelled() (or test job.is_cancelled()) between units of work, e.g. between files.
+    Its return value is delivered with signals.result, an unexpected exception with signals.error.
+    """
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = JobSignals()
+        self._cancel_event = threading.Event()
+        # The JobRunner keeps the reference, so the pool must not delete the runnable
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def report_progress(self, done, total, message=""):
+        self.signals.progress.emit(done, total, message)
+
+    def map(self, items, fn, describe=str):
+        """
+        Applies fn to every item in order, reporting progress after each item and stopping
+        between items when the job is cancelled.
+
+        Returns:
+            list: The results of fn, in the order of items.
+        """
+        results = []
+        total = len(items)
+        for done, item in enumerate(items, start=1):
+            self.check_cancelled()
+            results.append(fn(item))
+            self.report_progress(done, total, describe(item))
+        return results
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            self.check_cancelled()  # Cancelled while still queued: fn never starts
+            result = self.fn(self)
+        except JobCancelled:
+            self.signals.cancelled.emit()
+        except Exception:
+            error = traceback.format_exc()
+            print(f"Background job failed:\n{error}")
+            self.signals.error.emit(error)
+        else:
+            if self.is_cancelled():
+                self.signals.cancelled.emit()
+            else:
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+class JobProgressWidget(QWidget):
+    """Progress bar, status text and Cancel button for the job currently run by a JobRunner."""
+
+    cancel_requested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.status_label = QLabel("")
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(True)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setToolTip("Stop processing after the current file.")
+        self.cancel_button.clicked.connect(self.cancel_requested.emit)
+
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.progress_bar, 1)
+        layout.addWidget(self.cancel_button)
+        self.hide()
+
+    def start(self, message=""):
+        self.status_label.setText(message)
+        self.progress_bar.setRange(0, 0)  # Busy indicator until the first file is done
+        self.cancel_button.setEnabled(True)
+        self.show()
+
+    def update_progress(self, done, total, message=""):
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(done)
+        self.progress_bar.setFormat(f"{done}/{total}")
+        if message:
+            self.status_label.setText(message)
+
+    def stop(self):
+        self.hide()
+
+
+class JobRunner(QObject):
+    """
+    Runs one background job at a time on behalf of a widget.
+
+    Starting a new job cancels the previous one; results of a job that is no longer current
+    are dropped so a slow, stale job can never overwrite newer results.
+    """
+
+    def __init__(self, parent_widget, progress_widget=None, thread_pool=None):
+        super().__init__(parent_widget)
+        self.parent_widget = parent_widget
+        self.progress_widget = progress_widget
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.current_job = None
+        self._running_jobs = set()  # Cancelled jobs stay referenced until their thread is done
+        if self.progress_widget is not None:
+            self.progress_widget.cancel_requested.connect(self.cancel)
+
+    def is_running(self):
+        return self.current_job is not None
+
+    def start(self, fn, on_result, message="", on_error=None, on_finished=None):
+        """
+        Runs fn(job) in the background.
+
+        Parameters:
+            fn (callable): Work function, called on a worker thread with the Job as argument.
+            on_result (callable): Called on the GUI thread with the return value of fn.
+            message (str): Initial status text.
+            on_error (callable): Called on the GUI thread with the traceback text (default: message box).
+            on_finished (callable): Called on the GUI thread when the job ends, whatever the outcome.
+
+        Returns:
+            Job: The started job.
+        """
+        self.cancel()
+        job = Job(fn)
+        self.current_job = job
+        self._running_jobs.add(job)
+
+        job.signals.result.connect(lambda result: self._on_result(job, on_result, result))
+        job.signals.error.connect(lambda error: self._on_error(job, on_error, error))
+        job.signals.finished.connect(lambda: self._on_finished(job, on_finished))
+        if self.progress_widget is not None:
+            job.signals.progress.connect(lambda done, total, text: self._on_progress(job, done, total, text))
+            self.progress_widget.start(message)
+
+        self.thread_pool.start(job)
+        return job
+
+    def cancel(self):
+        if self.current_job is not None:
+            self.current_job.cancel()
+            self.current_job = None
+            if self.progress_widget is not None:
+                self.progress_widget.stop()
+
+    def _on_progress(self, job, done, total, text):
+        if job is self.current_job:
+            self.progress_widget.update_progress(done, total, text)
+
+    def _on_result(self, job, on_result, result):
+        if job is self.current_job:
+            on_result(result)
+
+    def _on_error(self, job, on_error, error):
+        if job is not self.current_job:
+            return
+        if on_error is not None:
+            on_error(error)
+        else:
+            QMessageBox.critical(self.parent_widget, "Error", f"Processing failed:\n{error.strip().splitlines()[-1]}")
+
+    def _on_finished(self, job, on_finished):
+        self._running_jobs.discard(job)
+        if job is not self.current_job:
+            return
+        self.current_job = None
+        if self.progress_widget is not None:
+            self.progress_widget.stop()
+        if on_finished is not None:
+            on_finished()
+
+
+class JobQueue(QObject):
+    """
+    Runs background jobs one after the other, in the order they were submitted (e.g. exports).
+    Unlike JobRunner, submitting a job never cancels the others and every result is delivered.
+    """
+
+    def __init__(self, parent_widget, progress_widget=None, max_concurrent=1):
+        super().__init__(parent_widget)
+        self.parent_widget = parent_widget
+        self.progress_widget = progress_widget
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_concurrent)
+        self.jobs = []  # Queued and running jobs, oldest first
+        self.messages = {}  # job -> status text
+        if self.progress_widget is not None:
+            self.progress_widget.cancel_requested.connect(self.cancel_all)
+
+    def pending_count(self):
+        return len(self.jobs)
+
+    def submit(self, fn, on_result, message="", on_error=None):
+        """
+        Queues fn(job) to run in the background after the jobs already submitted.
+
+        Parameters:
+            fn (callable): Work function, called on a worker thread with the Job as argument.
+            on_result (callable): Called on the GUI thread with the return value of fn.
+            message (str): Status text while the job runs.
+            on_error (callable): Called on the GUI thread with the traceback text (default: message box).
+
+        Returns:
+            Job: The queued job.
+        """
+        job = Job(fn)
+        self.jobs.append(job)
+        self.messages[job] = message
+
+        job.signals.result.connect(on_result)
+        job.signals.error.connect(lambda error: self._on_error(on_error, error))
+        job.signals.finished.connect(lambda: self._on_finished(job))
+        if self.progress_widget is not None:
+            job.signals.progress.connect(lambda done, total, text: self._on_progress(job, done, total, text))
+            if len(self.jobs) == 1:
+                self.progress_widget.start(self._status(job))
+            else:
+                self.progress_widget.status_label.setText(self._status(self.jobs[0]))
+
+        self.thread_pool.start(job)
+        return job
+
+    def cancel_all(self):
+        """Cancels the running job at its next check and every queued job before it starts."""
+        for job in self.jobs:
+            job.cancel()
+        if self.progress_widget is not None:
+            self.progress_widget.stop()
+
+    def _status(self, job, text=""):
+        status = f"{self.messages.get(job, '')} {text}".strip()
+        queued = len(self.jobs) - 1
+        return f"{status} ({queued} more queued)" if queued > 0 else status
+
+    def _on_progress(self, job, done, total, text):
+        if self.jobs and job is self.jobs[0] and not job.is_cancelled():
+            self.progress_widget.update_progress(done, total)
+            self.progress_widget.status_label.setText(self._status(job, f"- {text}" if text else ""))
+
+    def _on_error(self, on_error, error):
+        if on_error is not None:
+            on_error(error)
+        else:
+            QMessageBox.critical(self.parent_widget, "Error", f"Background task failed:\n{error.strip().splitlines()[-1]}")
+
+    def _on_finished(self, job):
+        if job in self.jobs:
+            self.jobs.remove(job)
+        self.messages.pop(job, None)
+        if self.progress_widget is None:
+            return
+        if self.jobs and not self.jobs[0].is_cancelled():
+            self.progress_widget.start(self._status(self.jobs[0]))
+        else:
+            self.progress_widget.stop()
@@ -0,0 +1,79 @@
+# plots/artist_registry.py
+
+import numpy as np
+from matplotlib import rcParams
+
+
+def same_data(old, new):
+    """
+    Whether two arrays hold the same values. Arrays served from the dataset cache share their
+    buffer, so the common case is decided without comparing the values.
+    """
+    if old is new:
+        return True
+    old = np.asarray(old)
+    new = np.asarray(new)
+    if old.shape != new.shape or old.dtype != new.dtype:
+        return False
+    # The registry keeps the old array alive, so an equal buffer address means the same data
+    if old.__array_interface__['data'][0] == new.__array_interface__['data'][0] and old.strides == new.strides:
+        return True
+    return np.array_equal(old, new, equal_nan=new.dtype.kind == 'f')
+
+
+class ArtistRegistry:
+    """
+    The axes drawn by render_datasets and the artist of every dataset on it, keyed by the
+    dataset key. It lets the next render mutate the existing artists instead of clearing the
+    figure, as long as the layout (signature) of the plot did not change.
+    """
+
+    def __init__(self, ax, signature):
+        self.ax = ax
+        self.signature = signature
+        self.entries = {}  # dataset key -> {'artist', 'x', 'y'} (x/y at full resolution)
+        self.axis_range = None  # (x_min, x_max, y_min, y_max) last applied from the axis details
+        # Colors of the axes' color cycle (the style is applied before the axes is built), so an
+        # update can color the i-th line like a full render would
+        self.colors = list(rcParams['axes.prop_cycle'].by_key().get('color', []))
+
+    def can_update(self, figure, signature):
+        """True when the registered axes are still on the figure and the layout is unchanged."""
+        return (
+            self.signature == signature
+            and self.ax.figure is figure
+            and self.ax in figure.axes
+        )
+
+    def add(self, key, artist, x, y):
+        self.entries[key] = {'artist': artist, 'x': x, 'y': y}
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def update_datalim(self):
+        """
+        Extends the data limits of the axes to the full-resolution data, which decimated or
+        zoomed-in lines no longer show completely.
+        """
+        for entry in self.entries.values():
+            x = np.asarray(entry['x'], dtype='float64')
+            y = np.asarray(entry['y'], dtype='float64')
+            if len(x) == 0 or np.isnan(x).all() or np.isnan(y).all():
+                continue
+            self.ax.update_datalim([(np.nanmin(x), np.nanmin(y)), (np.nanmax(x), np.nanmax(y))])
+
+    def remove_missing(self, keys):
+        """
+        Removes the artists of datasets that are no longer plotted.
+
+        Returns:
+            list: The removed artists.
+        """
+        keys = set(keys)
+        removed = []
+        for key in [key for key in self.entries if key not in keys]:
+            artist = self.entries.pop(key)['artist']
+            artist.remove()
+            removed.append(artist)
+        return removed
@@ -0,0 +1,78 @@
+# plots/bulk_overlay.py
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+
+from plots.decimation import decimate_for_axes, DEFAULT_POINT_BUDGET
+
+DEFAULT_OVERLAY_COLORMAP = 'viridis'
+
+# Up to this many series, the colorbar ticks show the file names
+MAX_LABELLED_SERIES = 12
+
+
+def series_colors(count, colormap=DEFAULT_OVERLAY_COLORMAP):
+    """One RGBA color per series, spread evenly over the colormap."""
+    cmap = plt.get_cmap(colormap)
+    return cmap(np.linspace(0, 1, count)) if count > 1 else cmap([0.0])
+
+
+def draw_bulk_overlay(ax, datasets, line_style='-', line_thickness=1, colormap=DEFAULT_OVERLAY_COLORMAP,
+                      decimate=False, point_budget=DEFAULT_POINT_BUDGET, x_log=False, y_log=False):
+    """
+    Draws every dataset as one polyline of a single LineCollection, colored along a colormap.
+    One artist means one draw call, however many files are overlaid.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes to draw on.
+        datasets (list): List of PlotDataset, drawn in order.
+        line_style (str): Matplotlib line style shared by all series.
+        line_thickness (float): Line width shared by all series.
+        colormap (str): Name of the colormap the series colors are taken from.
+        decimate (bool): Whether to reduce every series to the resolution of the axes.
+        point_budget (int): Maximum number of points drawn per series.
+        x_log (bool): Whether the x-axis uses a logarithmic scale.
+        y_log (bool): Whether the y-axis uses a logarithmic scale.
+
+    Returns:
+        LineCollection: The collection, or None when there is nothing to draw.
+    """
+    if not datasets:
+        return None
+
+    segments = []
+    for dataset in datasets:
+        x, y = dataset.x, dataset.y
+        if decimate:
+            x, y = decimate_for_axes(ax, x, y, "line", point_budget, x_log, y_log)
+        segments.append(np.column_stack((np.asarray(x, dtype='float64'), np.asarray(y, dtype='float64'))))
+
+    collection = LineCollection(
+        segments, colors=series_colors(len(datasets), colormap),
+        linewidths=line_thickness, linestyles=line_style,
+        label=datasets[0].label if len(datasets) == 1 else f"{len(datasets)} series",
+    )
+    ax.add_collection(collection, autolim=True)
+    ax.autoscale_view()
+    return collection
+
+
+def add_series_colorbar(figure, ax, datasets, colormap=DEFAULT_OVERLAY_COLORMAP):
+    """
+    Adds a colorbar mapping the colors of a bulk overlay back to the series. With a few series
+    the ticks carry the file names, otherwise the series number.
+    """
+    count = len(datasets)
+    if count < 2:
+        return None
+    mappable = ScalarMappable(norm=Normalize(0, count - 1), cmap=plt.get_cmap(colormap))
+    colorbar = figure.colorbar(mappable, ax=ax, pad=0.02)
+    if count <= MAX_LABELLED_SERIES:
+        colorbar.set_ticks(np.arange(count))
+        colorbar.set_ticklabels([dataset.label for dataset in datasets])
+    else:
+        colorbar.set_label("Series #")
+    return colorbar
@@ -0,0 +1,299 @@
+# plots/decimation.py
+
+import numpy as np
+
+# Default number of points drawn per trace when decimation is enabled
+DEFAULT_POINT_BUDGET = 8000
+
+# Points kept per pixel column by the min/max decimation (first, min, max, last)
+POINTS_PER_BIN = 4
+
+
+def is_monotonic(x):
+    """Returns 1 for non-decreasing x, -1 for non-increasing x and 0 otherwise."""
+    if len(x) < 2:
+        return 1
+    steps = np.diff(x)
+    if np.all(steps >= 0):
+        return 1
+    if np.all(steps <= 0):
+        return -1
+    return 0
+
+
+def _bin_starts(x, n_bins, x_log=False):
+    """
+    Start index of every bin. Sorted x is split into equal-width bins in (log) x, anything
+    else into equal-count bins by index. Empty bins are dropped.
+    """
+    n = len(x)
+    if is_monotonic(x) == 1 and x[-1] > x[0] and np.isfinite(x[0]) and np.isfinite(x[-1]):
+        if x_log and x[0] > 0:
+            edges = np.geomspace(x[0], x[-1], n_bins + 1)[1:-1]
+        else:
+            edges = np.linspace(x[0], x[-1], n_bins + 1)[1:-1]
+        starts = np.concatenate(([0], np.searchsorted(x, edges, side='left')))
+    else:
+        starts = (np.arange(n_bins) * n) // n_bins
+    return np.unique(starts)
+
+
+def _first_match_per_bin(values, targets, bin_ids):
+    """Index of the first element of every bin whose value equals the bin's target."""
+    hits = np.flatnonzero(values == targets[bin_ids])
+    _, first = np.unique(bin_ids[hits], return_index=True)
+    return hits[first]
+
+
+def minmax_decimation_indices(x, y, n_bins, x_log=False):
+    """
+    Indices of the points kept by min/max decimation: the first, last, minimum and maximum
+    point of every bin, in their original order. Every peak survives, so the decimated line
+    looks the same as the full line at a resolution of n_bins pixel columns.
+
+    Parameters:
+        x (np.ndarray): X-values.
+        y (np.ndarray): Y-values.
+        n_bins (int): Number of bins, normally the width of the axes in pixels.
+        x_log (bool): Whether the x-axis uses a logarithmic scale.
+
+    Returns:
+        np.ndarray: Sorted indices into x and y.
+    """
+    n = len(y)
+    if n_bins <= 0 or n <= POINTS_PER_BIN * n_bins:
+        return np.arange(n)
+
+    x = np.asarray(x)
+    y = np.asarray(y, dtype='float64')
+
+    # Work on ascending x so the bins can be found with a binary search
+    direction = is_monotonic(x)
+    if direction == -1:
+        indices = minmax_decimation_indices(x[::-1], y[::-1], n_bins, x_log)
+        return (n - 1 - indices)[::-1]
+
+    starts = _bin_starts(x, n_bins, x_log)
+    ends = np.append(starts[1:], n)
+    bin_ids = np.repeat(np.arange(len(starts)), ends - starts)
+
+    # NaNs never win a min/max comparison; an all-NaN bin keeps its first point (the gap)
+    nan_mask = np.isnan(y)
+    y_low = np.where(nan_mask, np.inf, y)
+    y_high = np.where(nan_mask, -np.inf, y)
+    min_idx = _first_match_per_bin(y_low, np.minimum.reduceat(y_low, starts), bin_ids)
+    max_idx = _first_match_per_bin(y_high, np.maximum.reduceat(y_high, starts), bin_ids)
+
+    kept = [starts, ends - 1, min_idx, max_idx]
+    if nan_mask.any():
+        # Keep one NaN per bin so gaps in the trace stay visible
+        nan_idx = np.flatnonzero(nan_mask)
+        _, first = np.unique(bin_ids[nan_idx], return_index=True)
+        kept.append(nan_idx[first])
+    return np.unique(np.concatenate(kept))
+
+
+def decimate_line(x, y, n_bins, x_log=False):
+    """Min/max decimation of a line trace. Returns the decimated (x, y)."""
+    indices = minmax_decimation_indices(x, y, n_bins, x_log)
+    if len(indices) == len(y):
+        return x, y
+    return np.asarray(x)[indices], np.asarray(y)[indices]
+
+
+def _to_grid(values, size, log=False):
+    """Integer pixel coordinate of every value on a grid of the given size."""
+    values = np.asarray(values, dtype='float64')
+    if log:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.log10(values)
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return np.zeros(len(values), dtype=np.int64)
+    low, high = finite.min(), finite.max()
+    span = high - low if high > low else 1.0
+    grid = np.floor((values - low) / span * (size - 1))
+    return np.nan_to_num(grid, nan=-1, posinf=-1, neginf=-1).astype(np.int64)
+
+
+def decimate_scatter(x, y, width, height, x_log=False, y_log=False, point_budget=None):
+    """
+    Keeps one point per pixel of a width x height grid spanning the data. Points that would be
+    drawn on top of each other are dropped; the first point of every pixel is kept and the
+    original order is preserved.
+
+    With a point_budget, the grid is coarsened to cells of several pixels until no more than
+    point_budget cells are occupied, so dense clouds never keep more points than the budget.
+    """
+    n = len(y)
+    if n <= width * height and (point_budget is None or n <= point_budget):
+        return x, y
+    gx = _to_grid(x, width, x_log)
+    gy = _to_grid(y, height, y_log)
+    cell_size = 1
+    while True:
+        # Non-finite coordinates (-1) share the cells of the first row/column
+        rows = height // cell_size + 2
+        cells = (gx // cell_size + 1) * rows + (gy // cell_size + 1)
+        occupied = np.count_nonzero(np.bincount(cells))
+        if point_budget is None or occupied <= point_budget or cell_size >= max(width, height):
+            break
+        # The occupied cells shrink about quadratically with the cell size
+        cell_size = max(cell_size + 1, int(np.ceil(cell_size * np.sqrt(occupied / point_budget))))
+    _, first = np.unique(cells, return_index=True)
+    first.sort()
+    return np.asarray(x)[first], np.asarray(y)[first]
+
+
+def axes_pixel_size(ax):
+    """Width and height of the axes in display pixels."""
+    extent = ax.get_window_extent()
+    return max(1, int(extent.width)), max(1, int(extent.height))
+
+
+def decimate_for_axes(ax, x, y, plot_type, point_budget=DEFAULT_POINT_BUDGET, x_log=False, y_log=False):
+    """
+    Reduces a trace to what can actually be seen on the axes.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes the trace is drawn on.
+        x (np.ndarray): X-values.
+        y (np.ndarray): Y-values.
+        plot_type (str): 'line' or 'scatter'; other plot types are returned unchanged.
+        point_budget (int): Maximum number of points drawn per trace.
+        x_log (bool): Whether the x-axis uses a logarithmic scale.
+        y_log (bool): Whether the y-axis uses a logarithmic scale.
+
+    Returns:
+        tuple: The (x, y) to draw.
+    """
+    if len(y) <= point_budget:
+        return x, y
+    width, height = axes_pixel_size(ax)
+    if plot_type == "line":
+        n_bins = max(1, min(width, point_budget // POINTS_PER_BIN))
+        return decimate_line(x, y, n_bins, x_log)
+    if plot_type == "scatter":
+        return decimate_scatter(x, y, width, height, x_log, y_log, point_budget)
+    return x, y
+
+
+class LevelOfDetail:
+    """
+    Keeps the full-resolution arrays of the decimated traces of one axes and re-decimates the
+    visible window whenever the limits change (NavigationToolbar pan/zoom, Home, Back/Forward),
+    so the number of drawn points stays the same however far you zoom in.
+    """
+
+    def __init__(self, ax, point_budget=DEFAULT_POINT_BUDGET, x_log=False, y_log=False):
+        self.ax = ax
+        self.point_budget = point_budget
+        self.x_log = x_log
+        self.y_log = y_log
+        self.traces = []
+        # Matplotlib only keeps weak references to bound methods; the axes keeps this object alive
+        ax.callbacks.connect('xlim_changed', self.on_limits_changed)
+        ax.callbacks.connect('ylim_changed', self.on_limits_changed)
+        # A resized canvas has a different number of pixel columns
+        ax.figure.canvas.mpl_connect('resize_event', self.on_resize)
+
+    def track(self, artist, x, y, plot_type):
+        """
+        Registers a drawn trace with its full-resolution data.
+
+        Returns:
+            bool: False when the trace cannot be re-decimated (line with unsorted x).
+        """
+        x = np.asarray(x)
+        y = np.asarray(y)
+        if plot_type == "line":
+            direction = is_monotonic(x)
+            if direction == 0:
+                return False
+            if direction == -1:
+                x, y = x[::-1], y[::-1]
+        elif plot_type != "scatter":
+            return False
+        self.traces.append({'artist': artist, 'x': x, 'y': y, 'plot_type': plot_type, 'view': None})
+        return True
+
+    def track_collection(self, collection, series):
+        """
+        Registers a LineCollection holding one polyline per (x, y) pair of series (bulk overlay).
+        Series with unsorted x keep the polyline they were drawn with.
+        """
+        prepared = []
+        for x, y in series:
+            x = np.asarray(x)
+            y = np.asarray(y)
+            direction = is_monotonic(x)
+            if direction == -1:
+                x, y = x[::-1], y[::-1]
+            prepared.append((x, y, direction != 0))
+        self.traces.append({'artist': collection, 'series': prepared, 'plot_type': "overlay", 'view': None})
+
+    def untrack(self, artist):
+        """Forgets a trace that was removed or whose data is replaced."""
+        self.traces = [trace for trace in self.traces if trace['artist'] is not artist]
+
+    def on_resize(self, event):
+        if self.ax.figure is not None and self.ax in self.ax.figure.axes:
+            self.on_limits_changed(self.ax)
+
+    def refresh(self):
+        """Re-decimates every trace, e.g. for a copy of the figure drawn at another size."""
+        for trace in self.traces:
+            trace['view'] = None
+        self.on_limits_changed(self.ax)
+
+    def on_limits_changed(self, ax):
+        x_low, x_high = sorted(ax.get_xlim())
+        y_low, y_high = sorted(ax.get_ylim())
+        width, height = axes_pixel_size(ax)
+        for trace in self.traces:
+            if trace['plot_type'] == "line":
+                self._update_line(trace, x_low, x_high, width)
+            elif trace['plot_type'] == "overlay":
+                self._update_overlay(trace, x_low, x_high, width)
+            else:
+                self._update_scatter(trace, x_low, x_high, y_low, y_high, width, height)
+
+    def _update_line(self, trace, x_low, x_high, width):
+        x = trace['x']
+        y = trace['y']
+        # One extra point on each side so the line runs to the edge of the axes
+        start = max(int(np.searchsorted(x, x_low, side='left')) - 1, 0)
+        stop = min(int(np.searchsorted(x, x_high, side='right')) + 1, len(x))
+        view = (start, stop, width)
+        if view == trace['view']:
+            return  # Only the y-limits changed
+        trace['view'] = view
+        n_bins = max(1, min(width, self.point_budget // POINTS_PER_BIN))
+        trace['artist'].set_data(*decimate_line(x[start:stop], y[start:stop], n_bins, self.x_log))
+
+    def _update_overlay(self, trace, x_low, x_high, width):
+        view = (x_low, x_high, width)
+        if view == trace['view']:
+            return
+        trace['view'] = view
+        n_bins = max(1, min(width, self.point_budget // POINTS_PER_BIN))
+        segments = trace['artist'].get_segments()
+        for i, (x, y, sorted_x) in enumerate(trace['series']):
+            if not sorted_x:
+                continue
+            start = max(int(np.searchsorted(x, x_low, side='left')) - 1, 0)
+            stop = min(int(np.searchsorted(x, x_high, side='right')) + 1, len(x))
+            segments[i] = np.column_stack(decimate_line(x[start:stop], y[start:stop], n_bins, self.x_log))
+        trace['artist'].set_segments(segments)
+
+    def _update_scatter(self, trace, x_low, x_high, y_low, y_high, width, height):
+        view = (x_low, x_high, y_low, y_high, width, height)
+        if view == trace['view']:
+            return
+        trace['view'] = view
+        x = trace['x']
+        y = trace['y']
+        visible = (x >= x_low) & (x <= x_high) & (y >= y_low) & (y <= y_high)
+        xs, ys = decimate_scatter(x[visible], y[visible], width, height, self.x_log, self.y_log,
+                                  self.point_budget)
+        trace['artist'].set_offsets(np.column_stack((xs, ys)))
@@ -0,0 +1,152 @@
+# plots/density.py
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+from matplotlib.cm import ScalarMappable
+
+from plots.decimation import axes_pixel_size
+
+DEFAULT_DENSITY_COLORMAP = 'viridis'
+
+
+def _to_bins(values, low, high, n_bins, log=False):
+    """Bin index of every value in [low, high] split into n_bins (-1 outside the range)."""
+    values = np.asarray(values, dtype='float64')
+    if log:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.log10(values)
+        low, high = np.log10(low), np.log10(high)
+    span = high - low if high > low else 1.0
+    with np.errstate(invalid='ignore'):
+        bins = np.floor((values - low) / span * n_bins)
+        # The upper edge belongs to the last bin; NaN compares False
+        inside = (bins >= 0) & ((bins < n_bins) | (values == high))
+    bins = np.where(inside, np.minimum(bins, n_bins - 1), -1)
+    return bins.astype(np.int64)
+
+
+def histogram_counts(x, y, x_range, y_range, width, height, x_log=False, y_log=False):
+    """
+    Number of points falling in every cell of a width x height grid over the given ranges.
+
+    Parameters:
+        x (np.ndarray): X-values.
+        y (np.ndarray): Y-values.
+        x_range (tuple): (low, high) of the x-range binned.
+        y_range (tuple): (low, high) of the y-range binned.
+        width (int): Number of bins along x, normally the width of the axes in pixels.
+        height (int): Number of bins along y.
+        x_log (bool): Whether to bin x in log space.
+        y_log (bool): Whether to bin y in log space.
+
+    Returns:
+        np.ndarray: Counts of shape (height, width), row 0 at the bottom.
+    """
+    ix = _to_bins(x, x_range[0], x_range[1], width, x_log)
+    iy = _to_bins(y, y_range[0], y_range[1], height, y_log)
+    keep = (ix >= 0) & (iy >= 0)
+    cells = iy[keep] * width + ix[keep]
+    return np.bincount(cells, minlength=width * height).reshape(height, width)
+
+
+def _finite_range(values, log=False):
+    values = np.asarray(values, dtype='float64')
+    values = values[np.isfinite(values) & (values > 0)] if log else values[np.isfinite(values)]
+    if len(values) == 0:
+        return (1.0, 10.0) if log else (0.0, 1.0)
+    low, high = values.min(), values.max()
+    if high <= low:
+        high = low * 10 if log else low + 1.0
+    return low, high
+
+
+class DensityView:
+    """
+    Draws the points of one axes as a 2D histogram at screen resolution instead of one marker
+    per point. The raw arrays are kept, and the visible window is rebinned whenever the limits
+    change, so zooming in reveals the detail of the cached data.
+    """
+
+    def __init__(self, ax, x, y, colormap=DEFAULT_DENSITY_COLORMAP, x_log=False, y_log=False):
+        self.ax = ax
+        self.x = np.asarray(x, dtype='float64')
+        self.y = np.asarray(y, dtype='float64')
+        self.cmap = plt.get_cmap(colormap)
+        self.x_log = x_log
+        self.y_log = y_log
+        self.artist = None
+        self.view = None
+        self.updating = False
+        # Shared by every image drawn and by the colorbar, which follows the rebinned counts
+        self.norm = LogNorm(1, 10)
+        self.mappable = ScalarMappable(norm=self.norm, cmap=self.cmap)
+
+        self.x_range = _finite_range(self.x, x_log)
+        self.y_range = _finite_range(self.y, y_log)
+        self._draw(self.x_range, self.y_range)
+
+        # Matplotlib only keeps weak references to bound methods; the axes keeps this object alive
+        ax.callbacks.connect('xlim_changed', self.on_limits_changed)
+        ax.callbacks.connect('ylim_changed', self.on_limits_changed)
+        ax.figure.canvas.mpl_connect('resize_event', self.on_resize)
+
+    def on_resize(self, event):
+        if self.ax.figure is not None and self.ax in self.ax.figure.axes:
+            self.on_limits_changed(self.ax)
+
+    def refresh(self):
+        """Rebins the visible window, e.g. for a copy of the figure drawn at another size."""
+        self.view = None
+        self.on_limits_changed(self.ax)
+
+    def on_limits_changed(self, ax):
+        if self.updating:
+            return
+        self._draw(tuple(sorted(ax.get_xlim())), tuple(sorted(ax.get_ylim())))
+
+    def set_scales(self, x_log, y_log):
+        """Rebins for a new axis scale (the bins follow the scale of the axes)."""
+        if (x_log, y_log) == (self.x_log, self.y_log):
+            return
+        self.x_log = x_log
+        self.y_log = y_log
+        self.view = None
+        self.on_limits_changed(self.ax)
+
+    def _draw(self, x_range, y_range):
+        width, height = axes_pixel_size(self.ax)
+        if self.x_log and x_range[0] <= 0 or self.y_log and y_range[0] <= 0:
+            return  # Limits not valid for a log axis yet
+        view = (x_range, y_range, width, height, self.x_log, self.y_log)
+        if view == self.view:
+            return
+        self.view = view
+
+        counts = histogram_counts(self.x, self.y, x_range, y_range, width, height, self.x_log, self.y_log)
+        counts = np.ma.masked_equal(counts, 0)  # Empty pixels stay transparent
+        vmax = max(1, counts.max() if counts.count() else 1)
+
+        self.updating = True
+        try:
+            self.norm.vmax = vmax
+            if self.x_log or self.y_log:
+                # Bins are uniform in log space, which only a mesh places correctly; it is rebuilt
+                x_edges = (np.geomspace if self.x_log else np.linspace)(x_range[0], x_range[1], width + 1)
+                y_edges = (np.geomspace if self.y_log else np.linspace)(y_range[0], y_range[1], height + 1)
+                if self.artist is not None:
+                    self.artist.remove()
+                self.artist = self.ax.pcolormesh(x_edges, y_edges, counts, cmap=self.cmap, norm=self.norm, shading='flat')
+            else:
+                extent = (x_range[0], x_range[1], y_range[0], y_range[1])
+                if self.artist is not None and not hasattr(self.artist, 'set_extent'):
+                    self.artist.remove()
+                    self.artist = None
+                if self.artist is None:
+                    self.artist = self.ax.imshow(counts, origin='lower', extent=extent, aspect='auto',
+                                                 interpolation='nearest', cmap=self.cmap, norm=self.norm)
+                else:
+                    self.artist.set_data(counts)
+                    self.artist.set_extent(extent)
+        finally:
+            self.updating = False
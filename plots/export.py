@@ -0,0 +1,291 @@
+# plots/export.py
+
+import io
+import os
+import pickle
+from collections import namedtuple
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import Collection, LineCollection, QuadMesh
+from matplotlib.lines import Line2D
+from matplotlib.text import Text, Annotation
+
+from plots.tiled_export import supports_tiled_export, image_size, save_tiled, TILED_EXPORT_MIN_PIXELS
+
+# DPI of the quality levels offered by SavePlotDialog
+QUALITY_DPI = {
+    "Low": 72,
+    "Medium": 150,
+    "High": 300,
+    "Very High": 600
+}
+
+# Pixels of the width/height spin boxes per figure inch
+PIXELS_PER_INCH = 100
+
+# Assumed LaTeX \textwidth for the 'textwidth fraction' unit
+LATEX_TEXTWIDTH_INCHES = 6.5
+
+# Formats written as vector graphics; dense data artists can be rasterized inside them
+VECTOR_FORMATS = ('pdf', 'svg', 'svgz', 'eps', 'ps')
+
+# Defaults of the rasterization options
+DEFAULT_RASTERIZE_THRESHOLD = 5000  # Points per artist
+DEFAULT_RASTER_DPI = 300
+
+
+def latex_width_inches(figure_width, width_unit):
+    """Converts the LaTeX dialog figure width to inches."""
+    if width_unit == 'cm':
+        return figure_width / 2.54
+    if width_unit == 'mm':
+        return figure_width / 25.4
+    if width_unit == 'pt':
+        return figure_width / 72.27
+    if width_unit == 'textwidth fraction':
+        return figure_width * LATEX_TEXTWIDTH_INCHES
+    return figure_width  # inches
+
+
+def export_geometry(width_pixels, height_pixels, quality, latex_options=None, current_size=None):
+    """
+    Size and resolution of an exported figure.
+
+    Parameters:
+        width_pixels (int): Width chosen in SavePlotDialog.
+        height_pixels (int): Height chosen in SavePlotDialog.
+        quality (str): Quality level chosen in SavePlotDialog (see QUALITY_DPI).
+        latex_options (dict): Options of the LaTeX compatibility dialog, if any. The figure width
+                              then follows the LaTeX width and the height stays as displayed.
+        current_size (tuple): (width, height) of the displayed figure in inches.
+
+    Returns:
+        tuple: (width_inches, height_inches, dpi)
+    """
+    dpi = QUALITY_DPI.get(quality, 150)
+    if latex_options:
+        height_in = current_size[1] if current_size is not None else height_pixels / PIXELS_PER_INCH
+        return latex_width_inches(latex_options['figure_width'], latex_options['width_unit']), height_in, dpi
+    return width_pixels / PIXELS_PER_INCH, height_pixels / PIXELS_PER_INCH, dpi
+
+
+# A snapshot of a figure: the pickled figure and the full-resolution arrays it refers to
+FigureSnapshot = namedtuple('FigureSnapshot', ['data', 'arrays'])
+
+# Stands for the artist registry in a snapshot; clones are never updated in place
+_DROPPED = 'dropped'
+
+
+def full_resolution_arrays(figure):
+    """
+    The full-resolution data kept by the level-of-detail and density views of a figure. Only
+    the decimated / binned copies of it are drawn.
+    """
+    arrays = []
+    for ax in figure.axes:
+        level_of_detail = getattr(ax, 'level_of_detail', None)
+        if level_of_detail is not None:
+            for trace in level_of_detail.traces:
+                if 'series' in trace:
+                    arrays.extend(array for x, y, _ in trace['series'] for array in (x, y))
+                else:
+                    arrays.extend((trace['x'], trace['y']))
+        density_view = getattr(ax, 'density_view', None)
+        if density_view is not None:
+            arrays.extend((density_view.x, density_view.y))
+    return arrays
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    Pickles a figure without copying its full-resolution arrays, which are passed by reference
+    (the loaded data is never modified in place), and without its artist registry.
+    """
+
+    def __init__(self, file, figure):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.registry = getattr(figure, 'artist_registry', None)
+        self.arrays = []
+        self.array_ids = {id(array): None for array in full_resolution_arrays(figure)}
+
+    def persistent_id(self, obj):
+        if self.registry is not None and obj is self.registry:
+            return _DROPPED
+        if isinstance(obj, np.ndarray) and id(obj) in self.array_ids:
+            index = self.array_ids[id(obj)]
+            if index is None:
+                index = self.array_ids[id(obj)] = len(self.arrays)
+                self.arrays.append(obj)
+            return index
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, arrays):
+        super().__init__(file)
+        self.arrays = arrays
+
+    def persistent_load(self, pid):
+        return None if pid == _DROPPED else self.arrays[pid]
+
+
+def snapshot_figure(figure):
+    """
+    Captures the current state of a figure. Must run on the thread that owns the figure; the
+    snapshot is independent of it, so the live figure can keep changing afterwards. Only the
+    drawn artists are serialized: the full-resolution data of the decimated traces is shared.
+
+    Returns:
+        FigureSnapshot: The snapshot, for clone_figure.
+    """
+    buffer = io.BytesIO()
+    pickler = _SnapshotPickler(buffer, figure)
+    pickler.dump(figure)
+    return FigureSnapshot(buffer.getvalue(), pickler.arrays)
+
+
+def clone_figure(snapshot):
+    """Rebuilds a snapshot as an offscreen figure with its own Agg canvas."""
+    figure = _SnapshotUnpickler(io.BytesIO(snapshot.data), snapshot.arrays).load()
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def refresh_level_of_detail(figure):
+    """Re-decimates / rebins the data of every axes for the size of the (resized) figure."""
+    for ax in figure.axes:
+        for view in (getattr(ax, 'level_of_detail', None), getattr(ax, 'density_view', None)):
+            if view is not None:
+                view.refresh()
+
+
+def apply_export_fonts(figure, latex_options):
+    """
+    Applies the fonts of the LaTeX compatibility dialog to the artists of the figure, one by
+    one, instead of through the global rcParams: titles get the title size, axis labels, tick
+    labels, legends and annotations the axis size, and the axis offset texts the base size.
+    """
+    font_family = latex_options['font_family']
+    axis_font_size = latex_options['axis_font_size']
+
+    for ax in figure.axes:
+        ax.title.set_fontsize(latex_options['title_font_size'])
+        axes = [ax.xaxis, ax.yaxis] + ([ax.zaxis] if hasattr(ax, 'zaxis') else [])
+        for axis in axes:
+            axis.label.set_fontsize(axis_font_size)
+            axis.offsetText.set_fontsize(latex_options['base_font_size'])
+        # Tick labels are regenerated on draw, so they are set through the tick parameters
+        ax.tick_params(labelsize=axis_font_size, labelfontfamily=font_family)
+        legend = ax.get_legend()
+        if legend:
+            for text in legend.get_texts():
+                text.set_fontsize(axis_font_size)
+        for child in ax.get_children():
+            if isinstance(child, Annotation):
+                child.set_fontsize(axis_font_size)
+
+    for text in figure.findobj(Text):
+        text.set_fontfamily(font_family)
+        text.set_usetex(latex_options['use_latex'])
+
+
+def is_vector_format(file_path):
+    return os.path.splitext(file_path)[1].lower().lstrip('.') in VECTOR_FORMATS
+
+
+def artist_point_count(artist):
+    """Number of vertices/markers an artist writes to a vector file."""
+    if isinstance(artist, Line2D):
+        return len(artist.get_xdata(orig=False))
+    if isinstance(artist, LineCollection):
+        return sum(len(segment) for segment in artist.get_segments())
+    if isinstance(artist, QuadMesh):
+        return np.size(artist.get_array())
+    if isinstance(artist, Collection):
+        # Markers of a scatter, or the vertices of bars/polygons
+        return max(len(artist.get_offsets()), sum(len(path.vertices) for path in artist.get_paths()))
+    return 0
+
+
+def rasterize_dense_artists(figure, threshold=DEFAULT_RASTERIZE_THRESHOLD):
+    """
+    Marks the data artists (lines and collections) with at least threshold points as
+    rasterized. Axes, text and annotations stay vector.
+
+    Returns:
+        int: Number of artists rasterized.
+    """
+    count = 0
+    for ax in figure.axes:
+        for artist in list(ax.lines) + list(ax.collections):
+            if artist_point_count(artist) >= threshold:
+                artist.set_rasterized(True)
+                count += 1
+    return count
+
+
+def export_figure(snapshot, file_path, width_in, height_in, dpi, latex_options=None, export_options=None,
+                  progress_callback=None, is_cancelled=None):
+    """
+    Renders a figure snapshot offscreen and saves it. Safe to run on a worker thread: the
+    clone shares nothing with the live figure and the global rcParams are not touched.
+
+    Parameters:
+        snapshot (FigureSnapshot): Result of snapshot_figure.
+        file_path (str): Output path; the format follows the extension.
+        width_in (float): Width of the exported figure in inches.
+        height_in (float): Height of the exported figure in inches.
+        dpi (int): Resolution of the exported figure.
+        latex_options (dict): Fonts of the LaTeX compatibility dialog (optional).
+        export_options (dict): 'rasterize', 'rasterize_threshold' and 'raster_dpi' for vector
+                               formats, 'tiled' for large PNG/TIFF images (optional, see
+                               SavePlotDialog.get_export_options).
+        progress_callback (callable): Called as progress_callback(done, total, message) (optional).
+        is_cancelled (callable): Checked between the steps; the export stops when it returns True (optional).
+
+    Returns:
+        str: file_path, or None when the export was cancelled.
+    """
+    steps = ["Preparing figure", "Rendering and saving"]
+
+    def step(index):
+        if is_cancelled and is_cancelled():
+            return False
+        if progress_callback:
+            progress_callback(index, len(steps), steps[index])
+        return True
+
+    if not step(0):
+        return None
+    figure = clone_figure(snapshot)
+    figure.set_size_inches(width_in, height_in)
+    figure.set_dpi(dpi)
+    refresh_level_of_detail(figure)
+    if latex_options:
+        apply_export_fonts(figure, latex_options)
+
+    save_dpi = dpi
+    export_options = export_options or {}
+    if is_vector_format(file_path) and export_options.get('rasterize', False):
+        rasterize_dense_artists(figure, export_options.get('rasterize_threshold', DEFAULT_RASTERIZE_THRESHOLD))
+        # In a vector file the DPI only sets the resolution of the rasterized artists
+        save_dpi = export_options.get('raster_dpi', DEFAULT_RASTER_DPI)
+
+    if not step(1):
+        return None
+    width, height = image_size(figure, dpi)
+    if (export_options.get('tiled', True) and supports_tiled_export(file_path)
+            and width * height >= TILED_EXPORT_MIN_PIXELS):
+        # Poster-size images are rendered band by band instead of in one huge Agg buffer
+        def band_progress(done, total, message):
+            if progress_callback:
+                progress_callback(1, len(steps), f"Rendering and saving ({message})")
+
+        if not save_tiled(figure, file_path, dpi, progress_callback=band_progress, is_cancelled=is_cancelled):
+            return None
+    else:
+        figure.savefig(file_path, dpi=save_dpi)
+    if progress_callback:
+        progress_callback(len(steps), len(steps), "Saved")
+    return file_path
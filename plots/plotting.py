@@ -2,10 +2,25 @@
 
 import matplotlib.pyplot as plt
 import pandas as pd
+import numpy as np
 import os
-from utils import read_numeric_data  # Ensure this import is present
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from utils import load_numeric_data, get_selected_columns, DataReadError
+from plots.decimation import decimate_for_axes, LevelOfDetail, DEFAULT_POINT_BUDGET
+from plots.artist_registry import ArtistRegistry, same_data
+from plots.bulk_overlay import draw_bulk_overlay, add_series_colorbar, DEFAULT_OVERLAY_COLORMAP
+from plots.density import DensityView
+from plots.waterfall import draw_waterfall
 
-def plot_data(figure, data_files, plot_details, axis_details, plot_visuals, is_3d=False, parent=None):
+# Number of files parsed concurrently (pandas' C parser releases the GIL while parsing)
+DEFAULT_LOAD_WORKERS = min(8, os.cpu_count() or 1)
+
+# One loaded file, ready to be drawn
+PlotDataset = namedtuple('PlotDataset', ['key', 'label', 'x', 'y'])
+
+
+def plot_data(figure, data_files, plot_details, axis_details, plot_visuals, is_3d=False, parent=None, max_workers=None):
     """
     Plots data from multiple CSV files onto the provided matplotlib figure.
 
@@ -17,12 +32,343 @@ def plot_data(figure, data_files, plot_details, axis_details, plot_visuals, is_3
         plot_visuals (dict): Dictionary containing visual settings like grid, legends, etc.
         is_3d (bool): Whether to plot in 3D.
         parent (QWidget): Parent widget for QMessageBox (optional).
+        max_workers (int): Number of files loaded concurrently (default: DEFAULT_LOAD_WORKERS).
+    """
+    datasets, errors = load_plot_datasets(data_files, plot_details, max_workers=max_workers)
+    report_load_errors(errors, parent)
+    render_datasets(figure, datasets, plot_details, axis_details, plot_visuals, is_3d=is_3d)
+
+
+def load_plot_datasets(data_files, plot_details, max_workers=None, progress_callback=None, is_cancelled=None):
+    """
+    Loads the X/Y columns selected in plot_details from every file, concurrently.
+
+    Parameters:
+        data_files (list): List of file paths to CSV files.
+        plot_details (dict): Dictionary containing the selected axis columns.
+        max_workers (int): Number of files loaded concurrently (default: DEFAULT_LOAD_WORKERS).
+        progress_callback (callable): Called as progress_callback(done, total, file_path) after each file (optional).
+        is_cancelled (callable): Checked between files; when it returns True the remaining files are skipped (optional).
+
+    Returns:
+        tuple: (datasets, errors) where datasets is a list of PlotDataset in the order of
+               data_files and errors is a list of (file_path, message) for the files that failed.
     """
+    try:
+        columns = get_selected_columns(plot_details)
+    except ValueError:
+        return [], [(file_path, "Invalid column numbers in plot details.") for file_path in data_files]
+
+    def load(file_path):
+        try:
+            df = load_numeric_data(file_path, columns=columns)
+            return PlotDataset(file_path, os.path.splitext(os.path.basename(file_path))[0],
+                               df.iloc[:, 0].values, df.iloc[:, 1].values), None
+        except DataReadError as e:
+            return None, str(e)
+        except Exception as e:
+            return None, f"Error loading file: {e}"
+
+    total = len(data_files)
+    results = []
+    workers = max(1, min(max_workers or DEFAULT_LOAD_WORKERS, total))
+    if workers == 1:
+        for file_path in data_files:
+            if is_cancelled and is_cancelled():
+                break
+            results.append(load(file_path))
+            if progress_callback:
+                progress_callback(len(results), total, file_path)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(load, file_path) for file_path in data_files]
+            for file_path, future in zip(data_files, futures):  # Collect in the original order
+                if is_cancelled and is_cancelled():
+                    break
+                results.append(future.result())
+                if progress_callback:
+                    progress_callback(len(results), total, file_path)
+        finally:
+            # Files that have not started yet are dropped when the load is cancelled
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    datasets = []
+    errors = []
+    for file_path, (dataset, error) in zip(data_files, results):
+        if dataset is None:
+            errors.append((file_path, error))
+        else:
+            datasets.append(dataset)
+    return datasets, errors
+
+
+def report_load_errors(errors, parent=None):
+    """Shows a single summary of every file that could not be loaded."""
+    if not errors:
+        return
+    summary = "\n".join(f"{os.path.basename(file_path)}: {message}" for file_path, message in errors)
+    if parent:
+        from PyQt5.QtWidgets import QMessageBox  # Imported here so headless rendering does not need Qt
+        QMessageBox.warning(parent, "Data Read Error", f"{len(errors)} file(s) could not be loaded:\n\n{summary}")
+    else:
+        print(f"Data Read Error: {len(errors)} file(s) could not be loaded:\n{summary}")
+
+
+def render_datasets(figure, datasets, plot_details, axis_details, plot_visuals, is_3d=False, redraw=True):
+    """
+    Draws already loaded datasets onto the provided matplotlib figure. Must run on the GUI thread
+    when the figure belongs to a Qt canvas.
+
+    When the figure still shows a 2D line plot with the same layout (style, grid, decimation),
+    the existing lines are updated in place and only datasets that were added,
+    removed or changed are touched. Anything else rebuilds the figure.
+
+    Parameters:
+        figure (matplotlib.figure.Figure): The figure to plot on.
+        datasets (list): List of PlotDataset, drawn in order.
+        plot_details (dict): Dictionary containing plot-specific details like line styles, etc.
+        axis_details (dict): Dictionary containing axis labels, title, font sizes, etc.
+        plot_visuals (dict): Dictionary containing visual settings like grid, legends, etc.
+        is_3d (bool): Whether to plot in 3D.
+        redraw (bool): Whether to request a redraw of the canvas (not needed before savefig).
+    """
+    plot_type = plot_visuals.get('plot_type', 'line').lower()
+    plot_style = plot_visuals.get('plot_style', 'default').lower()
+
+    # Scales (needed up front by the decimation)
+    x_scale, y_scale = axis_scales(plot_details)
+
+    # Large 2D line/scatter traces are reduced to what the axes can show
+    decimate = plot_visuals.get('decimate', False) and not is_3d and plot_type != "density"
+    point_budget = int(plot_visuals.get('decimation_points', DEFAULT_POINT_BUDGET))
+
+    line_style = {'Solid': '-', 'Dashed': '--', 'Dash-Dot': '-.'}.get(plot_details.get('line_style', 'Solid'), '-')
+    point_style = {
+        "None": "",
+        "Circle": "o",
+        "Square": "s",
+        "Triangle Up": "^",
+        "Triangle Down": "v",
+        "Star": "*",
+        "Plus": "+",
+        "Cross": "x"
+    }.get(plot_details.get('point_style', 'None'), "")
+    line_thickness = int(plot_details.get('line_thickness', 1))
+
+    # Many-file 2D line overlays can be drawn as a single LineCollection
+    bulk_overlay = plot_visuals.get('bulk_overlay', False) and plot_type == "line" and not is_3d
+    colormap = plot_visuals.get('overlay_colormap', DEFAULT_OVERLAY_COLORMAP)
+
+    # Everything that needs a fresh axes when it changes
+    signature = (
+        plot_type, is_3d, plot_style, decimate, point_budget,
+        plot_visuals.get('add_grid', False), plot_visuals.get('add_sub_grid', False),
+        bulk_overlay, colormap if bulk_overlay or plot_type == "density" else None,
+    )
+    registry = getattr(figure, 'artist_registry', None)
+    incremental = (
+        plot_type == "line" and not is_3d and not bulk_overlay
+        and registry is not None and registry.can_update(figure, signature)
+    )
+
+    if incremental:
+        ax = registry.ax
+        data_changed = update_line_artists(
+            ax, registry, datasets, line_style, point_style, line_thickness,
+            decimate, point_budget, x_scale == 'log', y_scale == 'log'
+        )
+    else:
+        ax = build_axes(figure, plot_style, is_3d)
+        registry = ArtistRegistry(ax, signature)
+        figure.artist_registry = registry
+        data_changed = True
+        if decimate:
+            # Re-decimates the visible window on pan/zoom (kept on the axes like ax.annotations)
+            ax.level_of_detail = LevelOfDetail(ax, point_budget, x_scale == 'log', y_scale == 'log')
+
+    if bulk_overlay:
+        collection = draw_bulk_overlay(
+            ax, datasets, line_style, line_thickness, colormap,
+            decimate, point_budget, x_scale == 'log', y_scale == 'log'
+        )
+        if collection is not None:
+            # relim() ignores collections; the registry restores the full data limits on autoscale
+            for dataset in datasets:
+                registry.add(dataset.key, collection, dataset.x, dataset.y)
+            if decimate:
+                ax.level_of_detail.track_collection(collection, [(dataset.x, dataset.y) for dataset in datasets])
+            add_series_colorbar(figure, ax, datasets, colormap)
+    elif plot_type == "line" and is_3d and not point_style:
+        # 3D waterfall: one Line3DCollection (no markers), optionally decimated per series
+        draw_waterfall(
+            ax, datasets, line_style, line_thickness,
+            plot_visuals.get('decimate', False), point_budget, x_scale == 'log'
+        )
+    elif plot_type == "density" and not is_3d:
+        # All points binned into one screen-resolution 2D histogram, rebinned on pan/zoom
+        if datasets:
+            x = np.concatenate([np.asarray(dataset.x, dtype='float64') for dataset in datasets])
+            y = np.concatenate([np.asarray(dataset.y, dtype='float64') for dataset in datasets])
+            ax.density_view = DensityView(ax, x, y, colormap, x_scale == 'log', y_scale == 'log')
+            figure.colorbar(ax.density_view.mappable, ax=ax, pad=0.02, label="Points per pixel")
+            # relim() ignores meshes and only sees the visible window of the image
+            for dataset in datasets:
+                registry.add(dataset.key, ax.density_view, dataset.x, dataset.y)
+    elif not incremental:
+        # Plot each dataset
+        for i, dataset in enumerate(datasets):
+            x = dataset.x
+            y = dataset.y
+            z = i if is_3d else None
+            label = dataset.label
+
+            full_x, full_y = x, y
+            if decimate and plot_type in ("line", "scatter"):
+                x, y = decimate_for_axes(ax, x, y, plot_type, point_budget, x_scale == 'log', y_scale == 'log')
+
+            if plot_type == "line":
+                if is_3d:
+                    ax.plot(x, np.full(len(x), z), y, label=label, linestyle=line_style, marker=point_style, linewidth=line_thickness)
+                else:
+                    line, = ax.plot(x, y, label=label, linestyle=line_style, marker=point_style, linewidth=line_thickness)
+                    registry.add(dataset.key, line, full_x, full_y)
+                    if decimate and len(x) < len(full_x):
+                        ax.level_of_detail.track(line, full_x, full_y, plot_type)
+            elif plot_type == "bar":
+                if is_3d:
+                    ax.bar(x, y, zs=z, zdir='y', label=label)
+                else:
+                    ax.bar(x, y, label=label)
+            elif plot_type in ("scatter", "density"):  # 3D density is drawn as a scatter
+                if is_3d:
+                    ax.scatter(x, np.full(len(x), z), y, label=label)
+                else:
+                    points = ax.scatter(x, y, label=label)
+                    if decimate and len(x) < len(full_x):
+                        ax.level_of_detail.track(points, full_x, full_y, plot_type)
+            elif plot_type == "histogram":
+                if is_3d:
+                    ax.hist(y, zs=z, zdir='y', label=label)
+                else:
+                    ax.hist(y, label=label)
+            elif plot_type == "pie":
+                if is_3d:
+                    pass  # Pie chart in 3D doesn't make sense
+                else:
+                    ax.pie(y, labels=x)
+
+    if not incremental:
+        # Apply grid settings
+        if plot_visuals.get('add_grid', False):
+            ax.grid(True)
+        if plot_visuals.get('add_sub_grid', False):
+            ax.minorticks_on()
+            ax.grid(which='minor', linestyle=':', linewidth='0.5')
+
+    # A freshly built axes is already autoscaled to its artists
+    apply_axis_geometry(ax, plot_details, axis_details, registry, data_changed=data_changed, autoscale=incremental)
+    apply_decorations(ax, axis_details, plot_visuals, is_3d)
+
+    # Redraw the figure
+    if redraw:
+        figure.canvas.draw_idle()
+
+
+def axis_scales(plot_details):
+    """Returns the (x_scale, y_scale) selected in plot_details."""
+    scale_type = plot_details.get('scale_type', 'linear').lower()
+    x_scale = 'linear'
+    y_scale = 'linear'
+    if 'logarithmic x-axis' in scale_type:
+        x_scale = 'log'
+    if 'logarithmic y-axis' in scale_type:
+        y_scale = 'log'
+    if 'logarithmic both axes' in scale_type:
+        x_scale = y_scale = 'log'
+    return x_scale, y_scale
+
+
+def apply_axis_geometry(ax, plot_details, axis_details, registry=None, data_changed=False, autoscale=True):
+    """
+    Applies the scales and the axis ranges to an existing axes without touching its artists.
+    A range that was cleared goes back to autoscaling; otherwise the current zoom is kept.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes to update.
+        plot_details (dict): Dictionary containing the scale type.
+        axis_details (dict): Dictionary containing the axis ranges.
+        registry (ArtistRegistry): Registry of the axes, remembers the last applied ranges (optional).
+        data_changed (bool): Whether the plotted data changed since the last update.
+        autoscale (bool): Whether autoscaling may be re-run when the data or the ranges changed.
+    """
+    # Apply scales
+    x_scale, y_scale = axis_scales(plot_details)
+    if ax.get_xscale() != x_scale:
+        ax.set_xscale(x_scale)
+    if ax.get_yscale() != y_scale:
+        ax.set_yscale(y_scale)
+    level_of_detail = getattr(ax, 'level_of_detail', None)
+    if level_of_detail is not None:
+        level_of_detail.x_log = x_scale == 'log'
+        level_of_detail.y_log = y_scale == 'log'
+    density_view = getattr(ax, 'density_view', None)
+    if density_view is not None:
+        density_view.set_scales(x_scale == 'log', y_scale == 'log')
+
+    # Apply axis ranges
+    try:
+        x_min = float(axis_details.get('x_min')) if axis_details.get('x_min') else None
+        x_max = float(axis_details.get('x_max')) if axis_details.get('x_max') else None
+        y_min = float(axis_details.get('y_min')) if axis_details.get('y_min') else None
+        y_max = float(axis_details.get('y_max')) if axis_details.get('y_max') else None
+    except ValueError:
+        print("Invalid axis range values.")
+        return
+
+    axis_range = (x_min, x_max, y_min, y_max)
+    previous_range = registry.axis_range if registry is not None else None
+    if autoscale and (data_changed or axis_range != previous_range):
+        ax.set_autoscalex_on(x_min is None or x_max is None)
+        ax.set_autoscaley_on(y_min is None or y_max is None)
+        if data_changed:
+            ax.relim()
+            if registry is not None:
+                registry.update_datalim()
+        ax.autoscale_view()
+    if registry is not None:
+        registry.axis_range = axis_range
+
+    if x_min is not None and x_max is not None:
+        ax.set_xlim(x_min, x_max)
+    if y_min is not None and y_max is not None:
+        ax.set_ylim(y_min, y_max)
+
+
+def apply_decorations(ax, axis_details, plot_visuals, is_3d=False):
+    """Applies the title, the axis labels and the legend to an existing axes."""
+    # Set axis labels and title with adjusted padding
+    ax.set_title(axis_details.get('title', 'Data Plot'), fontsize=axis_details.get('title_font_size', 12), pad=20)
+    ax.set_xlabel(axis_details.get('x_label', 'X-axis'), fontsize=axis_details.get('axis_font_size', 10))
+    if is_3d:
+        ax.set_ylabel('Offset', fontsize=axis_details.get('axis_font_size', 10))
+        ax.set_zlabel(axis_details.get('y_label', 'Y-axis'), fontsize=axis_details.get('axis_font_size', 10))
+    else:
+        ax.set_ylabel(axis_details.get('y_label', 'Y-axis'), fontsize=axis_details.get('axis_font_size', 10))
+
+    # Add legend if required
+    if plot_visuals.get('apply_legends', False):
+        ax.legend(fontsize=axis_details.get('legend_font_size', 10))
+    elif ax.get_legend() is not None:
+        ax.get_legend().remove()
+
+
+def build_axes(figure, plot_style, is_3d=False):
+    """Clears the figure, applies the plot style and adds a fresh axes."""
     # Clear the figure
     figure.clear()
 
     # Apply plot style
-    plot_style = plot_visuals.get('plot_style', 'default').lower()
     if plot_style == "full_grid":
         plt.style.use('default')
         plt.rcParams['grid.color'] = 'black'
@@ -39,122 +385,61 @@ def plot_data(figure, data_files, plot_details, axis_details, plot_visuals, is_3
             plt.style.use('default')
 
     # Prepare the axis
-    ax = figure.add_subplot(111, projection='3d' if is_3d else None)
+    return figure.add_subplot(111, projection='3d' if is_3d else None)
 
-    # Plot each data file
-    for i, file_path in enumerate(data_files):
-        try:
-            # Use read_numeric_data to read and clean data
-            df, x, y = read_numeric_data(file_path, parent=parent)
-            if df is None:
-                print(f"Skipping file {file_path} due to insufficient data.")
-                continue
-
-            # Retrieve column indices from plot_details
-            x_col = int(plot_details.get('x_axis_col', 1)) - 1  # Default to first column
-            y_col = int(plot_details.get('y_axis_col', 2)) - 1  # Default to second column
-
-            # Validate column indices
-            if x_col >= df.shape[1] or y_col >= df.shape[1]:
-                print(f"Selected columns do not exist in {file_path}.")
-                continue
-
-            # Extract selected columns
-            x = df.iloc[:, x_col].values
-            y = df.iloc[:, y_col].values
-            z = i if is_3d else None
-        except Exception as e:
-            print(f"Error loading file {file_path}: {e}")
-            continue
-
-        label = os.path.splitext(os.path.basename(file_path))[0]
-        line_style = {'Solid': '-', 'Dashed': '--', 'Dash-Dot': '-.'}.get(plot_details.get('line_style', 'Solid'), '-')
-        point_style = {
-            "None": "",
-            "Circle": "o",
-            "Square": "s",
-            "Triangle Up": "^",
-            "Triangle Down": "v",
-            "Star": "*",
-            "Plus": "+",
-            "Cross": "x"
-        }.get(plot_details.get('point_style', 'None'), "")
-        line_thickness = int(plot_details.get('line_thickness', 1))
-
-        plot_type = plot_visuals.get('plot_type', 'line').lower()
-
-        if plot_type == "line":
-            if is_3d:
-                ax.plot(x, [z]*len(x), y, label=label, linestyle=line_style, marker=point_style, linewidth=line_thickness)
-            else:
-                ax.plot(x, y, label=label, linestyle=line_style, marker=point_style, linewidth=line_thickness)
-        elif plot_type == "bar":
-            if is_3d:
-                ax.bar(x, y, zs=z, zdir='y', label=label)
-            else:
-                ax.bar(x, y, label=label)
-        elif plot_type == "scatter":
-            if is_3d:
-                ax.scatter(x, [z]*len(x), y, label=label)
-            else:
-                ax.scatter(x, y, label=label)
-        elif plot_type == "histogram":
-            if is_3d:
-                ax.hist(y, zs=z, zdir='y', label=label)
-            else:
-                ax.hist(y, label=label)
-        elif plot_type == "pie":
-            if is_3d:
-                pass  # Pie chart in 3D doesn't make sense
-            else:
-                ax.pie(y, labels=x)
 
-    # Set axis labels and title with adjusted padding
-    ax.set_title(axis_details.get('title', 'Data Plot'), fontsize=axis_details.get('title_font_size', 12), pad=20)
-    ax.set_xlabel(axis_details.get('x_label', 'X-axis'), fontsize=axis_details.get('axis_font_size', 10))
-    if is_3d:
-        ax.set_ylabel('Offset', fontsize=axis_details.get('axis_font_size', 10))
-        ax.set_zlabel(axis_details.get('y_label', 'Y-axis'), fontsize=axis_details.get('axis_font_size', 10))
-    else:
-        ax.set_ylabel(axis_details.get('y_label', 'Y-axis'), fontsize=axis_details.get('axis_font_size', 10))
+def update_line_artists(ax, registry, datasets, line_style, point_style, line_thickness,
+                        decimate, point_budget, x_log=False, y_log=False):
+    """
+    Brings the registered 2D lines in line with datasets: new datasets get a line, removed
+    ones lose theirs, lines whose data changed get set_data and every line picks up the
+    current style, label and color. The lines end up in dataset order with the colors of
+    the color cycle, so drawing and legend order match a full render of the same datasets.
 
-    # Apply axis ranges
-    try:
-        x_min = float(axis_details.get('x_min')) if axis_details.get('x_min') else None
-        x_max = float(axis_details.get('x_max')) if axis_details.get('x_max') else None
-        y_min = float(axis_details.get('y_min')) if axis_details.get('y_min') else None
-        y_max = float(axis_details.get('y_max')) if axis_details.get('y_max') else None
+    Returns:
+        bool: Whether any line was added, removed or got new data.
+    """
+    level_of_detail = getattr(ax, 'level_of_detail', None)
+    changed = False
 
-        if x_min is not None and x_max is not None:
-            ax.set_xlim(x_min, x_max)
-        if y_min is not None and y_max is not None:
-            ax.set_ylim(y_min, y_max)
-    except ValueError:
-        print("Invalid axis range values.")
+    for artist in registry.remove_missing(dataset.key for dataset in datasets):
+        if level_of_detail is not None:
+            level_of_detail.untrack(artist)
+        changed = True
 
-    # Apply scales
-    scale_type = plot_details.get('scale_type', 'linear').lower()
-    x_scale = 'linear'
-    y_scale = 'linear'
-    if 'logarithmic x-axis' in scale_type:
-        x_scale = 'log'
-    if 'logarithmic y-axis' in scale_type:
-        y_scale = 'log'
-    if 'logarithmic both axes' in scale_type:
-        x_scale = y_scale = 'log'
-    ax.set_xscale(x_scale)
-    ax.set_yscale(y_scale)
+    lines = []
+    for i, dataset in enumerate(datasets):
+        entry = registry.get(dataset.key)
+        if entry is not None and same_data(entry['x'], dataset.x) and same_data(entry['y'], dataset.y):
+            line = entry['artist']
+        else:
+            x, y = dataset.x, dataset.y
+            if decimate:
+                x, y = decimate_for_axes(ax, x, y, "line", point_budget, x_log, y_log)
+            if entry is None:
+                line, = ax.plot(x, y)
+            else:
+                line = entry['artist']
+                line.set_data(x, y)
+                if level_of_detail is not None:
+                    level_of_detail.untrack(line)
+            registry.add(dataset.key, line, dataset.x, dataset.y)
+            if decimate and len(x) < len(dataset.x) and level_of_detail is not None:
+                level_of_detail.track(line, dataset.x, dataset.y, "line")
+            changed = True
 
-    # Apply grid settings
-    if plot_visuals.get('add_grid', False):
-        ax.grid(True)
-    if plot_visuals.get('add_sub_grid', False):
-        ax.minorticks_on()
-        ax.grid(which='minor', linestyle=':', linewidth='0.5')
+        line.set_linestyle(line_style)
+        line.set_marker(point_style)
+        line.set_linewidth(line_thickness)
+        line.set_label(dataset.label)
+        if registry.colors:
+            line.set_color(registry.colors[i % len(registry.colors)])
+        lines.append(line)
 
-    # Add legend if required
-    if plot_visuals.get('apply_legends', False):
-        ax.legend(fontsize=axis_details.get('legend_font_size', 10))
+    # Lines are drawn and listed in the legend in the order of the axes' children
+    if [line for line in ax.lines if line in lines] != lines:
+        for line in lines:
+            line.remove()
+            ax.add_line(line)
 
-    # Redraw the figure
-    figure.canvas.draw_idle()
+    return changed
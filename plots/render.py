@@ -0,0 +1,207 @@
+# plots/render.py
+#
+# Headless rendering: draws figures from a JSON description with the Agg backend, without
+# Qt, and exports batches of figures across a process pool.
+#
+#     python -m plots.render figures.json --workers 4 --output-dir reports/
+#
+# The JSON file holds one figure, a list of figures, or {"defaults": {...}, "figures": [...]}.
+# Every figure has the same sections as the GUI panels plus the files and the output path:
+#
+#     {
+#         "files": ["data/run1.csv", "data/run2.csv"],
+#         "output": "run1.png",
+#         "plot_details": {"x_axis_col": "1", "y_axis_col": "2", "line_style": "Solid"},
+#         "axis_details": {"title": "Run 1", "x_label": "Time (s)", "y_label": "Signal"},
+#         "plot_visuals": {"plot_type": "Line", "add_grid": true, "apply_legends": true},
+#         "is_3d": false,
+#         "dpi": 150,
+#         "size": [8, 6]
+#     }
+#
+# Relative file and output paths are resolved against the directory of the JSON file.
+
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from plots.plotting import load_plot_datasets, render_datasets
+
+DEFAULT_DPI = 150
+DEFAULT_SIZE = (8, 6)  # Inches
+
+# Sections merged key by key when a figure overrides the defaults
+SECTIONS = ('plot_details', 'axis_details', 'plot_visuals')
+
+
+def merge_config(defaults, figure_config):
+    """Returns figure_config on top of defaults; the panel sections are merged key by key."""
+    merged = copy.deepcopy(defaults)
+    for key, value in figure_config.items():
+        if key in SECTIONS and isinstance(value, dict):
+            merged[key] = {**merged.get(key, {}), **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_batch_config(config_path, output_dir=None):
+    """
+    Reads a JSON batch description and returns one complete config per figure, with absolute
+    file and output paths.
+
+    Parameters:
+        config_path (str): Path to the JSON file.
+        output_dir (str): Directory for outputs given as relative paths (default: next to the JSON file).
+
+    Returns:
+        list: The figure configs.
+    """
+    with open(config_path, 'r') as f:
+        data = json.load(f)
+
+    if isinstance(data, list):
+        defaults, figures = {}, data
+    elif 'figures' in data:
+        defaults, figures = data.get('defaults', {}), data['figures']
+    else:
+        defaults, figures = {}, [data]
+
+    base_dir = os.path.dirname(os.path.abspath(config_path))
+    output_dir = os.path.abspath(output_dir) if output_dir else base_dir
+
+    configs = []
+    for index, figure_config in enumerate(figures):
+        config = merge_config(defaults, figure_config)
+        config['files'] = [os.path.join(base_dir, path) for path in config.get('files', [])]
+        output = config.get('output')
+        if not output:
+            # Named after the first file, or after the position in the batch
+            name = os.path.splitext(os.path.basename(config['files'][0]))[0] if config['files'] else f"figure_{index + 1}"
+            output = f"{name}.png"
+        config['output'] = os.path.join(output_dir, output)
+        configs.append(config)
+    return configs
+
+
+def render_figure(config, load_workers=None):
+    """
+    Loads the files of one figure config and saves the rendered figure to config['output'].
+
+    Parameters:
+        config (dict): A figure config (see the top of this module).
+        load_workers (int): Number of files loaded concurrently (default: DEFAULT_LOAD_WORKERS).
+
+    Returns:
+        dict: {'output': path, 'error': message or None, 'warnings': [messages]}.
+    """
+    output = config.get('output')
+    result = {'output': output, 'error': None, 'warnings': []}
+    files = config.get('files', [])
+    plot_details = config.get('plot_details', {})
+    if not files:
+        result['error'] = "No files given."
+        return result
+
+    datasets, errors = load_plot_datasets(files, plot_details, max_workers=load_workers)
+    result['warnings'] = [f"{os.path.basename(file_path)}: {message}" for file_path, message in errors]
+    if not datasets:
+        result['error'] = "None of the files could be loaded."
+        return result
+
+    # A Figure with its own Agg canvas never touches pyplot's (possibly Qt) backend
+    figure = Figure(figsize=tuple(config.get('size', DEFAULT_SIZE)), dpi=config.get('dpi', DEFAULT_DPI))
+    FigureCanvasAgg(figure)
+    try:
+        render_datasets(
+            figure, datasets, plot_details, config.get('axis_details', {}), config.get('plot_visuals', {}),
+            is_3d=config.get('is_3d', False), redraw=False
+        )
+        output_dir = os.path.dirname(output)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        figure.savefig(output, dpi=config.get('dpi', DEFAULT_DPI), bbox_inches='tight')
+    except Exception as e:
+        result['error'] = f"Error rendering figure: {e}"
+    return result
+
+
+def _render_in_worker(config):
+    # The pool already runs one figure per core, so files are loaded one at a time
+    return render_figure(config, load_workers=1)
+
+
+def render_batch(configs, max_workers=None, progress_callback=None):
+    """
+    Renders many figure configs across a process pool.
+
+    Parameters:
+        configs (list): The figure configs.
+        max_workers (int): Number of processes (default: one per CPU; 1 renders in this process).
+        progress_callback (callable): Called as progress_callback(done, total, result) after each figure (optional).
+
+    Returns:
+        list: The results of render_figure, in the order of configs.
+    """
+    total = len(configs)
+    results = [None] * total
+    workers = max(1, min(max_workers or os.cpu_count() or 1, total))
+    if workers == 1:
+        for index, config in enumerate(configs):
+            results[index] = render_figure(config)
+            if progress_callback:
+                progress_callback(index + 1, total, results[index])
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_render_in_worker, config): index for index, config in enumerate(configs)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = {'output': configs[index].get('output'), 'error': f"Worker failed: {e}", 'warnings': []}
+            if progress_callback:
+                progress_callback(done, total, results[index])
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m plots.render", description="Render figures without the GUI.")
+    parser.add_argument('config', help="JSON file describing the figure(s) to render")
+    parser.add_argument('--workers', type=int, default=None, help="number of processes (default: one per CPU)")
+    parser.add_argument('--output-dir', default=None, help="directory for relative output paths")
+    parser.add_argument('--dpi', type=int, default=None, help="override the DPI of every figure")
+    args = parser.parse_args(argv)
+
+    try:
+        configs = load_batch_config(args.config, args.output_dir)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {args.config}: {e}", file=sys.stderr)
+        return 2
+    if args.dpi:
+        for config in configs:
+            config['dpi'] = args.dpi
+
+    def report(done, total, result):
+        status = f"FAILED: {result['error']}" if result['error'] else "ok"
+        print(f"[{done}/{total}] {result['output']}: {status}")
+        for warning in result['warnings']:
+            print(f"    warning: {warning}")
+
+    start = time.perf_counter()
+    results = render_batch(configs, args.workers, report)
+    failed = sum(1 for result in results if result['error'])
+    print(f"Rendered {len(results) - failed} of {len(results)} figure(s) in {time.perf_counter() - start:.1f} s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
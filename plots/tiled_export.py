@@ -0,0 +1,218 @@
+# plots/tiled_export.py
+#
+# Saves very large raster images band by band. Every band is rendered separately by cropping
+# the figure to it (savefig with bbox_inches), and its rows are streamed to the output file,
+# so the peak memory is bounded by the band instead of the whole image.
+
+import io
+import os
+import struct
+import zlib
+
+import numpy as np
+from matplotlib.transforms import Bbox
+
+# Formats that can be written band by band
+TILED_FORMATS = ('png', 'tif', 'tiff')
+
+# Images with at least this many pixels are rendered in bands
+TILED_EXPORT_MIN_PIXELS = 40_000_000
+
+# Size of one rendered band (RGBA); the peak memory is a few times this
+DEFAULT_BAND_BYTES = 16 * 1024 * 1024
+
+
+def supports_tiled_export(file_path):
+    return os.path.splitext(file_path)[1].lower().lstrip('.') in TILED_FORMATS
+
+
+def image_size(figure, dpi):
+    """(width, height) in pixels of the figure saved at dpi."""
+    width_in, height_in = figure.get_size_inches()
+    # Agg truncates the size, as savefig does
+    return int(width_in * dpi), int(height_in * dpi)
+
+
+class PNGStreamWriter:
+    """Writes an RGBA PNG row band by row band; the compressed data is flushed after every band."""
+
+    def __init__(self, file, width, height, dpi=None, compression_level=6):
+        self.file = file
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        self.compressor = zlib.compressobj(compression_level)
+
+        file.write(b'\x89PNG\r\n\x1a\n')
+        # 8 bits per sample, color type 6 (RGBA), no interlacing
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+        if dpi:
+            pixels_per_meter = int(round(dpi / 0.0254))
+            self._chunk(b'pHYs', struct.pack('>IIB', pixels_per_meter, pixels_per_meter, 1))
+
+    def _chunk(self, kind, data):
+        self.file.write(struct.pack('>I', len(data)))
+        self.file.write(kind)
+        self.file.write(data)
+        self.file.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(kind)) & 0xffffffff))
+
+    def write_rows(self, rgba):
+        """Appends rows given as a (rows, width, 4) uint8 array, top row first."""
+        rows = np.empty((rgba.shape[0], self.width * 4 + 1), dtype=np.uint8)
+        rows[:, 0] = 0  # Filter type None
+        rows[:, 1:] = rgba.reshape(rgba.shape[0], -1)
+        data = self.compressor.compress(rows) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            self._chunk(b'IDAT', data)
+        self.rows_written += rgba.shape[0]
+
+    def close(self):
+        self._chunk(b'IDAT', self.compressor.flush())
+        self._chunk(b'IEND', b'')
+
+
+class TIFFStreamWriter:
+    """
+    Writes an uncompressed RGBA baseline TIFF, one strip per band. The image directory is
+    written after the strips and its offset patched into the header, so the file must be
+    seekable. Classic TIFF is limited to 4 GB.
+    """
+
+    def __init__(self, file, width, height, dpi=None):
+        if width * height * 4 >= 2 ** 32 - 2 ** 20:
+            raise ValueError("The image is too large for a TIFF file (4 GB limit); use PNG instead.")
+        self.file = file
+        self.width = width
+        self.height = height
+        self.dpi = dpi or 72
+        self.rows_written = 0
+        self.strips = []  # (offset, byte count, rows)
+        self.start = file.tell()
+        file.write(b'II*\x00' + struct.pack('<I', 0))  # Directory offset patched in close()
+
+    def write_rows(self, rgba):
+        offset = self.file.tell() - self.start
+        data = np.ascontiguousarray(rgba, dtype=np.uint8)
+        self.file.write(data)
+        self.strips.append((offset, data.nbytes, rgba.shape[0]))
+        self.rows_written += rgba.shape[0]
+
+    def close(self):
+        if self.file.tell() % 2:
+            self.file.write(b'\x00')  # Word alignment of the directory
+        base = self.file.tell() - self.start
+        rows_per_strip = self.strips[0][2] if self.strips else self.height
+
+        # Tag values longer than 4 bytes go after the directory
+        entries = [
+            (256, 4, 1, self.width),                    # ImageWidth
+            (257, 4, 1, self.height),                   # ImageLength
+            (258, 3, 4, struct.pack('<4H', 8, 8, 8, 8)),  # BitsPerSample
+            (259, 3, 1, 1),                             # Compression: none
+            (262, 3, 1, 2),                             # PhotometricInterpretation: RGB
+            (273, 4, len(self.strips), struct.pack(f'<{len(self.strips)}I', *[s[0] for s in self.strips])),
+            (277, 3, 1, 4),                             # SamplesPerPixel
+            (278, 4, 1, rows_per_strip),                # RowsPerStrip
+            (279, 4, len(self.strips), struct.pack(f'<{len(self.strips)}I', *[s[1] for s in self.strips])),
+            (282, 5, 1, struct.pack('<II', int(self.dpi), 1)),  # XResolution
+            (283, 5, 1, struct.pack('<II', int(self.dpi), 1)),  # YResolution
+            (284, 3, 1, 1),                             # PlanarConfiguration: chunky
+            (296, 3, 1, 2),                             # ResolutionUnit: inch
+            (338, 3, 1, 2),                             # ExtraSamples: unassociated alpha
+        ]
+        directory_size = 2 + 12 * len(entries) + 4
+        extra_offset = base + directory_size
+        directory = io.BytesIO()
+        extra = io.BytesIO()
+        directory.write(struct.pack('<H', len(entries)))
+        for tag, kind, count, value in entries:
+            if isinstance(value, bytes):
+                if len(value) <= 4:
+                    directory.write(struct.pack('<HHI', tag, kind, count) + value.ljust(4, b'\x00'))
+                else:
+                    directory.write(struct.pack('<HHII', tag, kind, count, extra_offset + extra.tell()))
+                    extra.write(value)
+            elif kind == 3:
+                directory.write(struct.pack('<HHIHH', tag, kind, count, value, 0))
+            else:
+                directory.write(struct.pack('<HHII', tag, kind, count, value))
+        directory.write(struct.pack('<I', 0))  # No next directory
+
+        self.file.write(directory.getvalue())
+        self.file.write(extra.getvalue())
+        end = self.file.tell()
+        self.file.seek(self.start + 4)
+        self.file.write(struct.pack('<I', base))
+        self.file.seek(end)
+
+
+def render_band(figure, dpi, top, rows, width):
+    """
+    Renders pixel rows [top, top + rows) of the figure saved at dpi.
+
+    Returns:
+        np.ndarray: (rows, width, 4) uint8 RGBA.
+    """
+    width_in, height_in = figure.get_size_inches()
+    # Bbox in inches, measured from the bottom of the figure. Agg flips rows against the
+    # truncated pixel height, so the band edges stay on whole pixels of the full image.
+    height = int(height_in * dpi)
+    y1 = (height - top) / dpi
+    y0 = (height - top - rows) / dpi
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='raw', dpi=dpi, bbox_inches=Bbox.from_extents(0, y0, width_in, y1))
+    data = np.frombuffer(buffer.getbuffer(), dtype=np.uint8)
+    band_width = width
+    band_rows = len(data) // (band_width * 4)
+    if band_rows * band_width * 4 != len(data):
+        # Rounding gave the band another width: infer it from the expected number of rows
+        band_width = len(data) // (rows * 4)
+        band_rows = rows
+    band = data[:band_rows * band_width * 4].reshape(band_rows, band_width, 4)
+    if band.shape == (rows, width, 4):
+        return band
+
+    # Inch/pixel rounding can be one pixel off; crop or pad to the exact band
+    result = np.zeros((rows, width, 4), dtype=np.uint8)
+    result[:min(rows, band_rows), :min(width, band_width)] = band[:rows, :width]
+    return result
+
+
+def save_tiled(figure, file_path, dpi, band_bytes=DEFAULT_BAND_BYTES, progress_callback=None, is_cancelled=None):
+    """
+    Saves the figure as a PNG or TIFF rendered in horizontal bands.
+
+    Parameters:
+        figure (matplotlib.figure.Figure): The figure to save (with an Agg canvas).
+        file_path (str): Output path; .png, .tif or .tiff.
+        dpi (int): Resolution of the image.
+        band_bytes (int): Memory of one rendered band; sets the number of rows per band.
+        progress_callback (callable): Called as progress_callback(done, total, message) after each band (optional).
+        is_cancelled (callable): Checked between bands; the partial file is removed when it returns True (optional).
+
+    Returns:
+        bool: False when the export was cancelled.
+    """
+    width, height = image_size(figure, dpi)
+    rows_per_band = max(1, min(height, band_bytes // (width * 4)))
+    bands = [(top, min(rows_per_band, height - top)) for top in range(0, height, rows_per_band)]
+    is_png = os.path.splitext(file_path)[1].lower() == '.png'
+
+    completed = False
+    try:
+        with open(file_path, 'wb') as f:
+            writer = PNGStreamWriter(f, width, height, dpi) if is_png else TIFFStreamWriter(f, width, height, dpi)
+            for index, (top, rows) in enumerate(bands, start=1):
+                if is_cancelled and is_cancelled():
+                    break
+                writer.write_rows(render_band(figure, dpi, top, rows, width))
+                if progress_callback:
+                    progress_callback(index, len(bands), f"Band {index}/{len(bands)}")
+            else:
+                writer.close()
+                completed = True
+    finally:
+        # A cancelled or failed export leaves no partial file behind
+        if not completed and os.path.exists(file_path):
+            os.remove(file_path)
+    return completed
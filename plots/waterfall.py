@@ -0,0 +1,97 @@
+# plots/waterfall.py
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+from plots.artist_registry import same_data
+from plots.bulk_overlay import MAX_LABELLED_SERIES
+from plots.decimation import decimate_for_axes, DEFAULT_POINT_BUDGET
+
+
+def cycle_colors(count):
+    """The colors of the current property cycle, repeated for count series."""
+    colors = plt.rcParams['axes.prop_cycle'].by_key().get('color', ['C0'])
+    return [colors[i % len(colors)] for i in range(count)]
+
+
+def stack_series(datasets, decimate=False, ax=None, point_budget=DEFAULT_POINT_BUDGET, x_log=False):
+    """
+    Builds the 3D polylines of a waterfall: series i is drawn at offset i, with its x along the
+    x-axis and its y along the z-axis.
+
+    When every series shares the same x-array (and no decimation is asked for) the result is a
+    single (n_series, n_points, 3) array filled by broadcasting; otherwise one (n, 3) array
+    per series.
+
+    Parameters:
+        datasets (list): List of PlotDataset, in offset order.
+        decimate (bool): Whether to min/max decimate every series to the resolution of ax.
+        ax (Axes3D): The axes the waterfall is drawn on (needed for decimation).
+        point_budget (int): Maximum number of points drawn per series.
+        x_log (bool): Whether the x-axis uses a logarithmic scale.
+
+    Returns:
+        np.ndarray or list: The polylines.
+    """
+    first_x = datasets[0].x
+    shared_x = not decimate and all(
+        len(dataset.x) == len(dataset.y) == len(first_x) and same_data(first_x, dataset.x)
+        for dataset in datasets
+    )
+    if shared_x:
+        segments = np.empty((len(datasets), len(first_x), 3))
+        segments[:, :, 0] = first_x
+        segments[:, :, 1] = np.arange(len(datasets))[:, None]
+        segments[:, :, 2] = np.vstack([dataset.y for dataset in datasets])
+        return segments
+
+    segments = []
+    for offset, dataset in enumerate(datasets):
+        x, y = dataset.x, dataset.y
+        if decimate:
+            x, y = decimate_for_axes(ax, x, y, "line", point_budget, x_log)
+        segment = np.empty((len(x), 3))
+        segment[:, 0] = x
+        segment[:, 1] = offset
+        segment[:, 2] = y
+        segments.append(segment)
+    return segments
+
+
+def draw_waterfall(ax, datasets, line_style='-', line_thickness=1,
+                   decimate=False, point_budget=DEFAULT_POINT_BUDGET, x_log=False):
+    """
+    Draws the datasets as a 3D waterfall made of a single Line3DCollection, one draw call for
+    all series. The series keep the colors of the property cycle; with a few series invisible
+    proxies keep the per-file legend entries.
+
+    Returns:
+        Line3DCollection: The collection, or None when there is nothing to draw.
+    """
+    if not datasets:
+        return None
+
+    segments = stack_series(datasets, decimate, ax, point_budget, x_log)
+    colors = cycle_colors(len(datasets))
+    collection = Line3DCollection(
+        segments, colors=colors, linewidths=line_thickness, linestyles=line_style,
+        label=f"{len(datasets)} series" if len(datasets) > MAX_LABELLED_SERIES else None,
+    )
+    ax.add_collection3d(collection)
+
+    if len(datasets) <= MAX_LABELLED_SERIES:
+        for dataset, color in zip(datasets, colors):
+            # Empty lines, only there for ax.legend()
+            ax.add_line(Line2D([], [], color=color, linestyle=line_style, linewidth=line_thickness, label=dataset.label))
+
+    # add_collection3d does not update the data limits
+    x_values = np.concatenate([np.asarray(dataset.x, dtype='float64') for dataset in datasets])
+    y_values = np.concatenate([np.asarray(dataset.y, dtype='float64') for dataset in datasets])
+    if np.isfinite(x_values).any() and np.isfinite(y_values).any():
+        ax.auto_scale_xyz(
+            [np.nanmin(x_values), np.nanmax(x_values)], [0, max(len(datasets) - 1, 1)],
+            [np.nanmin(y_values), np.nanmax(y_values)], had_data=False
+        )
+    return collection
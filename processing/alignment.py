@@ -0,0 +1,148 @@
+# processing/alignment.py
+#
+# Resamples series onto a common x-grid so they can be combined point by point (baseline
+# subtraction with a reference file) even when the instruments shifted the grids slightly. Values are linearly interpolated with np.interp; the grid only covers the
+# x-range shared by the series, nothing is extrapolated.
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Grid modes: the reference's own x-values, the union of all x-values, or a uniform step
+GRID_MODES = ('reference', 'union', 'uniform')
+
+# Number of reference grids kept by GridCache
+GRID_CACHE_SIZE = 8
+
+# Largest uniform grid built; a tiny step over a wide range would otherwise exhaust memory
+MAX_GRID_POINTS = 10_000_000
+
+
+def sorted_series(x, y):
+    """Returns x and y as float arrays sorted by increasing x, as np.interp expects."""
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    if len(x) > 1 and np.any(np.diff(x) < 0):
+        order = np.argsort(x, kind='stable')
+        x, y = x[order], y[order]
+    return x, y
+
+
+def uniform_grid(start, stop, step=None, reference_x=None):
+    """
+    Evenly spaced grid from start to stop (included when it falls on a step). Without a step
+    the median spacing of reference_x is used. Raises ValueError when the grid would have more
+    than MAX_GRID_POINTS points.
+    """
+    if step is None:
+        spacing = np.diff(reference_x) if reference_x is not None else np.array([])
+        spacing = spacing[spacing > 0]
+        if len(spacing) == 0:
+            raise ValueError("Cannot derive a grid step from fewer than two distinct x-values.")
+        step = float(np.median(spacing))
+    if not step > 0:
+        raise ValueError("The grid step must be positive.")
+    count = np.floor((stop - start) / step + 1e-9) + 1
+    if not np.isfinite(count) or count > MAX_GRID_POINTS:
+        raise ValueError(
+            f"A step of {step:g} from {start:g} to {stop:g} gives more than {MAX_GRID_POINTS:,} grid points; "
+            f"use a larger step."
+        )
+    count = int(count)
+    return start + step * np.arange(count)
+
+
+def resample(x, y, grid):
+    """Values of the sorted series (x, y) at the grid points, linearly interpolated."""
+    if len(x) == len(grid) and np.array_equal(x, grid):
+        return y
+    return np.interp(grid, x, y)
+
+
+class ReferenceGrid:
+    """
+    A reference series prepared for alignment: sorted once, with its grid and its values on
+    the grid computed once and reused for every series aligned against it.
+
+    Parameters:
+        x (array-like): X-values of the reference.
+        y (array-like): Y-values of the reference.
+        mode (str): One of GRID_MODES.
+        step (float): Step of the 'uniform' grid (default: median spacing of the reference).
+    """
+
+    def __init__(self, x, y, mode='reference', step=None):
+        if mode not in GRID_MODES:
+            raise ValueError(f"Unknown grid mode: {mode}")
+        self.x, self.y = sorted_series(x, y)
+        if len(self.x) < 2:
+            raise ValueError("The reference needs at least two points.")
+        self.mode = mode
+        if mode == 'uniform':
+            self.grid = uniform_grid(self.x[0], self.x[-1], step, self.x)
+        else:
+            self.grid = self.x
+        self.y_on_grid = resample(self.x, self.y, self.grid)
+
+    def align(self, x, y):
+        """
+        Resamples a series and the reference onto the common grid, limited to the x-range they
+        share.
+
+        Returns:
+            tuple: (grid, series values, reference values); empty arrays when the ranges do not overlap.
+        """
+        x, y = sorted_series(x, y)
+        if len(x) == 0:
+            empty = np.array([])
+            return empty, empty, empty
+        start, stop = max(x[0], self.x[0]), min(x[-1], self.x[-1])
+
+        if self.mode == 'union':
+            grid = np.union1d(self.x, x)
+            grid = grid[(grid >= start) & (grid <= stop)]
+            return grid, resample(x, y, grid), resample(self.x, self.y, grid)
+
+        # Fixed grid: only the series is interpolated, the reference values are cached
+        first = np.searchsorted(self.grid, start, side='left')
+        last = np.searchsorted(self.grid, stop, side='right')
+        grid = self.grid[first:last]
+        return grid, resample(x, y, grid), self.y_on_grid[first:last]
+
+
+class GridCache:
+    """
+    Thread-safe LRU cache of ReferenceGrid objects. Keys should identify the reference data as
+    it is (e.g. DatasetCache.make_key of its file), plus the grid mode and step.
+    """
+
+    def __init__(self, max_entries=GRID_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, x, y, mode='reference', step=None):
+        """Returns the ReferenceGrid of key, building it from x and y on a miss."""
+        full_key = (key, mode, step)
+        with self._lock:
+            grid = self._entries.get(full_key)
+            if grid is not None:
+                self._entries.move_to_end(full_key)
+                return grid
+        grid = ReferenceGrid(x, y, mode, step)
+        with self._lock:
+            self._entries[full_key] = grid
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return grid
+
+    def clear(self, matches=None):
+        """Drops every grid, or only those whose reference key satisfies matches(key)."""
+        with self._lock:
+            if matches is None:
+                self._entries.clear()
+                return
+            for full_key in [k for k in self._entries if matches(k[0])]:
+                del self._entries[full_key]
+
@@ -0,0 +1,219 @@
+# processing/baseline.py
+
+from functools import lru_cache
+
+import numpy as np
+from scipy.linalg import cholesky_banded, cho_solve_banded, solveh_banded
+from scipy.ndimage import minimum_filter1d, maximum_filter1d, uniform_filter1d
+from scipy.special import expit
+
+# Number of (length, lambda) penalties kept; a batch usually shares one or two
+PENALTY_CACHE_SIZE = 16
+
+# Baseline algorithms of estimate_baseline
+BASELINE_ALGORITHMS = ('als', 'arpls', 'airpls', 'rolling_ball', 'snip')
+
+# arPLS stops once the relative change of the weights falls below this
+ARPLS_TOLERANCE = 1e-3
+
+# airPLS stops once the negative residuals fall below this fraction of sum(|y|)
+AIRPLS_TOLERANCE = 1e-3
+
+
+@lru_cache(maxsize=PENALTY_CACHE_SIZE)
+def difference_penalty(length, lambda_):
+    """
+    The smoothness penalty lambda * D^T D of the ALS baseline, with D the second-difference
+    operator, in the upper banded form of scipy.linalg.solveh_banded (3 rows, pentadiagonal).
+
+    Cached per (length, lambda_), together with the Cholesky factor of I + lambda * D^T D: every
+    series starts with unit weights, so the first ALS iteration of all series of the same length
+    reuses one factorization.
+
+    Returns:
+        tuple: (penalty bands, Cholesky factor of the first iteration), both read-only.
+    """
+    if length < 3:
+        raise ValueError("Baseline correction needs at least 3 points.")
+    columns = length - 2
+    coefficients = (1.0, -2.0, 1.0)
+    bands = np.zeros((3, length))
+    # Column k of D holds (1, -2, 1) on rows k, k+1, k+2
+    for offset in range(3):
+        bands[2, offset:offset + columns] += coefficients[offset] ** 2
+    for offset in range(2):
+        bands[1, offset + 1:offset + 1 + columns] += coefficients[offset] * coefficients[offset + 1]
+    bands[0, 2:] = coefficients[0] * coefficients[2]
+    bands *= lambda_
+
+    first = bands.copy()
+    first[2] += 1.0
+    factor = cholesky_banded(first, check_finite=False)
+
+    bands.setflags(write=False)
+    factor.setflags(write=False)
+    return bands, factor
+
+
+def als_baseline(y, lambda_=1e6, p=0.01, niter=10):
+    """
+    Asymmetric Least Squares baseline (Eilers & Boelens).
+
+    Every iteration solves (W + lambda * D^T D) z = W y with the banded Cholesky solver and
+    reweights the points: p above the baseline, 1 - p below it. The weights only take these
+    values, so once an iteration leaves them unchanged the next solve would return the same
+    baseline and the loop stops early.
+
+    Parameters:
+        y (np.ndarray): Y-values (1D).
+        lambda_ (float): Smoothing parameter.
+        p (float): Asymmetry parameter.
+        niter (int): Maximum number of iterations.
+
+    Returns:
+        np.ndarray: The estimated baseline.
+
+    Raises:
+        ValueError: For fewer than 3 points.
+        np.linalg.LinAlgError: When the system is singular.
+    """
+    y = np.asarray(y, dtype='float64')
+    bands, factor = difference_penalty(len(y), float(lambda_))
+
+    w = np.ones(len(y))
+    z = cho_solve_banded((factor, False), y, check_finite=False)
+    for _ in range(1, niter):
+        new_w = p * (y > z) + (1 - p) * (y < z)
+        if np.array_equal(new_w, w):
+            break
+        w = new_w
+        z = solve_weighted(bands, w, y)
+    return z
+
+
+def solve_weighted(bands, w, y):
+    """Solves (W + lambda * D^T D) z = W y for the penalty bands of difference_penalty."""
+    system = bands.copy()
+    system[2] += w
+    return solveh_banded(system, w * y, overwrite_ab=True, check_finite=False)
+
+
+def arpls_baseline(y, lambda_=1e6, niter=50, tol=ARPLS_TOLERANCE):
+    """
+    Asymmetrically reweighted Penalized Least Squares baseline (Baek et al.). The weights
+    follow a logistic function of the residuals, scaled by the spread of the points below
+    the baseline, so noise above the baseline is not treated as signal.
+
+    Returns:
+        np.ndarray: The estimated baseline.
+    """
+    y = np.asarray(y, dtype='float64')
+    bands, factor = difference_penalty(len(y), float(lambda_))
+
+    w = np.ones(len(y))
+    z = cho_solve_banded((factor, False), y, check_finite=False)
+    for _ in range(1, niter):
+        residual = y - z
+        negative = residual[residual < 0]
+        if len(negative) < 2:
+            break
+        mean, std = negative.mean(), negative.std()
+        if std == 0:
+            break
+        new_w = expit(-2 * (residual - (2 * std - mean)) / std)
+        converged = np.linalg.norm(w - new_w) / np.linalg.norm(w) < tol
+        w = new_w
+        if converged:
+            break
+        z = solve_weighted(bands, w, y)
+    return z
+
+
+def airpls_baseline(y, lambda_=1e6, niter=15, tol=AIRPLS_TOLERANCE):
+    """
+    Adaptive iteratively reweighted Penalized Least Squares baseline (Zhang et al.). Points
+    above the baseline get no weight; points below it get a weight growing with their residual
+    and with the iteration.
+
+    Returns:
+        np.ndarray: The estimated baseline.
+    """
+    y = np.asarray(y, dtype='float64')
+    bands, factor = difference_penalty(len(y), float(lambda_))
+    threshold = tol * np.abs(y).sum()
+
+    w = np.ones(len(y))
+    z = cho_solve_banded((factor, False), y, check_finite=False)
+    for i in range(1, niter):
+        residual = y - z
+        below = residual < 0
+        negative_sum = -residual[below].sum()
+        if negative_sum <= threshold:
+            break
+        w = np.zeros(len(y))
+        # Exponents are clipped so long runs do not overflow
+        w[below] = np.exp(np.minimum(i * -residual[below] / negative_sum, 700))
+        # The ends take the weight of the negative residual closest to zero (below 1)
+        w[0] = w[-1] = np.exp(i * residual[below].max() / negative_sum)
+        z = solve_weighted(bands, w, y)
+    return z
+
+
+def rolling_ball_baseline(y, half_window=50, smooth_half_window=0):
+    """
+    Morphological (rolling-ball) baseline: a grey opening of the series with a flat window of
+    2 * half_window + 1 points, i.e. a moving minimum followed by a moving maximum, optionally
+    smoothed by a moving average. Both filters are O(n) whatever the window.
+
+    Returns:
+        np.ndarray: The estimated baseline.
+    """
+    y = np.asarray(y, dtype='float64')
+    size = 2 * half_window + 1
+    z = maximum_filter1d(minimum_filter1d(y, size, mode='nearest'), size, mode='nearest')
+    if smooth_half_window > 0:
+        z = uniform_filter1d(z, 2 * smooth_half_window + 1, mode='nearest')
+        # The average can rise above the data next to narrow dips
+        z = np.minimum(z, y)
+    return z
+
+
+def snip_baseline(y, half_window=50, smooth_half_window=0):
+    """
+    Statistics-sensitive Non-linear Iterative Peak-clipping baseline (Ryan et al.). Pass k
+    replaces every point by the mean of its neighbours k points away when that is lower; each
+    pass is one vectorized O(n) operation, for half_window passes. Clipping follows the lowest
+    noise, so noisy data can first be smoothed by a moving average of 2 * smooth_half_window + 1
+    points.
+
+    Returns:
+        np.ndarray: The estimated baseline.
+    """
+    z = np.array(y, dtype='float64')
+    if smooth_half_window > 0:
+        z = uniform_filter1d(z, 2 * smooth_half_window + 1, mode='nearest')
+    for k in range(1, min(half_window, (len(z) - 1) // 2) + 1):
+        np.minimum(z[k:-k], (z[:-2 * k] + z[2 * k:]) / 2, out=z[k:-k])
+    return z
+
+
+def estimate_baseline(y, algorithm='als', lambda_=1e6, p=0.01, niter=10, half_window=50, smooth_half_window=0):
+    """
+    Estimates the baseline of y with one of BASELINE_ALGORITHMS. Each algorithm only uses its
+    own parameters: lambda_, p and niter for 'als'; lambda_ and niter for 'arpls' and 'airpls';
+    half_window and smooth_half_window for 'rolling_ball' and 'snip'.
+
+    Returns:
+        np.ndarray: The estimated baseline.
+    """
+    if algorithm == 'als':
+        return als_baseline(y, lambda_, p, niter)
+    if algorithm == 'arpls':
+        return arpls_baseline(y, lambda_, niter)
+    if algorithm == 'airpls':
+        return airpls_baseline(y, lambda_, niter)
+    if algorithm == 'rolling_ball':
+        return rolling_ball_baseline(y, half_window, smooth_half_window)
+    if algorithm == 'snip':
+        return snip_baseline(y, half_window, smooth_half_window)
+    raise ValueError(f"Unknown baseline algorithm: {algorithm}")
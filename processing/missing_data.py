@@ -0,0 +1,85 @@
+# processing/missing_data.py
+
+import numpy as np
+
+# Gap filling methods of fill_missing
+FILL_METHODS = ('mean', 'median', 'linear', 'nearest')
+
+
+def neighbour_indices(valid):
+    """
+    Index of the nearest valid value at or before, and at or after, every position.
+
+    Parameters:
+        valid (np.ndarray): Boolean mask of the valid values.
+
+    Returns:
+        tuple: (previous, next) index arrays; -1 / len(valid) where there is none.
+    """
+    n = len(valid)
+    positions = np.arange(n)
+    previous = np.maximum.accumulate(np.where(valid, positions, -1))
+    following = np.minimum.accumulate(np.where(valid, positions, n)[::-1])[::-1]
+    return previous, following
+
+
+def fill_missing(values, method='mean', x=None):
+    """
+    Replaces the NaN values of a series from their nearest valid neighbours, in O(n).
+
+    mean / median: every gap takes the mean of the value before it and the next valid value
+                   (the median of two values is their mean). Gaps are filled in order, so within
+                   a run the value before a gap is the one just filled: the i-th gap of a run
+                   between a and b becomes b + (a - b) / 2**i.
+    linear:        linear interpolation between the neighbours, along x when given.
+    nearest:       the closer of the two neighbours along x (by position when x is None); ties
+                   take the previous value.
+
+    Gaps before the first or after the last valid value take that value. A series without
+    valid values is returned unchanged.
+
+    Parameters:
+        values (array-like): The data series with potential NaN values.
+        method (str): One of FILL_METHODS.
+        x (array-like): Positions of the values for 'linear' and 'nearest' (optional).
+
+    Returns:
+        tuple: (filled np.ndarray, number of values filled)
+    """
+    if method not in FILL_METHODS:
+        raise ValueError(f"Unknown fill method: {method}")
+
+    y = np.array(values, dtype='float64')
+    missing = np.isnan(y)
+    if not missing.any() or missing.all():
+        return y, 0
+
+    n = len(y)
+    previous, following = neighbour_indices(~missing)
+    gaps = np.flatnonzero(missing)
+    before = previous[gaps]
+    after = following[gaps]
+    has_before = before >= 0
+    has_after = after < n
+    # Clipped so the gaps at the ends can be indexed; those are replaced below
+    a = y[np.clip(before, 0, n - 1)]
+    b = y[np.clip(after, 0, n - 1)]
+
+    if method in ('mean', 'median'):
+        depth = gaps - before  # Position of the gap in its run, from 1
+        filled = b + (a - b) * np.exp2(-depth.astype('float64'))
+    else:
+        positions = np.arange(n, dtype='float64') if x is None else np.asarray(x, dtype='float64')
+        x_gap = positions[gaps]
+        x_before = positions[np.clip(before, 0, n - 1)]
+        x_after = positions[np.clip(after, 0, n - 1)]
+        if method == 'linear':
+            span = x_after - x_before
+            t = np.divide(x_gap - x_before, span, out=np.full(len(gaps), 0.5), where=span != 0)
+            filled = a + (b - a) * t
+        else:
+            filled = np.where(np.abs(x_gap - x_before) <= np.abs(x_after - x_gap), a, b)
+
+    filled = np.where(has_before, np.where(has_after, filled, a), b)
+    y[gaps] = filled
+    return y, int(np.count_nonzero(~np.isnan(filled)))
@@ -0,0 +1,101 @@
+# processing/reference_store.py
+
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+import pandas as pd
+
+from utils import load_numeric_data, DataReadError, DatasetCache
+from processing.alignment import GridCache
+
+# A reference series, cleaned and validated; key identifies the file as it was loaded
+ReferenceData = namedtuple('ReferenceData', ['path', 'key', 'x', 'y'])
+
+# Number of (file, columns) references kept
+REFERENCE_STORE_SIZE = 16
+
+
+class ReferenceStore:
+    """
+    Reference datasets (dark, blank, solvent, ...) loaded, cleaned and validated once, and
+    reused by every data file of an apply and by later applies.
+
+    Entries are keyed by (absolute path, mtime, size, columns), so a reference that changes on
+    disk is reloaded and its stale entries are dropped. The common x-grids of the references
+    (see processing.alignment) are cached alongside. Safe to use from worker threads.
+    """
+
+    def __init__(self, max_entries=REFERENCE_STORE_SIZE):
+        self.max_entries = max_entries
+        self.grids = GridCache()
+        self._entries = OrderedDict()  # key -> ReferenceData
+        self._lock = threading.RLock()
+
+    def get(self, file_path, columns=None):
+        """
+        Returns the ReferenceData of the selected columns of a file, loading it on a miss.
+
+        Raises:
+            DataReadError: When the file cannot be read or holds no valid numeric data.
+        """
+        key = DatasetCache.make_key(file_path, tuple(columns) if columns is not None else None)
+        if key is None:
+            raise DataReadError(f"Reference file not found: {file_path}")
+
+        # Held while loading, so concurrent users of the same reference wait for one load
+        with self._lock:
+            reference = self._entries.get(key)
+            if reference is not None:
+                self._entries.move_to_end(key)
+                return reference
+
+            df = load_numeric_data(file_path, columns=columns)
+            x_series = pd.to_numeric(df.iloc[:, 0], errors='coerce')
+            y_series = pd.to_numeric(df.iloc[:, 1], errors='coerce')
+            valid_mask = (x_series.notna() & y_series.notna()).values
+            x = x_series.values[valid_mask].astype('float64')
+            y = y_series.values[valid_mask].astype('float64')
+            if len(x) == 0:
+                raise DataReadError(f"No valid numeric data found in selected columns of the reference file {file_path}.")
+
+            # Entries of older versions of the file are stale
+            for stale in [k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]]:
+                del self._entries[stale]
+            self.grids.clear(lambda grid_key: grid_key[0] == key[0] and grid_key[1:3] != key[1:3])
+            reference = ReferenceData(key[0], key, x, y)
+            self._entries[key] = reference
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return reference
+
+    def preload(self, file_paths, columns=None):
+        """
+        Loads references ahead of their use.
+
+        Returns:
+            list: (file_path, error message) for every file that could not be loaded.
+        """
+        errors = []
+        for file_path in file_paths:
+            try:
+                self.get(file_path, columns)
+            except DataReadError as e:
+                errors.append((file_path, str(e)))
+        return errors
+
+    def grid(self, reference, mode='reference', step=None):
+        """The ReferenceGrid of a reference for a grid mode and step, built once."""
+        return self.grids.get(reference.key, reference.x, reference.y, mode, step)
+
+    def invalidate(self, file_path=None):
+        """Drops the references of file_path, or every reference when no path is given."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self.grids.clear()
+                return
+            path = os.path.abspath(file_path)
+            for stale in [k for k in self._entries if k[0] == path]:
+                del self._entries[stale]
+            self.grids.clear(lambda key: key[0] == path)
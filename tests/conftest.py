@@ -0,0 +1,24 @@
+# tests/conftest.py
+
+import os
+import time
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """The QApplication of the Qt tests (offscreen)."""
+    QApplication = pytest.importorskip("PyQt5.QtWidgets").QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def wait_until(app, condition, timeout=5.0):
+    """Processes Qt events until condition() holds; returns its last value."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    return condition()
@@ -0,0 +1,92 @@
+# tests/test_alignment.py
+
+import numpy as np
+import pytest
+
+from processing.alignment import sorted_series, uniform_grid, ReferenceGrid, GridCache, MAX_GRID_POINTS
+
+
+def test_unsorted_series_are_sorted_together():
+    x, y = sorted_series([3.0, 1.0, 2.0], [30.0, 10.0, 20.0])
+    np.testing.assert_array_equal(x, [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(y, [10.0, 20.0, 30.0])
+
+
+def test_uniform_grid_includes_the_stop_on_a_step():
+    np.testing.assert_allclose(uniform_grid(0.0, 1.0, 0.25), [0.0, 0.25, 0.5, 0.75, 1.0])
+
+
+def test_uniform_grid_step_defaults_to_the_median_spacing():
+    grid = uniform_grid(0.0, 1.0, reference_x=np.array([0.0, 0.1, 0.2, 0.3, 5.0]))
+    assert len(grid) == 11
+
+
+@pytest.mark.parametrize("step", [0.0, -1.0, np.nan])
+def test_uniform_grid_rejects_invalid_steps(step):
+    with pytest.raises(ValueError):
+        uniform_grid(0.0, 1.0, step)
+
+
+def test_uniform_grid_is_capped():
+    with pytest.raises(ValueError, match="grid points"):
+        uniform_grid(0.0, 1.0, 1.0 / (MAX_GRID_POINTS * 2))
+    with pytest.raises(ValueError):
+        uniform_grid(0.0, np.inf, 1.0)
+
+
+def test_reference_grid_aligns_on_the_reference_x_values():
+    reference = ReferenceGrid([0.0, 1.0, 2.0, 3.0, 4.0], [0.0, 10.0, 20.0, 30.0, 40.0])
+    grid, values, reference_values = reference.align([0.5, 1.5, 2.5, 3.5], [5.0, 15.0, 25.0, 35.0])
+
+    np.testing.assert_array_equal(grid, [1.0, 2.0, 3.0])  # Only the shared range, nothing extrapolated
+    np.testing.assert_allclose(values, [10.0, 20.0, 30.0])
+    np.testing.assert_allclose(reference_values, [10.0, 20.0, 30.0])
+
+
+def test_union_grid_keeps_the_x_values_of_both():
+    reference = ReferenceGrid([0.0, 1.0, 2.0], [0.0, 1.0, 2.0], mode='union')
+    grid, values, reference_values = reference.align([0.5, 1.5], [1.0, 3.0])
+    np.testing.assert_array_equal(grid, [0.5, 1.0, 1.5])
+    np.testing.assert_allclose(reference_values, [0.5, 1.0, 1.5])
+
+
+def test_uniform_reference_values_are_computed_once():
+    reference = ReferenceGrid(np.linspace(0.0, 10.0, 101), np.linspace(0.0, 10.0, 101), mode='uniform', step=0.5)
+    grid, values, reference_values = reference.align([2.0, 4.0], [0.0, 2.0])
+
+    np.testing.assert_allclose(grid, [2.0, 2.5, 3.0, 3.5, 4.0])
+    np.testing.assert_allclose(values, [0.0, 0.5, 1.0, 1.5, 2.0])
+    assert np.shares_memory(reference_values, reference.y_on_grid)
+
+
+def test_disjoint_ranges_give_empty_arrays():
+    reference = ReferenceGrid([0.0, 1.0], [0.0, 1.0])
+    grid, values, reference_values = reference.align([5.0, 6.0], [1.0, 2.0])
+    assert len(grid) == len(values) == len(reference_values) == 0
+
+
+def test_reference_needs_two_points_and_a_known_mode():
+    with pytest.raises(ValueError):
+        ReferenceGrid([1.0], [1.0])
+    with pytest.raises(ValueError):
+        ReferenceGrid([0.0, 1.0], [0.0, 1.0], mode='nearest')
+
+
+def test_grid_cache_builds_each_grid_once_and_evicts_the_oldest():
+    cache = GridCache(max_entries=2)
+    x = y = np.arange(10.0)
+    first = cache.get('a', x, y)
+    assert cache.get('a', x, y) is first
+    assert cache.get('a', x, y, mode='uniform', step=0.5) is not first
+
+    cache.get('b', x, y)
+    assert cache.get('a', x, y) is not first  # Evicted by the two newer grids
+
+
+def test_grid_cache_clears_the_matching_references():
+    cache = GridCache()
+    x = y = np.arange(10.0)
+    a, b = cache.get('a', x, y), cache.get('b', x, y)
+    cache.clear(lambda key: key == 'a')
+    assert cache.get('a', x, y) is not a
+    assert cache.get('b', x, y) is b
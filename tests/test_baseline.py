@@ -0,0 +1,50 @@
+# tests/test_baseline.py
+
+import numpy as np
+import pytest
+
+from processing.baseline import estimate_baseline, difference_penalty, BASELINE_ALGORITHMS
+
+# Parameters suited to the synthetic signal below, per algorithm
+PARAMETERS = {
+    'als': dict(lambda_=1e5, p=0.01, niter=10),
+    'arpls': dict(lambda_=1e5, niter=50),
+    'airpls': dict(lambda_=1e5, niter=15),
+    'rolling_ball': dict(half_window=60, smooth_half_window=10),
+    'snip': dict(half_window=60),
+}
+
+
+def synthetic_signal(n=1000):
+    """Two Gaussian peaks on a slowly curving baseline, with a little noise."""
+    x = np.linspace(0.0, 1.0, n)
+    baseline = 2.0 + 1.5 * x - 1.0 * x ** 2
+    peaks = 5.0 * np.exp(-((x - 0.3) / 0.01) ** 2) + 3.0 * np.exp(-((x - 0.7) / 0.015) ** 2)
+    noise = np.random.default_rng(0).normal(0.0, 0.01, n)
+    return baseline + peaks + noise, baseline
+
+
+@pytest.mark.parametrize("algorithm", BASELINE_ALGORITHMS)
+def test_each_algorithm_recovers_the_baseline_under_the_peaks(algorithm):
+    y, baseline = synthetic_signal()
+    z = estimate_baseline(y, algorithm, **PARAMETERS[algorithm])
+
+    assert z.shape == y.shape
+    # Away from the ends, the estimate follows the true baseline and ignores the peaks
+    inner = slice(100, -100)
+    assert np.max(np.abs(z[inner] - baseline[inner])) < 0.15
+    corrected = y - z
+    assert corrected.max() > 4.5
+
+
+def test_penalty_is_cached_and_read_only():
+    bands, factor = difference_penalty(50, 1e4)
+    assert difference_penalty(50, 1e4)[0] is bands
+    assert not bands.flags.writeable and not factor.flags.writeable
+
+
+def test_too_short_series_and_unknown_algorithms_are_rejected():
+    with pytest.raises(ValueError):
+        estimate_baseline([1.0, 2.0], 'als')
+    with pytest.raises(ValueError):
+        estimate_baseline(np.ones(10), 'polynomial')
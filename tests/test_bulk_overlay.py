@@ -0,0 +1,68 @@
+# tests/test_bulk_overlay.py
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from plots.plotting import PlotDataset
+from plots.bulk_overlay import draw_bulk_overlay, add_series_colorbar, series_colors, MAX_LABELLED_SERIES
+
+
+def make_axes():
+    figure = Figure(figsize=(6, 4))
+    FigureCanvasAgg(figure)
+    return figure, figure.add_subplot(111)
+
+
+def make_datasets(count, n=1000):
+    x = np.linspace(0.0, 10.0, n)
+    return [PlotDataset(f"file{i}", f"file{i}", x, np.sin(x) + i) for i in range(count)]
+
+
+def test_all_series_share_one_collection():
+    figure, ax = make_axes()
+    datasets = make_datasets(5)
+    collection = draw_bulk_overlay(ax, datasets)
+
+    assert list(ax.collections) == [collection] and not ax.lines
+    assert len(collection.get_segments()) == 5
+    np.testing.assert_array_equal(collection.get_segments()[3][:, 1], datasets[3].y)
+    np.testing.assert_allclose(collection.get_colors(), series_colors(5))
+    assert collection.get_label() == "5 series"
+
+
+def test_nothing_is_drawn_without_datasets():
+    figure, ax = make_axes()
+    assert draw_bulk_overlay(ax, []) is None
+    assert not ax.collections
+
+
+def test_decimated_series_fit_the_point_budget():
+    figure, ax = make_axes()
+    datasets = make_datasets(3, n=200_000)
+    datasets[1].y[123_456] = 100.0
+    collection = draw_bulk_overlay(ax, datasets, decimate=True, point_budget=2000)
+
+    for segment in collection.get_segments():
+        assert len(segment) <= 2000
+    assert collection.get_segments()[1][:, 1].max() == 100.0
+
+
+def test_colorbar_labels_a_few_series_by_name():
+    figure, ax = make_axes()
+    datasets = make_datasets(4)
+    colorbar = add_series_colorbar(figure, ax, datasets)
+    assert [label.get_text() for label in colorbar.ax.get_yticklabels()] == ["file0", "file1", "file2", "file3"]
+
+
+def test_colorbar_numbers_many_series():
+    figure, ax = make_axes()
+    colorbar = add_series_colorbar(figure, ax, make_datasets(MAX_LABELLED_SERIES + 1))
+    assert colorbar.ax.get_ylabel() == "Series #"
+
+
+def test_single_series_has_no_colorbar():
+    figure, ax = make_axes()
+    assert add_series_colorbar(figure, ax, make_datasets(1)) is None
@@ -0,0 +1,123 @@
+# tests/test_decimation.py
+
+import numpy as np
+import pytest
+
+from plots.decimation import (minmax_decimation_indices, decimate_line, decimate_scatter, POINTS_PER_BIN)
+
+
+def noisy_line(n=100_000, seed=0):
+    x = np.linspace(0.0, 100.0, n)
+    y = np.sin(x) + np.random.default_rng(seed).normal(0.0, 0.1, n)
+    return x, y
+
+
+def test_line_decimation_keeps_every_peak():
+    x, y = noisy_line()
+    y[12_345] = 50.0
+    y[67_890] = -50.0
+    xs, ys = decimate_line(x, y, 500)
+
+    assert len(xs) <= POINTS_PER_BIN * 500
+    assert ys.max() == 50.0 and ys.min() == -50.0
+
+
+def test_line_decimation_keeps_the_ends_and_the_order():
+    x, y = noisy_line()
+    indices = minmax_decimation_indices(x, y, 300)
+    assert indices[0] == 0 and indices[-1] == len(y) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_decreasing_x_is_decimated_like_increasing_x():
+    x, y = noisy_line()
+    xs, ys = decimate_line(x, y, 200)
+    xr, yr = decimate_line(x[::-1], y[::-1], 200)
+    np.testing.assert_array_equal(np.sort(xs), np.sort(xr))
+
+
+def test_nan_gaps_stay_visible():
+    x, y = noisy_line()
+    y[40_000:41_000] = np.nan
+    xs, ys = decimate_line(x, y, 400)
+
+    gap = (xs >= x[40_000]) & (xs <= x[40_999])
+    assert np.isnan(ys[gap]).any()
+    assert not np.isnan(ys[~gap]).any()
+
+
+def test_short_traces_are_not_decimated():
+    x, y = noisy_line(1000)
+    xs, ys = decimate_line(x, y, 500)
+    assert xs is x and ys is y
+
+
+@pytest.mark.parametrize("point_budget", [500, 8000])
+def test_scatter_decimation_respects_the_point_budget(point_budget):
+    rng = np.random.default_rng(1)
+    x = rng.random(500_000)
+    y = rng.random(500_000)
+    xs, ys = decimate_scatter(x, y, 1000, 700, point_budget=point_budget)
+
+    assert 0 < len(xs) <= point_budget
+    # Kept points are original points, in their original order
+    kept = np.flatnonzero(np.isin(x, xs))
+    np.testing.assert_array_equal(x[kept], xs)
+
+
+def test_scatter_decimation_keeps_one_point_per_pixel_without_a_budget():
+    x = np.repeat(np.arange(10.0), 1000)
+    y = np.tile(np.arange(10.0), 1000)
+    xs, ys = decimate_scatter(x, y, 10, 10)
+    assert len(xs) == 100
+
+
+def axes_with_trace(plot_type, n=200_000, point_budget=2000):
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from plots.decimation import LevelOfDetail, decimate_for_axes
+
+    figure = Figure(figsize=(8, 5), dpi=100)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    x, y = noisy_line(n)
+    xs, ys = decimate_for_axes(ax, x, y, plot_type, point_budget)
+    artist = ax.plot(xs, ys)[0] if plot_type == "line" else ax.scatter(xs, ys)
+    # As in render_datasets, the axes keeps the LevelOfDetail alive (callbacks are weak references)
+    ax.level_of_detail = LevelOfDetail(ax, point_budget)
+    assert ax.level_of_detail.track(artist, x, y, plot_type)
+    return ax, artist, x, y
+
+
+def test_zooming_in_redecimates_the_visible_window():
+    ax, line, x, y = axes_with_trace("line")
+    before = len(line.get_xdata())
+
+    ax.set_xlim(10.0, 10.5)
+    xs = line.get_xdata()
+    visible = (x >= 10.0) & (x <= 10.5)
+    # The window holds fewer points than the budget: drawn at full resolution, plus one point on each side
+    assert len(xs) == np.count_nonzero(visible) + 2
+    assert xs[0] < 10.0 < xs[1] and xs[-2] < 10.5 < xs[-1]
+    assert before <= 2000
+
+    ax.set_xlim(0.0, 100.0)
+    assert len(line.get_xdata()) <= 2000
+
+
+def test_zooming_in_redecimates_scatter_traces():
+    ax, collection, x, y = axes_with_trace("scatter")
+    ax.set_xlim(50.0, 50.5)
+    ax.set_ylim(-2.0, 2.0)
+    offsets = collection.get_offsets()
+    assert len(offsets) == np.count_nonzero((x >= 50.0) & (x <= 50.5))
+    assert offsets[:, 0].min() >= 50.0 and offsets[:, 0].max() <= 50.5
+
+
+def test_unsorted_lines_are_not_tracked():
+    from plots.decimation import LevelOfDetail
+    ax, _, x, y = axes_with_trace("line", n=1000)
+    lod = LevelOfDetail(ax)
+    assert not lod.track(ax.plot([0, 2, 1], [0, 1, 2])[0], [0, 2, 1], [0, 1, 2], "line")
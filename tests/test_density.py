@@ -0,0 +1,76 @@
+# tests/test_density.py
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from plots.decimation import axes_pixel_size
+from plots.density import histogram_counts, DensityView
+
+
+def make_axes():
+    figure = Figure(figsize=(6, 4))
+    FigureCanvasAgg(figure)
+    return figure, figure.add_subplot(111)
+
+
+def random_points(n=100_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0.0, 1.0, n), rng.uniform(0.0, 1.0, n)
+
+
+def test_every_point_in_range_is_counted_once():
+    x, y = random_points()
+    counts = histogram_counts(x, y, (0.0, 1.0), (0.0, 1.0), 40, 30)
+    assert counts.shape == (30, 40)
+    assert counts.sum() == len(x)
+
+
+def test_points_outside_the_range_and_nans_are_dropped():
+    x = np.array([0.5, 2.0, np.nan, 0.1])
+    y = np.array([0.5, 0.5, 0.5, -1.0])
+    assert histogram_counts(x, y, (0.0, 1.0), (0.0, 1.0), 10, 10).sum() == 1
+
+
+def test_log_bins_are_uniform_in_log_space():
+    x = np.array([1.0, 10.0, 100.0, 999.0])
+    y = np.full(4, 0.5)
+    counts = histogram_counts(x, y, (1.0, 1000.0), (0.0, 1.0), 3, 1, x_log=True)
+    np.testing.assert_array_equal(counts, [[1, 1, 2]])
+
+
+def test_density_view_bins_at_screen_resolution():
+    figure, ax = make_axes()
+    x, y = random_points()
+    ax.density_view = view = DensityView(ax, x, y)
+
+    width, height = axes_pixel_size(ax)
+    assert view.artist.get_array().shape == (height, width)
+    assert view.artist.get_array().sum() == len(x)
+
+
+def test_zooming_in_rebins_the_visible_window():
+    figure, ax = make_axes()
+    x, y = random_points()
+    ax.density_view = view = DensityView(ax, x, y)
+
+    ax.set_xlim(0.0, 0.1)
+    ax.set_ylim(0.0, 0.1)
+    inside = (x <= 0.1) & (y <= 0.1)
+    assert view.artist.get_extent() == [0.0, 0.1, 0.0, 0.1]
+    assert view.artist.get_array().sum() == np.count_nonzero(inside)
+    assert view.norm.vmax == view.artist.get_array().max()
+
+
+def test_log_scale_switches_to_a_mesh():
+    figure, ax = make_axes()
+    x, y = random_points()
+    x += 1.0
+    ax.density_view = view = DensityView(ax, x, y, x_log=False)
+
+    ax.set_xscale('log')
+    view.set_scales(True, False)
+    assert not hasattr(view.artist, 'set_extent')
+    assert view.artist in ax.collections and not ax.images
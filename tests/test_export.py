@@ -0,0 +1,134 @@
+# tests/test_export.py
+
+import os
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import plots.export
+from plots.plotting import render_datasets, PlotDataset
+from plots.export import snapshot_figure, clone_figure, export_figure, rasterize_dense_artists, apply_export_fonts
+
+PLOT_DETAILS = {'line_style': 'Solid', 'point_style': 'None', 'line_thickness': '1', 'scale_type': 'Linear'}
+AXIS_DETAILS = {'title': 'Test'}
+
+
+def rendered_figure(plot_type='Line', n=300_000, count=3, decimate=True):
+    figure = Figure(figsize=(6, 4), dpi=100)
+    FigureCanvasAgg(figure)
+    x = np.linspace(0.0, 1.0, n)
+    datasets = [PlotDataset(str(i), str(i), x, np.sin(x * 50.0) + i) for i in range(count)]
+    plot_visuals = {'plot_type': plot_type, 'plot_style': 'default', 'decimate': decimate, 'decimation_points': 50_000}
+    render_datasets(figure, datasets, PLOT_DETAILS, AXIS_DETAILS, plot_visuals)
+    return figure, datasets
+
+
+def test_snapshot_shares_the_full_resolution_data_instead_of_copying_it():
+    figure, datasets = rendered_figure()
+    snapshot = snapshot_figure(figure)
+
+    assert len(snapshot.data) < datasets[0].x.nbytes  # Only the decimated lines are serialized
+    assert len(snapshot.arrays) == 4  # The shared x-array once, and every y-array
+    clone = clone_figure(snapshot)
+    assert clone.artist_registry is None
+    assert clone.axes[0].level_of_detail.traces[0]['x'] is datasets[0].x
+
+
+def test_snapshot_is_independent_of_the_live_figure():
+    figure, datasets = rendered_figure()
+    clone = clone_figure(snapshot_figure(figure))
+
+    figure.axes[0].set_xlim(0.2, 0.3)
+    figure.axes[0].lines[0].set_color('red')
+    assert clone.axes[0].get_xlim() != (0.2, 0.3)
+    assert clone.axes[0].lines[0].get_color() != 'red'
+
+
+def test_export_redecimates_for_the_exported_size(tmp_path, monkeypatch):
+    figure, datasets = rendered_figure()
+    drawn = len(figure.axes[0].lines[0].get_xdata())
+    clones = []
+
+    def recording_clone(snapshot):
+        clones.append(clone_figure(snapshot))
+        return clones[-1]
+
+    monkeypatch.setattr(plots.export, 'clone_figure', recording_clone)
+    file_path = str(tmp_path / "plot.png")
+    assert export_figure(snapshot_figure(figure), file_path, 24, 16, 100) == file_path
+
+    assert len(clones[0].axes[0].lines[0].get_xdata()) > drawn
+    assert len(figure.axes[0].lines[0].get_xdata()) == drawn  # The live figure is untouched
+    assert (tmp_path / "plot.png").read_bytes().startswith(b'\x89PNG')
+
+
+def test_density_plots_share_their_points(tmp_path):
+    figure, datasets = rendered_figure('Density', n=200_000, count=1, decimate=False)
+    snapshot = snapshot_figure(figure)
+
+    assert len(snapshot.data) < datasets[0].x.nbytes
+    assert export_figure(snapshot, str(tmp_path / "density.png"), 8, 6, 100)
+
+
+def test_only_dense_data_artists_are_rasterized():
+    figure = Figure(figsize=(6, 4))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    dense, = ax.plot(np.arange(10_000), np.arange(10_000))
+    sparse, = ax.plot(np.arange(10), np.arange(10))
+    points = ax.scatter(np.arange(6000), np.arange(6000))
+    text = ax.annotate("peak", (5, 5))
+
+    assert rasterize_dense_artists(figure, threshold=5000) == 2
+    assert dense.get_rasterized() and points.get_rasterized()
+    assert not sparse.get_rasterized() and not text.get_rasterized()
+
+
+def test_vector_export_embeds_the_rasterized_data(tmp_path):
+    figure, datasets = rendered_figure(decimate=False, n=20_000)
+    vector, rasterized = str(tmp_path / "vector.svg"), str(tmp_path / "rasterized.svg")
+
+    export_figure(snapshot_figure(figure), vector, 6, 4, 100)
+    export_figure(snapshot_figure(figure), rasterized, 6, 4, 100,
+                  export_options={'rasterize': True, 'rasterize_threshold': 5000, 'raster_dpi': 72})
+
+    rasterized_svg = open(rasterized).read()
+    assert '<image' in rasterized_svg and '<image' not in open(vector).read()
+    assert 'Test' in rasterized_svg  # The title stays vector text
+
+
+def test_raster_formats_ignore_the_rasterize_option(tmp_path):
+    figure, datasets = rendered_figure(decimate=False, n=20_000)
+    file_path = str(tmp_path / "plot.png")
+    assert export_figure(snapshot_figure(figure), file_path, 6, 4, 100, export_options={'rasterize': True}) == file_path
+    assert (tmp_path / "plot.png").read_bytes().startswith(b'\x89PNG')
+
+
+def test_cancelled_export_writes_nothing(tmp_path):
+    figure, datasets = rendered_figure(n=1000)
+    steps = []
+
+    def progress(done, total, message):
+        steps.append(message)
+
+    file_path = str(tmp_path / "plot.pdf")
+    result = export_figure(snapshot_figure(figure), file_path, 6, 4, 100,
+                           progress_callback=progress, is_cancelled=lambda: len(steps) >= 1)
+    assert result is None
+    assert steps == ["Preparing figure"]
+    assert not os.path.exists(file_path)
+
+
+def test_latex_fonts_are_applied_to_the_export_only():
+    figure, datasets = rendered_figure(n=1000)
+    latex_options = {'font_family': 'serif', 'base_font_size': 8, 'title_font_size': 14,
+                     'axis_font_size': 9, 'use_latex': False}
+    clone = clone_figure(snapshot_figure(figure))
+    apply_export_fonts(clone, latex_options)
+
+    assert clone.axes[0].title.get_fontsize() == 14
+    assert clone.axes[0].xaxis.label.get_fontsize() == 9
+    assert figure.axes[0].title.get_fontsize() != 14
@@ -0,0 +1,96 @@
+# tests/test_jobs.py
+
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtWidgets import QWidget
+
+from gui.utils.jobs import JobRunner, JobQueue
+from conftest import wait_until
+
+
+@pytest.fixture
+def widget(qapp):
+    return QWidget()
+
+
+def work_until_cancelled(started):
+    def fn(job):
+        started.set()
+        while True:
+            job.check_cancelled()
+            threading.Event().wait(0.001)
+    return fn
+
+
+def test_cancelled_job_delivers_no_result(qapp, widget):
+    runner = JobRunner(widget)
+    started = threading.Event()
+    results, finished = [], []
+    job = runner.start(work_until_cancelled(started), results.append, on_finished=lambda: finished.append(True))
+    cancelled = []
+    job.signals.cancelled.connect(lambda: cancelled.append(True))
+    assert started.wait(5)
+
+    runner.cancel()
+    assert not runner.is_running()
+    assert wait_until(qapp, lambda: cancelled)
+    assert results == [] and finished == []  # A job that is no longer current reports nothing
+
+
+def test_starting_a_job_cancels_the_previous_one(qapp, widget):
+    runner = JobRunner(widget)
+    started = threading.Event()
+    results = []
+    first = runner.start(work_until_cancelled(started), results.append)
+    assert started.wait(5)
+
+    runner.start(lambda job: 'second', results.append)
+    assert first.is_cancelled()
+    assert wait_until(qapp, lambda: results == ['second'] and not runner.is_running())
+
+
+def test_map_stops_between_items(qapp, widget):
+    runner = JobRunner(widget)
+    done = []
+
+    def process(item):
+        done.append(item)
+        if item == 2:
+            runner.current_job.cancel()
+        return item
+
+    job = runner.start(lambda job: job.map([1, 2, 3, 4], process), lambda result: None)
+    cancelled = []
+    job.signals.cancelled.connect(lambda: cancelled.append(True))
+    assert wait_until(qapp, lambda: cancelled)
+    assert done == [1, 2]
+
+
+def test_queue_runs_jobs_in_order_and_delivers_every_result(qapp, widget):
+    queue = JobQueue(widget)
+    results = []
+    for i in range(5):
+        queue.submit(lambda job, i=i: i, results.append)
+    assert wait_until(qapp, lambda: queue.pending_count() == 0)
+    assert results == [0, 1, 2, 3, 4]
+
+
+def test_cancel_all_stops_the_running_job_and_skips_the_queued_ones(qapp, widget):
+    queue = JobQueue(widget)
+    started = threading.Event()
+    ran, results, cancelled = [], [], []
+    running = queue.submit(work_until_cancelled(started), results.append)
+    running.signals.cancelled.connect(lambda: cancelled.append('running'))
+    for i in range(3):
+        job = queue.submit(lambda job, i=i: ran.append(i), results.append)
+        job.signals.cancelled.connect(lambda i=i: cancelled.append(i))
+    assert started.wait(5)
+
+    queue.cancel_all()
+    assert wait_until(qapp, lambda: queue.pending_count() == 0)
+    assert ran == [] and results == []
+    assert cancelled == ['running', 0, 1, 2]
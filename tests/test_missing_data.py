@@ -0,0 +1,64 @@
+# tests/test_missing_data.py
+
+import numpy as np
+import pytest
+
+from processing.missing_data import fill_missing, FILL_METHODS
+
+NAN = np.nan
+
+
+def test_mean_fills_each_gap_from_the_value_before_it():
+    filled, count = fill_missing([1.0, NAN, NAN, 9.0], 'mean')
+    np.testing.assert_allclose(filled, [1.0, 5.0, 7.0, 9.0])
+    assert count == 2
+
+
+def test_median_matches_mean():
+    values = [NAN, 2.0, NAN, NAN, 6.0, NAN]
+    np.testing.assert_allclose(fill_missing(values, 'median')[0], fill_missing(values, 'mean')[0])
+
+
+def test_linear_interpolates_by_position():
+    filled, count = fill_missing([1.0, NAN, NAN, 4.0], 'linear')
+    np.testing.assert_allclose(filled, [1.0, 2.0, 3.0, 4.0])
+    assert count == 2
+
+
+def test_linear_interpolates_along_x():
+    filled, _ = fill_missing([0.0, NAN, 10.0], 'linear', x=[0.0, 9.0, 10.0])
+    np.testing.assert_allclose(filled, [0.0, 9.0, 10.0])
+
+
+def test_nearest_takes_the_closer_neighbour_and_the_previous_one_on_ties():
+    filled, _ = fill_missing([1.0, NAN, NAN, NAN, 5.0], 'nearest')
+    np.testing.assert_allclose(filled, [1.0, 1.0, 1.0, 5.0, 5.0])
+    filled, _ = fill_missing([1.0, NAN, 5.0], 'nearest', x=[0.0, 3.0, 4.0])
+    np.testing.assert_allclose(filled, [1.0, 5.0, 5.0])
+
+
+@pytest.mark.parametrize("method", FILL_METHODS)
+def test_gaps_at_the_ends_take_the_closest_valid_value(method):
+    filled, count = fill_missing([NAN, NAN, 3.0, 4.0, NAN], method)
+    np.testing.assert_allclose(filled, [3.0, 3.0, 3.0, 4.0, 4.0])
+    assert count == 3
+
+
+@pytest.mark.parametrize("method", FILL_METHODS)
+def test_series_without_gaps_or_without_values_are_unchanged(method):
+    filled, count = fill_missing([1.0, 2.0], method)
+    np.testing.assert_array_equal(filled, [1.0, 2.0])
+    assert count == 0
+    filled, count = fill_missing([NAN, NAN], method)
+    assert np.isnan(filled).all() and count == 0
+
+
+def test_input_is_not_modified():
+    values = np.array([1.0, NAN, 3.0])
+    fill_missing(values, 'linear')
+    assert np.isnan(values[1])
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        fill_missing([1.0, NAN], 'spline')
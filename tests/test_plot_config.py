@@ -0,0 +1,54 @@
+# tests/test_plot_config.py
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from gui.plot.plot_config import (PlotConfig, classify_change, diff_settings,
+                                  DATA, STYLE, GEOMETRY, DECORATION)
+
+
+def test_known_settings_are_classified():
+    assert classify_change('plot_details', 'x_axis_col') == DATA
+    assert classify_change('plot_details', 'line_style') == STYLE
+    assert classify_change('axis_details', 'x_min') == GEOMETRY
+    assert classify_change('axis_details', 'title') == DECORATION
+
+
+def test_unknown_settings_are_treated_as_data_changes():
+    assert classify_change('plot_details', 'something_new') == DATA
+    assert classify_change('unknown_section', 'title') == DATA
+
+
+def test_diff_reports_only_changed_keys_by_category():
+    old = {'title': 'A', 'x_min': '0', 'axis_font_size': 10}
+    new = {'title': 'B', 'x_min': '0', 'axis_font_size': 12, 'y_max': '5'}
+    assert diff_settings('axis_details', old, new) == {
+        DECORATION: {'title': ('A', 'B')},
+        STYLE: {'axis_font_size': (10, 12)},
+        GEOMETRY: {'y_max': (None, '5')},
+    }
+    assert diff_settings('axis_details', old, dict(old)) == {}
+
+
+def test_update_emits_one_signal_per_changed_category():
+    config = PlotConfig()
+    config.update(plot_details={'x_axis_col': '1', 'line_style': '-'}, axis_details={'title': 'A'})
+
+    received = []
+    for name in ('data_changed', 'style_changed', 'geometry_changed', 'decoration_changed'):
+        getattr(config, name).connect(lambda changes, name=name: received.append((name, changes)))
+
+    changes = config.update(axis_details={'title': 'B', 'x_min': '1'})
+    assert set(changes) == {DECORATION, GEOMETRY}
+    assert received == [('geometry_changed', {'x_min': (None, '1')}), ('decoration_changed', {'title': ('A', 'B')})]
+
+    received.clear()
+    assert config.update(axis_details={'title': 'B', 'x_min': '1'}) == {}
+    assert received == []
+
+
+def test_data_files_and_plot_type_changes():
+    config = PlotConfig()
+    changes = config.update(data_files=['a.txt'], is_3d=True)
+    assert changes == {DATA: {'data_files': ([], ['a.txt'])}, STYLE: {'is_3d': (False, True)}}
@@ -0,0 +1,61 @@
+# tests/test_plotting.py
+
+import numpy as np
+import pytest
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.colors import to_hex
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from plots.plotting import render_datasets, PlotDataset
+
+PLOT_DETAILS = {'line_style': 'Solid', 'point_style': 'None', 'line_thickness': '1', 'scale_type': 'Linear'}
+AXIS_DETAILS = {'title': 'Test'}
+PLOT_VISUALS = {'plot_type': 'Line', 'plot_style': 'default', 'apply_legends': True}
+
+
+def make_figure():
+    figure = Figure(figsize=(6, 4))
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def dataset(name, offset, n=50):
+    x = np.linspace(0.0, 1.0, n)
+    return PlotDataset(name, name, x, x + offset)
+
+
+def drawn_lines(figure):
+    ax = figure.axes[0]
+    return [(line.get_label(), to_hex(line.get_color()), tuple(line.get_ydata()[:2])) for line in ax.lines]
+
+
+def legend_labels(figure):
+    return [text.get_text() for text in figure.axes[0].get_legend().get_texts()]
+
+
+def test_incremental_update_matches_a_full_render_after_removal_and_insertion():
+    a, b, c, d = (dataset(name, i) for i, name in enumerate("abcd"))
+    figure = make_figure()
+    render_datasets(figure, [a, b, c], PLOT_DETAILS, AXIS_DETAILS, PLOT_VISUALS, redraw=False)
+    registry = figure.artist_registry
+    kept_line = registry.get('a')['artist']
+
+    render_datasets(figure, [d, a, c], PLOT_DETAILS, AXIS_DETAILS, PLOT_VISUALS, redraw=False)
+    assert figure.artist_registry is registry and registry.get('a')['artist'] is kept_line  # Updated in place
+
+    fresh = make_figure()
+    render_datasets(fresh, [d, a, c], PLOT_DETAILS, AXIS_DETAILS, PLOT_VISUALS, redraw=False)
+    assert drawn_lines(figure) == drawn_lines(fresh)
+    assert legend_labels(figure) == legend_labels(fresh) == ['d', 'a', 'c']
+
+
+def test_unchanged_datasets_keep_their_artists():
+    datasets = [dataset("a", 0), dataset("b", 1)]
+    figure = make_figure()
+    render_datasets(figure, datasets, PLOT_DETAILS, AXIS_DETAILS, PLOT_VISUALS, redraw=False)
+    lines = list(figure.axes[0].lines)
+    render_datasets(figure, datasets, PLOT_DETAILS, {'title': 'Other'}, PLOT_VISUALS, redraw=False)
+    assert list(figure.axes[0].lines) == lines
+    assert figure.axes[0].get_title() == 'Other'
@@ -0,0 +1,114 @@
+# tests/test_reference_store.py
+
+import os
+
+import numpy as np
+import pytest
+
+from utils import clear_dataset_cache, DataReadError
+from processing.reference_store import ReferenceStore
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_dataset_cache()
+    yield
+    clear_dataset_cache()
+
+
+def write_reference(path, rows="1\t10\n2\t20\n3\t30\n"):
+    path.write_text("x\ty\n" + rows)
+    return str(path)
+
+
+def touch(file_path, seconds):
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_reference_is_loaded_once(tmp_path):
+    file_path = write_reference(tmp_path / "dark.txt")
+    store = ReferenceStore()
+
+    reference = store.get(file_path)
+    assert store.get(file_path) is reference
+    assert reference.path == os.path.abspath(file_path)
+    np.testing.assert_array_equal(reference.x, [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(reference.y, [10.0, 20.0, 30.0])
+
+
+def test_rows_with_missing_values_are_dropped(tmp_path):
+    file_path = write_reference(tmp_path / "dark.txt", "1\t10\n2\t\n3\t30\n")
+    reference = ReferenceStore().get(file_path)
+    np.testing.assert_array_equal(reference.x, [1.0, 3.0])
+
+
+def test_changed_file_is_reloaded_and_its_grids_rebuilt(tmp_path):
+    file_path = write_reference(tmp_path / "dark.txt")
+    store = ReferenceStore()
+    reference = store.get(file_path)
+    grid = store.grid(reference)
+
+    write_reference(tmp_path / "dark.txt", "1\t11\n2\t21\n3\t31\n")
+    touch(file_path, 5)
+    reloaded = store.get(file_path)
+
+    assert reloaded is not reference
+    np.testing.assert_array_equal(reloaded.y, [11.0, 21.0, 31.0])
+    assert store.grid(reloaded) is not grid
+    assert len(store._entries) == 1  # The stale version is dropped
+
+
+def test_invalidate_drops_the_reference_and_its_grids(tmp_path):
+    dark = write_reference(tmp_path / "dark.txt")
+    blank = write_reference(tmp_path / "blank.txt")
+    store = ReferenceStore()
+    dark_reference, blank_reference = store.get(dark), store.get(blank)
+    dark_grid, blank_grid = store.grid(dark_reference), store.grid(blank_reference)
+
+    store.invalidate(dark)
+
+    assert store.get(dark) is not dark_reference
+    assert store.grid(dark_reference) is not dark_grid
+    assert store.get(blank) is blank_reference
+    assert store.grid(blank_reference) is blank_grid
+
+
+def test_invalidate_without_a_path_drops_everything(tmp_path):
+    file_path = write_reference(tmp_path / "dark.txt")
+    store = ReferenceStore()
+    reference = store.get(file_path)
+    grid = store.grid(reference, 'uniform', 0.5)
+
+    store.invalidate()
+
+    assert store.get(file_path) is not reference
+    assert store.grid(reference, 'uniform', 0.5) is not grid
+
+
+def test_columns_are_separate_references(tmp_path):
+    file_path = str(tmp_path / "dark.txt")
+    (tmp_path / "dark.txt").write_text("a\tb\tc\n1\t2\t3\n4\t5\t6\n")
+    store = ReferenceStore()
+
+    np.testing.assert_array_equal(store.get(file_path, ['a', 'b']).y, [2.0, 5.0])
+    np.testing.assert_array_equal(store.get(file_path, ['a', 'c']).y, [3.0, 6.0])
+
+
+def test_least_recently_used_reference_is_evicted(tmp_path):
+    paths = [write_reference(tmp_path / f"ref{i}.txt") for i in range(3)]
+    store = ReferenceStore(max_entries=2)
+    first = store.get(paths[0])
+    store.get(paths[1])
+    store.get(paths[2])
+    assert store.get(paths[0]) is not first
+
+
+def test_missing_and_empty_references_are_reported(tmp_path):
+    empty = write_reference(tmp_path / "empty.txt", "a\tb\n")
+    store = ReferenceStore()
+
+    with pytest.raises(DataReadError, match="not found"):
+        store.get(str(tmp_path / "missing.txt"))
+    errors = store.preload([str(tmp_path / "missing.txt"), empty, write_reference(tmp_path / "ok.txt")])
+    assert [os.path.basename(path) for path, message in errors] == ["missing.txt", "empty.txt"]
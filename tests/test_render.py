@@ -0,0 +1,84 @@
+# tests/test_render.py
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from plots.render import load_batch_config, merge_config, render_figure
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_data(path, offset=0.0):
+    x = np.linspace(0.0, 1.0, 200)
+    path.write_text("x\ty\n" + "".join(f"{a}\t{b}\n" for a, b in zip(x, x + offset)))
+    return path.name
+
+
+def run_cli(*args):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, MPLBACKEND='Agg')
+    return subprocess.run([sys.executable, '-m', 'plots.render', *args], cwd=REPO_ROOT, env=env,
+                          capture_output=True, text=True, timeout=120)
+
+
+def test_defaults_are_merged_section_by_section():
+    merged = merge_config(
+        {'plot_details': {'line_style': 'Solid', 'x_axis_col': '1'}, 'dpi': 100},
+        {'plot_details': {'x_axis_col': '2'}, 'dpi': 200}
+    )
+    assert merged == {'plot_details': {'line_style': 'Solid', 'x_axis_col': '2'}, 'dpi': 200}
+
+
+def test_paths_are_resolved_against_the_config(tmp_path):
+    config_path = tmp_path / "batch.json"
+    config_path.write_text(json.dumps({'figures': [{'files': ["run1.txt"]}, {'files': [], 'output': "b.png"}]}))
+    configs = load_batch_config(str(config_path), output_dir=str(tmp_path / "out"))
+
+    assert configs[0]['files'] == [str(tmp_path / "run1.txt")]
+    assert configs[0]['output'] == str(tmp_path / "out" / "run1.png")
+    assert configs[1]['output'] == str(tmp_path / "out" / "b.png")
+
+
+def test_a_figure_without_readable_files_reports_an_error(tmp_path):
+    result = render_figure({'files': [str(tmp_path / "missing.txt")], 'output': str(tmp_path / "a.png")})
+    assert result['error'] == "None of the files could be loaded."
+    assert len(result['warnings']) == 1
+    assert not (tmp_path / "a.png").exists()
+
+
+def test_cli_renders_a_batch_across_workers(tmp_path):
+    names = [write_data(tmp_path / f"run{i}.txt", i) for i in range(3)]
+    config = {
+        'defaults': {'plot_visuals': {'plot_type': 'Line'}, 'size': [4, 3], 'dpi': 50},
+        'figures': [{'files': [name]} for name in names] + [{'files': names, 'output': "all.png"}],
+    }
+    (tmp_path / "batch.json").write_text(json.dumps(config))
+
+    completed = run_cli(str(tmp_path / "batch.json"), '--workers', '2', '--output-dir', str(tmp_path / "out"))
+
+    assert completed.returncode == 0, completed.stderr
+    assert "Rendered 4 of 4 figure(s)" in completed.stdout
+    for name in ["run0.png", "run1.png", "run2.png", "all.png"]:
+        assert (tmp_path / "out" / name).read_bytes().startswith(b'\x89PNG')
+
+
+def test_cli_exits_with_an_error_when_a_figure_fails(tmp_path):
+    name = write_data(tmp_path / "run.txt")
+    (tmp_path / "batch.json").write_text(json.dumps([{'files': [name]}, {'files': ["missing.txt"]}]))
+
+    completed = run_cli(str(tmp_path / "batch.json"), '--workers', '1')
+
+    assert completed.returncode == 1
+    assert "FAILED: None of the files could be loaded." in completed.stdout
+    assert "Rendered 1 of 2 figure(s)" in completed.stdout
+    assert (tmp_path / "run.png").exists()
+
+
+def test_cli_rejects_an_unreadable_config(tmp_path):
+    (tmp_path / "batch.json").write_text("{not json")
+    completed = run_cli(str(tmp_path / "batch.json"))
+    assert completed.returncode == 2
+    assert "Error reading" in completed.stderr
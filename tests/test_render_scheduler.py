@@ -0,0 +1,93 @@
+# tests/test_render_scheduler.py
+
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QWidget
+
+from gui.plot.render_scheduler import RenderScheduler
+from gui.plot.plot_config import GEOMETRY
+from gui.plot.plot_tab_mixin import PlotTabMixin
+from gui.utils.jobs import JobRunner
+from conftest import wait_until
+
+
+class Canvas:
+    def __init__(self):
+        self.draws = 0
+
+    def draw_idle(self):
+        self.draws += 1
+
+
+def test_requests_within_the_window_are_coalesced(qapp):
+    scheduler = RenderScheduler(delay_ms=20)
+    first, second = Canvas(), Canvas()
+    renders = []
+    for i in range(5):
+        scheduler.request(first, lambda i=i: renders.append(('first', i)))
+    scheduler.request(second)
+
+    flushed = []
+    scheduler.flushed.connect(flushed.append)
+    assert wait_until(qapp, lambda: flushed)
+    # One render per canvas, with the latest callback
+    assert renders == [('first', 4)] and second.draws == 1
+    assert flushed[-1] == {'requested': 6, 'rendered': 2, 'skipped': 4}
+
+
+def test_cancelled_requests_are_not_rendered(qapp):
+    scheduler = RenderScheduler(delay_ms=20)
+    canvas = Canvas()
+    scheduler.request(canvas)
+    scheduler.cancel(canvas)
+    scheduler.flush()
+    assert canvas.draws == 0 and scheduler.stats()['skipped'] == 1
+
+
+class Tab(QWidget, PlotTabMixin):
+    """The state PlotTabMixin needs, with rendering reduced to a list of renders."""
+
+    plot_updated = pyqtSignal()
+
+    def __init__(self, scheduler):
+        super().__init__()
+        self.canvas = Canvas()
+        self.render_scheduler = scheduler
+        self.job_runner = JobRunner(self)
+        self.pending_plot_changes = set()
+        self.datasets = []
+        self.rendered = []
+
+    def plot_axes(self):
+        return None  # Every update is a full render
+
+    def render_plot(self):
+        self.rendered.append(True)
+
+
+def test_changes_made_during_a_cancelled_reload_are_still_rendered(qapp):
+    tab = Tab(RenderScheduler(delay_ms=5))
+    started = threading.Event()
+
+    def slow_reload(job):
+        started.set()
+        while True:
+            job.check_cancelled()
+            threading.Event().wait(0.001)
+
+    job = tab.job_runner.start(slow_reload, lambda result: None)
+    job.signals.finished.connect(tab.on_plot_reload_finished)
+    assert started.wait(5)
+    tab.schedule_plot_update(GEOMETRY)
+    qapp.processEvents()
+    wait_until(qapp, lambda: not tab.render_scheduler.pending, timeout=0.5)
+    assert tab.rendered == [] and tab.pending_plot_changes == {GEOMETRY}  # Held while the reload runs
+
+    tab.job_runner.cancel()
+    assert wait_until(qapp, lambda: tab.rendered)
+    assert tab.pending_plot_changes == set()
@@ -0,0 +1,61 @@
+# tests/test_tiled_export.py
+
+import numpy as np
+import pytest
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from plots.tiled_export import save_tiled, image_size
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def make_figure(width_in=4.13, height_in=3.07):
+    figure = Figure(figsize=(width_in, height_in))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    x = np.linspace(0, 10, 500)
+    ax.plot(x, np.sin(x), label="sin")
+    ax.fill_between(x, np.cos(x), alpha=0.3)
+    ax.set_title("Tiled export")
+    ax.legend()
+    return figure
+
+
+def read_image(path):
+    return np.asarray(Image.open(path).convert('RGBA')).astype(int)
+
+
+@pytest.mark.parametrize("extension", ['png', 'tif'])
+def test_tiled_image_matches_savefig(tmp_path, extension):
+    figure = make_figure()
+    dpi = 100
+    tiled_path = str(tmp_path / f"tiled.{extension}")
+    direct_path = str(tmp_path / "direct.png")
+
+    # Bands of 37 rows, so band edges cross the axes, the text and the legend
+    width, height = image_size(figure, dpi)
+    assert save_tiled(figure, tiled_path, dpi, band_bytes=width * 4 * 37)
+    figure.savefig(direct_path, dpi=dpi)
+
+    tiled = read_image(tiled_path)
+    direct = read_image(direct_path)
+    assert tiled.shape == direct.shape == (height, width, 4)
+    # Antialiasing can differ by a level or two where a band edge cuts an artist
+    assert np.abs(tiled - direct).mean() < 0.25
+    assert np.mean(np.any(tiled != direct, axis=-1)) < 0.03
+
+
+def test_png_and_tiff_hold_the_same_pixels(tmp_path):
+    figure = make_figure()
+    save_tiled(figure, str(tmp_path / "a.png"), 80, band_bytes=64 * 1024)
+    save_tiled(figure, str(tmp_path / "a.tiff"), 80, band_bytes=64 * 1024)
+    np.testing.assert_array_equal(read_image(tmp_path / "a.png"), read_image(tmp_path / "a.tiff"))
+
+
+def test_cancelled_export_leaves_no_file(tmp_path):
+    path = tmp_path / "cancelled.png"
+    assert not save_tiled(make_figure(), str(path), 100, band_bytes=64 * 1024, is_cancelled=lambda: True)
+    assert not path.exists()
@@ -0,0 +1,129 @@
+# tests/test_utils.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import (load_numeric_data, clear_dataset_cache, get_dataset_cache, configure_sidecar_cache,
+                   is_memory_mapped, resident_bytes, write_sidecar, load_sidecar, DatasetCache, DataReadError)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_dataset_cache()
+    yield
+    clear_dataset_cache()
+
+
+def write_file(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_projection_keeps_the_same_rows_with_or_without_a_cached_full_parse(tmp_path):
+    # Row 2 is empty in the projected columns, row 3 only in some of them
+    file_path = write_file(tmp_path / "data.txt", "a\tb\tc\n1\t2\t3\n4\t\t\n\t\t7\n8\t9\t10\n")
+
+    direct = load_numeric_data(file_path, columns=['b', 'c'], use_cache=False)
+    load_numeric_data(file_path)  # Full parse, cached
+    from_full = load_numeric_data(file_path, columns=['b', 'c'])
+
+    pd.testing.assert_frame_equal(direct, from_full)
+    assert list(direct.index) == [0, 2, 3]
+
+
+def test_cache_serves_unchanged_files(tmp_path):
+    file_path = write_file(tmp_path / "data.txt", "x\ty\n1\t2\n3\t4\n")
+    cache = get_dataset_cache()
+    first = load_numeric_data(file_path)
+    hits = cache.hits
+    assert load_numeric_data(file_path) is first
+    assert cache.hits == hits + 1
+
+
+def test_cache_reloads_a_file_whose_size_changed(tmp_path):
+    file_path = write_file(tmp_path / "data.txt", "x\ty\n1\t2\n3\t4\n")
+    load_numeric_data(file_path)
+    write_file(tmp_path / "data.txt", "x\ty\n1\t2\n3\t4\n5\t6\n")
+
+    df = load_numeric_data(file_path)
+    assert df.shape == (3, 2)
+    assert len(get_dataset_cache()._keys_by_path[os.path.abspath(file_path)]) == 1  # The stale entry was dropped
+
+
+def test_cache_reloads_a_file_whose_mtime_changed(tmp_path):
+    file_path = write_file(tmp_path / "data.txt", "x\ty\n1\t2\n3\t4\n")
+    load_numeric_data(file_path)
+    write_file(tmp_path / "data.txt", "x\ty\n1\t2\n3\t9\n")  # Same size
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    df = load_numeric_data(file_path)
+    assert df.iloc[-1, 1] == 9
+
+
+def test_invalidate_drops_every_entry_of_a_file(tmp_path):
+    file_path = write_file(tmp_path / "data.txt", "x\ty\tz\n1\t2\t3\n4\t5\t6\n")
+    load_numeric_data(file_path)
+    load_numeric_data(file_path, columns=[0, 2])
+    cache = get_dataset_cache()
+
+    clear_dataset_cache(file_path)
+    assert cache.current_bytes == 0
+    assert os.path.abspath(file_path) not in cache._keys_by_path
+
+
+def test_cache_evicts_the_least_recently_used_entry():
+    cache = DatasetCache()
+    df = pd.DataFrame({'x': np.arange(100.0), 'y': np.arange(100.0)})
+    cache.max_bytes = int(df.memory_usage(index=True, deep=True).sum()) * 2
+    for name in ('a', 'b', 'c'):
+        cache.put((name, 0, 0), df)
+    assert cache.get(('a', 0, 0)) is None
+    assert cache.get(('c', 0, 0)) is df
+
+
+def test_missing_file_is_reported_as_not_opened(tmp_path):
+    with pytest.raises(DataReadError, match="could not be opened"):
+        load_numeric_data(str(tmp_path / "missing.txt"))
+
+
+def test_memory_mapped_sidecar_columns_are_not_charged_to_the_cache(tmp_path):
+    file_path = str(tmp_path / "data.txt")
+    np.savetxt(file_path, np.random.default_rng(0).random((1000, 3)), delimiter='\t')
+    configure_sidecar_cache(enabled=True, directory=str(tmp_path / "sidecars"))
+    try:
+        parsed = load_numeric_data(file_path, use_cache=False)  # Writes the sidecar
+        mapped = load_numeric_data(file_path)
+    finally:
+        configure_sidecar_cache(enabled=False)
+
+    pd.testing.assert_frame_equal(parsed, mapped)
+    assert is_memory_mapped(mapped.iloc[:, 0].values)
+    assert get_dataset_cache().current_bytes == resident_bytes(mapped) < mapped.memory_usage(index=True).sum()
+
+
+def test_concurrent_sidecar_writers_publish_a_valid_sidecar(tmp_path):
+    file_path = str(tmp_path / "data.txt")
+    np.savetxt(file_path, np.arange(30000.0).reshape(-1, 3), delimiter='\t')
+    df = load_numeric_data(file_path, use_cache=False)
+    directory = str(tmp_path / "sidecars")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        written = list(pool.map(lambda _: write_sidecar(file_path, df, '\t', 100, directory=directory), range(16)))
+
+    assert all(written)
+    pd.testing.assert_frame_equal(load_sidecar(file_path, '\t', 100, directory=directory), df)
+    assert not [name for name in os.listdir(directory) if name.endswith('.tmp')]
+
+
+def test_failed_sidecar_write_is_logged_and_leaves_no_file(tmp_path, caplog):
+    file_path = write_file(tmp_path / "data.txt", "x\ty\n1\t2\n3\t4\n")
+    df = load_numeric_data(file_path, use_cache=False)
+    blocker = write_file(tmp_path / "not_a_directory", "")
+
+    assert not write_sidecar(file_path, df, '\t', 100, directory=blocker)
+    assert "Could not write sidecar" in caplog.text
@@ -0,0 +1,79 @@
+# tests/test_waterfall.py
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+from plots.plotting import PlotDataset
+from plots.bulk_overlay import MAX_LABELLED_SERIES
+from plots.waterfall import stack_series, draw_waterfall, cycle_colors
+
+
+def make_axes():
+    figure = Figure(figsize=(6, 4))
+    FigureCanvasAgg(figure)
+    return figure, figure.add_subplot(111, projection='3d')
+
+
+def make_datasets(count, n=500, shared_x=True):
+    datasets = []
+    for i in range(count):
+        x = np.linspace(0.0, 10.0, n) if shared_x else np.linspace(0.0, 10.0 + i, n + i)
+        datasets.append(PlotDataset(f"file{i}", f"file{i}", x, np.cos(x) * (i + 1)))
+    return datasets
+
+
+def test_shared_x_is_stacked_into_one_array():
+    datasets = make_datasets(4)
+    segments = stack_series(datasets)
+
+    assert isinstance(segments, np.ndarray) and segments.shape == (4, 500, 3)
+    np.testing.assert_array_equal(segments[2, :, 0], datasets[2].x)
+    assert np.all(segments[2, :, 1] == 2)
+    np.testing.assert_array_equal(segments[2, :, 2], datasets[2].y)
+
+
+def test_different_x_gives_one_polyline_per_series():
+    datasets = make_datasets(3, shared_x=False)
+    segments = stack_series(datasets)
+
+    assert [len(segment) for segment in segments] == [500, 501, 502]
+    assert np.all(segments[1][:, 1] == 1)
+
+
+def test_waterfall_is_one_collection_with_legend_proxies():
+    figure, ax = make_axes()
+    datasets = make_datasets(3)
+    collection = draw_waterfall(ax, datasets)
+
+    assert isinstance(collection, Line3DCollection) and list(ax.collections) == [collection]
+    assert [line.get_label() for line in ax.lines] == ["file0", "file1", "file2"]
+    assert all(len(line.get_xdata()) == 0 for line in ax.lines)
+    assert [line.get_color() for line in ax.lines] == cycle_colors(3)
+    low, high = ax.get_ylim()
+    assert low <= 0.0 and 2.0 <= high < 3.0  # The offsets set the data limits despite add_collection3d
+
+
+def test_many_series_share_one_legend_entry():
+    figure, ax = make_axes()
+    collection = draw_waterfall(ax, make_datasets(MAX_LABELLED_SERIES + 1))
+    assert not ax.lines
+    assert collection.get_label() == f"{MAX_LABELLED_SERIES + 1} series"
+
+
+def test_decimated_series_fit_the_point_budget():
+    figure, ax = make_axes()
+    datasets = make_datasets(2, n=100_000)
+    datasets[0].y[54_321] = 1e3
+    segments = stack_series(datasets, decimate=True, ax=ax, point_budget=1000)
+
+    assert all(len(segment) <= 1000 for segment in segments)
+    assert segments[0][:, 2].max() == 1e3
+
+
+def test_nothing_is_drawn_without_datasets():
+    figure, ax = make_axes()
+    assert draw_waterfall(ax, []) is None
@@ -1,90 +1,533 @@
 # utils.py
 import pandas as pd
+import numpy as np
 import csv
+import hashlib
+import itertools
+import json
+import logging
 import os
-from PyQt5.QtWidgets import QMessageBox
+import tempfile
+import threading
+from collections import OrderedDict
 
-def read_numeric_data(file_path, parent=None, delimiter='\t', max_lines=100):
+logger = logging.getLogger(__name__)
+
+# Default memory budget of the shared dataset cache (512 MB)
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+# Binary sidecar files written next to (or on behalf of) parsed text files
+SIDECAR_SUFFIX = '.dwcache'
+SIDECAR_VERSION = 1
+
+# Sidecars are opt-in, see configure_sidecar_cache
+_sidecar_settings = {
+    'enabled': False,
+    'directory': None,   # None writes the sidecar next to the source file
+    'dtype': 'float64',  # 'float64' or 'float32'
+    'min_file_size': 0,  # Only files at least this large (in bytes) get a sidecar
+}
+
+
+class DatasetCache:
+    """
+    Process-wide LRU cache of parsed datasets.
+
+    Entries are keyed by (absolute path, mtime, size, delimiter, max_lines), so a file
+    that changes on disk produces a new key and its stale entries are dropped. Eviction
+    is driven by the real memory footprint of each cached DataFrame; columns memory-mapped
+    from a sidecar are paged in and out by the OS and do not count against the budget.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (df, nbytes)
+        self._keys_by_path = {}  # absolute path -> set of keys
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(file_path, *options):
+        """Build a cache key for the file as it currently is on disk, or None if it cannot be stat'ed."""
+        abs_path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(abs_path)
+        except OSError:
+            return None
+        return (abs_path, stat.st_mtime_ns, stat.st_size) + tuple(options)
+
+    def get(self, key):
+        with self._lock:
+            self._drop_stale(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, df):
+        nbytes = resident_bytes(df)
+        with self._lock:
+            self._drop_stale(key)
+            self._remove(key)
+            if nbytes > self.max_bytes:
+                return  # Larger than the whole budget, never cache it
+            self._entries[key] = (df, nbytes)
+            self._keys_by_path.setdefault(key[0], set()).add(key)
+            self.current_bytes += nbytes
+            self._evict()
+
+    def invalidate(self, file_path=None):
+        """Drop every entry for file_path, or the whole cache when no path is given."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self._keys_by_path.clear()
+                self.current_bytes = 0
+                return
+            for key in list(self._keys_by_path.get(os.path.abspath(file_path), ())):
+                self._remove(key)
+
+    def set_max_bytes(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _drop_stale(self, key):
+        # Any entry for the same path whose mtime/size differ belongs to an older version of the file
+        for other in list(self._keys_by_path.get(key[0], ())):
+            if other[1:3] != key[1:3]:
+                self._remove(other)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.current_bytes -= entry[1]
+        keys = self._keys_by_path.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_path[key[0]]
+
+    def _evict(self):
+        while self.current_bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+
+def is_memory_mapped(array):
+    """Whether array is a view of a memory-mapped file (e.g. a column of a loaded sidecar)."""
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = getattr(array, 'base', None)
+    return False
+
+
+def resident_bytes(df):
+    """Memory held by df in RAM: its index and every column that is not memory-mapped."""
+    usage = df.memory_usage(index=True, deep=True)
+    nbytes = int(usage.iloc[0])
+    for i in range(df.shape[1]):
+        if not is_memory_mapped(df.iloc[:, i].values):
+            nbytes += int(usage.iloc[i + 1])
+    return nbytes
+
+
+_dataset_cache = DatasetCache()
+
+
+def get_dataset_cache():
+    """Return the shared dataset cache used by read_numeric_data."""
+    return _dataset_cache
+
+
+def set_dataset_cache_budget(max_bytes):
+    """Change the memory budget (in bytes) of the shared dataset cache, evicting as needed."""
+    _dataset_cache.set_max_bytes(max_bytes)
+
+
+def clear_dataset_cache(file_path=None):
+    """Forget the cached parse of file_path, or of every file when no path is given."""
+    _dataset_cache.invalidate(file_path)
+
+
+class DataReadError(Exception):
+    """Raised by load_numeric_data when a file cannot be turned into numeric data."""
+
+
+def read_numeric_data(file_path, parent=None, delimiter='\t', max_lines=100, use_cache=True, use_sidecar=None,
+                      columns=None):
     """
     Reads a CSV or text file, skips metadata, detects headers and numeric data dynamically.
     Tries multiple delimiters if necessary.
 
+    Parsed files are kept in a shared LRU cache (see DatasetCache), so repeated reads of an
+    unchanged file do not touch the disk again. The returned DataFrame is shared with the
+    cache and must be treated as read-only; copy it before modifying it in place.
+
+    When binary sidecars are enabled (see configure_sidecar_cache), a parsed file is also
+    written as raw columns plus a JSON header, and later loads memory-map that sidecar
+    instead of parsing the text again.
+
     Parameters:
         file_path (str): Path to the CSV file.
         parent (QWidget): Parent widget for QMessageBox.
         delimiter (str): Delimiter used in the file (default is tab).
         max_lines (int): Maximum number of lines to search for numeric data.
+        use_cache (bool): Whether to serve and store the result through the dataset cache.
+        use_sidecar (bool): Whether to read/write a binary sidecar. None uses the global setting.
+        columns (list): Optional column projection, as 0-based indices or column names. Only
+                        these columns are parsed and returned, in the given order.
 
     Returns:
         tuple: (df, x, y) where df is the cleaned DataFrame, and x, y are numpy arrays.
                Returns (None, None, None) if reading fails.
     """
-    # List of delimiters to try
-    delimiters = [delimiter, ',', ';'] if delimiter == '\t' else [delimiter]
+    try:
+        df = load_numeric_data(file_path, delimiter, max_lines, use_cache, use_sidecar, columns)
+    except DataReadError as e:
+        error_msg = str(e)
+        if parent:
+            from PyQt5.QtWidgets import QMessageBox  # Imported here so headless rendering does not need Qt
+            QMessageBox.warning(parent, "Data Read Error", error_msg)
+        else:
+            print(f"Data Read Error: {error_msg}")
+        return None, None, None
+
+    # Extract X and Y columns
+    x = df.iloc[:, 0].values
+    y = df.iloc[:, 1].values
+    return df, x, y
+
+
+def load_numeric_data(file_path, delimiter='\t', max_lines=100, use_cache=True, use_sidecar=None, columns=None):
+    """
+    Same as read_numeric_data, but returns only the DataFrame and raises DataReadError
+    instead of reporting problems to the user. Safe to call from worker threads.
+    """
+    projection = tuple(columns) if columns is not None else None
+    if projection is not None and len(projection) < 2:
+        raise DataReadError("At least two columns must be selected.")
+
+    full_key = DatasetCache.make_key(file_path, delimiter, max_lines, None) if use_cache else None
+    cache_key = DatasetCache.make_key(file_path, delimiter, max_lines, projection) if use_cache else None
+    if cache_key is not None:
+        df = _dataset_cache.get(cache_key)
+        if df is None and projection is not None:
+            # A full parse of the same file can serve any projection
+            full_df = _dataset_cache.get(full_key)
+            if full_df is not None:
+                df = _project_columns(file_path, full_df, projection)
+        if df is not None:
+            return df
+
+    if use_sidecar is None:
+        use_sidecar = _sidecar_settings['enabled']
+
+    if use_sidecar:
+        # Sidecars always hold every column; projections are taken from the memory map
+        df = load_sidecar(file_path, delimiter, max_lines)
+        if df is None:
+            df = _parse_numeric_data(file_path, delimiter, max_lines)
+            if df is not None:
+                write_sidecar(file_path, df, delimiter, max_lines)
+        if df is not None and projection is not None:
+            df = _project_columns(file_path, df, projection)
+    else:
+        df = _parse_numeric_data(file_path, delimiter, max_lines, projection)
+
+    if df is None:
+        # If all delimiters failed
+        raise DataReadError("Could not detect numeric data with any of the specified delimiters.")
+
+    if cache_key is not None:
+        _dataset_cache.put(cache_key, df)
+    return df
+
+
+def get_selected_columns(plot_details):
+    """
+    Returns the 0-based [x, y] column projection chosen in the plot details.
+
+    Empty entries fall back to the first and second column. Raises ValueError if an entry
+    is not a positive integer.
+    """
+    x_col = int(plot_details.get('x_axis_col') or 1) - 1
+    y_col = int(plot_details.get('y_axis_col') or 2) - 1
+    if x_col < 0 or y_col < 0:
+        raise ValueError("Column numbers start at 1.")
+    return [x_col, y_col]
+
+
+def _resolve_columns(file_path, names, projection):
+    """Map a projection of indices and/or names onto column positions."""
+    indices = []
+    for column in projection:
+        if isinstance(column, str):
+            if column not in names:
+                raise DataReadError(f"Selected columns do not exist in {file_path}.")
+            indices.append(names.index(column))
+        else:
+            if not 0 <= int(column) < len(names):
+                raise DataReadError(f"Selected columns do not exist in {file_path}.")
+            indices.append(int(column))
+    return indices
+
+
+def _project_columns(file_path, df, projection):
+    """
+    Selects the projected columns of a full parse. Rows where all selected values are NaN are
+    dropped, as a direct parse of the projection does; without such rows no copy is made.
+    """
+    projected = df.iloc[:, _resolve_columns(file_path, [str(col) for col in df.columns], projection)]
+    has_values = projected.notna().any(axis=1).values
+    if has_values.all():
+        return projected
+    return projected[has_values]
+
+
+def configure_sidecar_cache(enabled=True, directory=None, dtype='float64', min_file_size=0):
+    """
+    Enables or disables binary sidecars for read_numeric_data.
 
+    Parameters:
+        enabled (bool): Whether parsed files are written to and loaded from sidecars.
+        directory (str): Cache directory for sidecars. None writes them next to the source file.
+        dtype (str): 'float64' or 'float32' storage for the columns.
+        min_file_size (int): Source files smaller than this many bytes never get a sidecar.
+    """
+    if np.dtype(dtype) not in (np.dtype('float64'), np.dtype('float32')):
+        raise ValueError(f"Unsupported sidecar dtype: {dtype}")
+    _sidecar_settings.update({
+        'enabled': enabled,
+        'directory': directory,
+        'dtype': np.dtype(dtype).name,
+        'min_file_size': min_file_size,
+    })
+
+
+def sidecar_paths(file_path, directory=None):
+    """
+    Returns the (data_path, header_path) of the sidecar belonging to file_path.
+
+    Next to the source the sidecar is "<file><suffix>"; in a cache directory the name is
+    prefixed with a hash of the absolute path so files with the same name do not collide.
+    """
+    abs_path = os.path.abspath(file_path)
+    if directory is None:
+        data_path = abs_path + SIDECAR_SUFFIX
+    else:
+        digest = hashlib.sha1(abs_path.encode('utf-8')).hexdigest()[:16]
+        data_path = os.path.join(directory, f"{digest}_{os.path.basename(abs_path)}{SIDECAR_SUFFIX}")
+    return data_path, data_path + '.json'
+
+
+def write_sidecar(file_path, df, delimiter, max_lines, directory=None, dtype=None):
+    """
+    Writes df as a columnar binary sidecar of file_path.
+
+    The data file holds the columns back to back (column-major) as raw float64/float32
+    values; the JSON header records the column names, shape, dtype and the mtime/size of
+    the source so a stale sidecar is never used.
+
+    Returns:
+        bool: True if the sidecar was written.
+    """
+    directory = directory if directory is not None else _sidecar_settings['directory']
+    dtype = np.dtype(dtype or _sidecar_settings['dtype'])
+    try:
+        stat = os.stat(file_path)
+        if stat.st_size < _sidecar_settings['min_file_size'] or df.shape[0] == 0:
+            return False
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        data_path, header_path = sidecar_paths(file_path, directory)
+
+        # Write to private temporary files first, so a half-written sidecar is never picked up
+        # and concurrent writers of the same sidecar do not write into each other's files
+        def write_columns(f):
+            for column in df.columns:
+                np.asarray(df[column].values, dtype=dtype).tofile(f)
+
+        data_tmp = _write_temporary(data_path, 'wb', write_columns)
+        header = {
+            'version': SIDECAR_VERSION,
+            'source': os.path.abspath(file_path),
+            'source_mtime_ns': stat.st_mtime_ns,
+            'source_size': stat.st_size,
+            'delimiter': delimiter,
+            'max_lines': max_lines,
+            'columns': [str(col) for col in df.columns],
+            'rows': int(df.shape[0]),
+            'dtype': dtype.name,
+        }
+        try:
+            header_tmp = _write_temporary(header_path, 'w', lambda f: json.dump(header, f))
+        except Exception:
+            os.remove(data_tmp)
+            raise
+        os.replace(data_tmp, data_path)
+        os.replace(header_tmp, header_path)
+        return True
+    except Exception as e:
+        # A missing sidecar only costs a parse; the load itself goes on
+        logger.warning("Could not write sidecar for %s: %s", file_path, e)
+        return False
+
+
+def _write_temporary(path, mode, write):
+    """Writes a uniquely named temporary file next to path with write(f) and returns its path."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+    return tmp_path
+
+
+def load_sidecar(file_path, delimiter, max_lines, directory=None):
+    """
+    Memory-maps the sidecar of file_path if it exists and still matches the source.
+
+    The returned DataFrame wraps the read-only memory map without copying, so only the
+    pages that are actually used get read from disk.
+
+    Returns:
+        pd.DataFrame or None: None when there is no valid sidecar.
+    """
+    directory = directory if directory is not None else _sidecar_settings['directory']
+    data_path, header_path = sidecar_paths(file_path, directory)
+    try:
+        with open(header_path, 'r') as f:
+            header = json.load(f)
+        stat = os.stat(file_path)
+        if (header.get('version') != SIDECAR_VERSION
+                or header['source_mtime_ns'] != stat.st_mtime_ns
+                or header['source_size'] != stat.st_size
+                or header['delimiter'] != delimiter
+                or header['max_lines'] != max_lines):
+            return None
+        columns = header['columns']
+        mapped = np.memmap(data_path, dtype=header['dtype'], mode='r', shape=(len(columns), header['rows']))
+        # (columns, rows) in C order is the transposed (rows, columns) layout pandas keeps internally
+        return pd.DataFrame(mapped.T, columns=columns, copy=False)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def sniff_numeric_layout(file_path, delimiters, max_lines=100):
+    """
+    Reads only the first max_lines lines of a file once and, for every candidate delimiter,
+    locates the header row and the first numeric data row.
+
+    Parameters:
+        file_path (str): Path to the CSV file.
+        delimiters (list): Delimiters to try, in order of preference.
+        max_lines (int): Maximum number of lines to search for numeric data.
+
+    Returns:
+        list: (delimiter, column_names, data_row_index) tuples, one per delimiter that found
+              numeric data. column_names holds one name per field of the first data row, taken
+              from the header row when it matches, otherwise "Column N".
+    """
+    with open(file_path, 'r') as f:
+        lines = list(itertools.islice(f, max_lines))
+
+    layouts = []
     for delim in delimiters:
-        header_row_index = None
+        header_row = None
         data_row_index = None
 
-        try:
-            # Read all lines from the file
-            with open(file_path, 'r') as f:
-                lines = f.readlines()
-
-            # Iterate through the lines to find the header and data rows
-            for i, line in enumerate(lines):
-                if i >= max_lines:
-                    break
-
-                # Split the line using the current delimiter
-                row = line.strip().split(delim)
-                # Remove empty strings
-                row = [cell.strip() for cell in row if cell.strip()]
-
-                if not row:
-                    continue
-
-                if is_numeric_row(row):
-                    data_row_index = i
-                    break
-                else:
-                    header_row_index = i  # Potential header row
-
-            if data_row_index is None:
-                continue  # Try the next delimiter
+        # Iterate through the lines to find the header and data rows
+        for i, line in enumerate(lines):
+            # Split the line using the current delimiter and remove empty strings
+            row = [cell.strip() for cell in line.strip().split(delim) if cell.strip()]
+
+            if not row:
+                continue
+
+            if is_numeric_row(row):
+                data_row_index = i
+                break
+            else:
+                header_row = row  # Potential header row
 
-            # Prepare the list of rows to skip
-            skiprows = [i for i in range(data_row_index) if i != header_row_index]
+        if data_row_index is None:
+            continue
 
-            # Read the data
-            df = pd.read_csv(
-                file_path,
-                delimiter=delim,
-                skiprows=skiprows,
-                header=None,
-                engine='python'
-            )
+        # Number of fields the parser will see in the data rows
+        n_fields = len(lines[data_row_index].rstrip('\r\n').split(delim))
+        if header_row is not None and len(header_row) == n_fields:
+            layouts.append((delim, [str(col) for col in header_row], data_row_index))
+        else:
+            layouts.append((delim, [f"Column {i+1}" for i in range(n_fields)], data_row_index))
+    return layouts
 
-            if header_row_index is not None:
-                # Read the header line to get the column names
-                header_line = lines[header_row_index].strip()
-                columns = [cell.strip() for cell in header_line.split(delim) if cell.strip()]
 
-                # Ensure the number of columns matches
-                if len(columns) != df.shape[1]:
-                    columns = [f"Column {i+1}" for i in range(df.shape[1])]
+def _read_csv_fast(file_path, delim, data_row_index, usecols=None):
+    """Single full parse with the C engine, falling back to the Python engine if it fails."""
+    try:
+        return pd.read_csv(file_path, delimiter=delim, skiprows=data_row_index, header=None,
+                           usecols=usecols, engine='c')
+    except Exception:
+        return pd.read_csv(file_path, delimiter=delim, skiprows=data_row_index, header=None,
+                           usecols=usecols, engine='python')
+
+
+def _parse_numeric_data(file_path, delimiter, max_lines, projection=None):
+    """
+    Parse file_path into a numeric DataFrame, returning None when no delimiter works and
+    raising DataReadError when the file cannot be opened.
+
+    With a projection only the selected columns are materialized, using the sniffed header
+    to map column names to positions.
+    """
+    # List of delimiters to try
+    delimiters = [delimiter, ',', ';'] if delimiter == '\t' else [delimiter]
 
-                # Ensure columns are strings
-                columns = [str(col) for col in columns]
+    try:
+        layouts = sniff_numeric_layout(file_path, delimiters, max_lines)
+    except OSError as e:
+        # Missing, unreadable or not a regular file: not a question of delimiters
+        raise DataReadError(f"The file {file_path} could not be opened: {e.strerror or e}.") from e
+    except Exception:
+        return None
+
+    projection_error = None
+    for delim, names, data_row_index in layouts:
+        try:
+            if projection is not None:
+                try:
+                    indices = _resolve_columns(file_path, names, projection)
+                except DataReadError as e:
+                    projection_error = e
+                    continue  # Try the next delimiter
+                usecols = sorted(set(indices))
+            else:
+                usecols = None
 
-                # Assign the columns
-                df.columns = columns
+            # Read the data, skipping metadata and the header row
+            df = _read_csv_fast(file_path, delim, data_row_index, usecols)
+
+            if usecols is not None:
+                # Columns come back labelled by position; restore the requested order
+                df = df[indices]
+                df.columns = [names[i] for i in indices]
+            elif len(names) == df.shape[1]:
+                df.columns = names
             else:
-                # No header detected, assign default column names
                 df.columns = [f"Column {i+1}" for i in range(df.shape[1])]
 
-            # Convert all columns to numeric where possible
-            df = df.apply(pd.to_numeric, errors='coerce')
+            # Convert all columns to numeric where possible (as floats, like the text they came from)
+            df = df.apply(pd.to_numeric, errors='coerce').astype('float64')
 
             # Drop rows where all values are NaN
             df.dropna(how='all', inplace=True)
@@ -93,22 +536,15 @@ def read_numeric_data(file_path, parent=None, delimiter='\t', max_lines=100):
             if df.shape[1] < 2:
                 continue  # Try the next delimiter
 
-            # Extract X and Y columns
-            x = df.iloc[:, 0].values
-            y = df.iloc[:, 1].values
-
-            return df, x, y  # Successfully read the data
+            return df  # Successfully read the data
 
         except Exception as e:
             continue  # Try the next delimiter
 
-    # If all delimiters failed
-    error_msg = "Could not detect numeric data with any of the specified delimiters."
-    if parent:
-        QMessageBox.warning(parent, "Data Read Error", error_msg)
-    else:
-        print(f"Data Read Error: {error_msg}")
-    return None, None, None
+    if projection_error is not None:
+        raise projection_error
+    return None
+
 
 def is_numeric_row(row):
     """